@@ -0,0 +1,82 @@
+"""CPU time to build and serialize a 10k-item tool response through FastMCP.
+
+Run with ``uv sync --extra orjson`` and then
+``PYTHONPATH=src python benchmarks/serialization_overhead.py``. The "before" path
+converts every item with ``_to_jsonable`` and lets FastMCP serialize the text
+content with its default pydantic serializer and convert the structured content
+with ``to_jsonable_python``; the "after" path passes upstream dicts through,
+encodes the response once with the server's serializer and decodes the
+structured content from it, as the server does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, cast
+
+from fastmcp.tools import Tool
+from pydantic import BaseModel
+
+import scrapinghub_mcp.server as server
+from scrapinghub_mcp.serialization import default_serializer, returning_tool_results
+
+ITEM_COUNT = 10_000
+ROUNDS = 20
+
+
+def make_items() -> list[dict[str, Any]]:
+    return [
+        {
+            "_type": "Product",
+            "url": f"https://example.com/products/{index}",
+            "name": f"Product {index}",
+            "price": index * 1.25,
+            "in_stock": index % 3 != 0,
+            "tags": ["sale", "new"],
+            "offers": [{"seller": "acme", "price": index * 1.2}],
+        }
+        for index in range(ITEM_COUNT)
+    ]
+
+
+def make_tool(build: Callable[[Any], BaseModel], serializer: Callable[[Any], str] | None) -> Tool:
+    items = make_items()
+
+    def project_jobs_iter(params: server.JobsIterParams | None = None) -> server.ItemsResult:
+        return cast(server.ItemsResult, build(iter(items)))
+
+    if serializer is None:
+        return Tool.from_function(project_jobs_iter)
+    return Tool.from_function(returning_tool_results(project_jobs_iter, serializer))
+
+
+def build_before(result: Any) -> BaseModel:
+    items = [server._to_jsonable(item) for item in server._collect_items(result)]
+    return server.ItemsResult.model_construct(items=items)
+
+
+def measure(tool: Tool) -> float:
+    arguments = {"params": {"project_id": 1}}
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.process_time()
+        result = asyncio.run(tool.run(arguments))
+        best = min(best, time.process_time() - started)
+        assert result.structured_content is not None
+    return best
+
+
+def main() -> None:
+    timings = {
+        "before": measure(make_tool(build_before, None)),
+        "after": measure(make_tool(server._build_items_result, default_serializer.dumps_text)),
+    }
+    print(f"serializer backend: {default_serializer.backend}")
+    for label, seconds in timings.items():
+        print(f"{label:>6}: {seconds * 1000:8.2f} ms CPU per call ({ITEM_COUNT} items)")
+    print(f"speedup: {timings['before'] / timings['after']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Per-call validation overhead of an item-returning tool on a 10k-item result.
+
+Run with ``PYTHONPATH=src python benchmarks/validation_overhead.py``. The "before"
+path re-validates already-validated params and every output item, as the tool
+wrapper used to; the "after" path is the current wrapper.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from pydantic import BaseModel
+
+import scrapinghub_mcp.server as server
+
+ITEM_COUNT = 10_000
+ROUNDS = 20
+
+
+class BenchJobs:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self._items = items
+
+    def iter(self, **_: Any) -> list[dict[str, Any]]:
+        return self._items
+
+
+class BenchProject:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.jobs = BenchJobs(items)
+
+
+class BenchClient:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self._project = BenchProject(items)
+
+    def get_project(self, project_id: int) -> BenchProject:
+        return self._project
+
+
+class BenchMCP:
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+
+    def tool(self, name: str | None = None) -> Any:
+        def decorator(func: Any) -> Any:
+            self.tools[name or func.__name__] = func
+            return func
+
+        return decorator
+
+
+def make_items() -> list[dict[str, Any]]:
+    return [
+        {
+            "key": f"1/2/{index}",
+            "state": "finished",
+            "items": index,
+            "tags": ["nightly", "prod"],
+            "spider": {"name": "products", "version": 3},
+        }
+        for index in range(ITEM_COUNT)
+    ]
+
+
+def before(client: BenchClient, params: BaseModel) -> BaseModel:
+    validated = server.JobsIterParams.model_validate(params.model_dump())
+    result = server._call_project_method(client, "jobs", "iter", validated)
+    items = [server._to_jsonable(item) for item in server._collect_items(result)]
+    return server.ItemsResult(items=items)
+
+
+def main() -> None:
+    client = BenchClient(make_items())
+    mcp = BenchMCP()
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+    )
+    tool = mcp.tools["project_jobs_iter"]
+    params = server.JobsIterParams(project_id=1)
+
+    timings = {
+        "before": min(timeit.repeat(lambda: before(client, params), number=1, repeat=ROUNDS)),
+        "after": min(timeit.repeat(lambda: tool(params), number=1, repeat=ROUNDS)),
+    }
+    for label, seconds in timings.items():
+        print(f"{label:>6}: {seconds * 1000:8.2f} ms per call ({ITEM_COUNT} items)")
+    print(f"speedup: {timings['before'] / timings['after']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Generated by `python -m scrapinghub_mcp.compile_allowlist`; do not edit.
+from __future__ import annotations
+
+SOURCE_SHA256 = "5340b8672f21796b28b9491ea56f6a7124a39dccc609d005d136df7fbce30faa"
+NON_MUTATING = frozenset(
+    {
+        "fanout.project.jobs.count",
+        "fanout.project.jobs.summary",
+        "fanout.project.spiders.list",
+        "get_job",
+        "get_project",
+        "job.items.iter",
+        "job.logs.iter",
+        "job.requests.stats",
+        "project.activity.iter",
+        "project.activity.list",
+        "project.collections.get",
+        "project.collections.get_cached_store",
+        "project.collections.get_store",
+        "project.collections.get_versioned_cached_store",
+        "project.collections.get_versioned_store",
+        "project.collections.iter",
+        "project.collections.list",
+        "project.frontiers.get",
+        "project.frontiers.iter",
+        "project.frontiers.list",
+        "project.jobs.count",
+        "project.jobs.get",
+        "project.jobs.iter",
+        "project.jobs.iter_last",
+        "project.jobs.list",
+        "project.jobs.summary",
+        "project.settings.get",
+        "project.settings.iter",
+        "project.settings.list",
+        "project.spiders.get",
+        "project.spiders.iter",
+        "project.spiders.list",
+        "projects.get",
+        "projects.iter",
+        "projects.list",
+        "projects.summary",
+    }
+)
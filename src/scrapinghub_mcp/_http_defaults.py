@@ -0,0 +1,6 @@
+# Kept free of requests/urllib3 so server.py can read the defaults at import time.
+from __future__ import annotations
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+DEFAULT_STATS_EVERY = 500
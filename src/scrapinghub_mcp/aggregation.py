@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_DOMAINS = 1000
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+# Histogram buckets grow by this ratio, so percentiles are within ~2% of exact.
+BUCKET_RATIO = 1.02
+_LOG_RATIO = math.log(BUCKET_RATIO)
+
+
+class DurationHistogram:
+    """Log-scale histogram of durations with a fixed relative error and bounded size."""
+
+    def __init__(self) -> None:
+        self._buckets: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        if value < 0 or math.isnan(value):
+            return
+        self._buckets[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def percentile(self, percent: float) -> float | None:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(max(self._upper_bound(bucket), self.minimum), self.maximum)
+        return self.maximum
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        if value < 1:
+            return -1
+        return int(math.log(value) / _LOG_RATIO)
+
+    @staticmethod
+    def _upper_bound(bucket: int) -> float:
+        if bucket < 0:
+            return 1.0
+        return BUCKET_RATIO ** (bucket + 1)
+
+
+def _hostname(url: Any) -> str | None:
+    if not isinstance(url, str):
+        return None
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        # Request logs are upstream data; a malformed URL must not fail the summary.
+        return None
+
+
+@dataclass(frozen=True)
+class RequestStatsSummary:
+    total: int
+    status_counts: dict[str, int]
+    top_domains: list[tuple[str, int]]
+    tracked_domains: int
+    domains_truncated: bool
+    untracked_domain_requests: int
+    duration_count: int
+    duration_mean: float | None
+    duration_min: float | None
+    duration_max: float | None
+    duration_percentiles: dict[str, float | None]
+
+
+class RequestStatsAccumulator:
+    """Folds Scrapinghub request records into crawl-health aggregates in bounded memory.
+
+    Per-domain counts are exact for the first ``max_domains`` domains seen; requests
+    to domains beyond that are only counted in ``untracked_domain_requests`` and the
+    summary is marked ``domains_truncated``. URLs that cannot be parsed count under
+    the ``unknown`` domain.
+    """
+
+    def __init__(self, *, max_domains: int = DEFAULT_MAX_DOMAINS) -> None:
+        if max_domains < 1:
+            raise ValueError("max_domains must be at least 1.")
+        self._max_domains = max_domains
+        self._total = 0
+        self._statuses: Counter[str] = Counter()
+        self._domains: Counter[str] = Counter()
+        self._untracked = 0
+        self._durations = DurationHistogram()
+
+    def add(self, record: Any) -> None:
+        if not isinstance(record, dict):
+            return
+        self._total += 1
+        status = record.get("status")
+        self._statuses[str(status) if status is not None else "unknown"] += 1
+        url = record.get("url")
+        domain = _hostname(url) or "unknown"
+        if domain in self._domains or len(self._domains) < self._max_domains:
+            self._domains[domain] += 1
+        else:
+            self._untracked += 1
+        duration = record.get("duration")
+        if isinstance(duration, (int, float)) and not isinstance(duration, bool):
+            self._durations.add(float(duration))
+
+    def add_all(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.add(record)
+
+    def summary(
+        self,
+        *,
+        top_domains: int,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    ) -> RequestStatsSummary:
+        durations = self._durations
+        has_durations = durations.count > 0
+        return RequestStatsSummary(
+            total=self._total,
+            status_counts=dict(sorted(self._statuses.items())),
+            top_domains=self._domains.most_common(top_domains),
+            tracked_domains=len(self._domains),
+            domains_truncated=self._untracked > 0,
+            untracked_domain_requests=self._untracked,
+            duration_count=durations.count,
+            duration_mean=durations.total / durations.count if has_durations else None,
+            duration_min=durations.minimum if has_durations else None,
+            duration_max=durations.maximum if has_durations else None,
+            duration_percentiles={
+                f"p{percent:g}": durations.percentile(percent) for percent in percentiles
+            },
+        )
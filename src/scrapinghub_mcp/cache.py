@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Mapping, TypeVar
+
+from scrapinghub_mcp.cancellation import current_scope
+
+T = TypeVar("T")
+
+DEFAULT_MAX_PROJECT_HANDLES = 128
+DEFAULT_MAX_RESPONSES = 1024
+FOLLOWER_WAIT_SLICE_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class ProjectHandleCache:
+    """Bounded LRU of Scrapinghub project handles keyed by project id."""
+
+    def __init__(
+        self,
+        loader: Callable[[int], Any],
+        *,
+        max_size: int = DEFAULT_MAX_PROJECT_HANDLES,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self._loader = loader
+        self._max_size = max_size
+        self._handles: OrderedDict[int, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, project_id: int) -> Any:
+        with self._lock:
+            handle = self._handles.get(project_id)
+            if handle is not None:
+                self._handles.move_to_end(project_id)
+                self._hits += 1
+                return handle
+            self._misses += 1
+        handle = self._loader(project_id)
+        with self._lock:
+            handle = self._handles.setdefault(project_id, handle)
+            self._handles.move_to_end(project_id)
+            while len(self._handles) > self._max_size:
+                self._handles.popitem(last=False)
+        return handle
+
+    def clear(self) -> None:
+        with self._lock:
+            self._handles.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._handles),
+                max_size=self._max_size,
+            )
+
+
+@dataclass
+class _CachedResponse:
+    value: Any
+    project_id: int | None
+    stored_at: float
+    ttl_seconds: float
+
+
+# Operations polled for new data (log tails) are only cached with an explicit TTL,
+# never through default_ttl_seconds.
+VOLATILE_METHODS = frozenset({"job.logs.iter"})
+
+
+class ResponseCache:
+    """TTL cache of tool responses keyed by method name and canonical params.
+
+    Entries are tagged with the project they belong to so a successful mutation
+    can drop that project's entries, along with entries that span projects.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_ttl_seconds: float = 0.0,
+        ttl_seconds: Mapping[str, float] | None = None,
+        max_entries: int = DEFAULT_MAX_RESPONSES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self._default_ttl_seconds = default_ttl_seconds
+        self._ttl_seconds = dict(ttl_seconds or {})
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], _CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+
+    def ttl_for(self, method_name: str) -> float:
+        default = 0.0 if method_name in VOLATILE_METHODS else self._default_ttl_seconds
+        return self._ttl_seconds.get(method_name, default)
+
+    def get(self, method_name: str, key: str, *, max_age: float | None = None) -> Any | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get((method_name, key))
+            if entry is not None:
+                age = now - entry.stored_at
+                limit = entry.ttl_seconds if max_age is None else min(max_age, entry.ttl_seconds)
+                if age < limit:
+                    self._entries.move_to_end((method_name, key))
+                    self._hits += 1
+                    return entry.value
+                if age >= entry.ttl_seconds:
+                    del self._entries[(method_name, key)]
+            self._misses += 1
+            return None
+
+    def generation(self) -> int:
+        """Return a token that put() uses to discard responses fetched before an invalidation."""
+        with self._lock:
+            return self._generation
+
+    def put(
+        self,
+        method_name: str,
+        key: str,
+        value: Any,
+        *,
+        project_id: int | None,
+        generation: int | None = None,
+    ) -> None:
+        ttl_seconds = self.ttl_for(method_name)
+        if ttl_seconds <= 0:
+            return
+        entry = _CachedResponse(
+            value=value,
+            project_id=project_id,
+            stored_at=self._clock(),
+            ttl_seconds=ttl_seconds,
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[(method_name, key)] = entry
+            self._entries.move_to_end((method_name, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_project(self, project_id: int | None) -> int:
+        """Drop entries for ``project_id`` and entries not tied to a single project.
+
+        Passing ``None`` drops every entry.
+        """
+        with self._lock:
+            self._generation += 1
+            if project_id is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.project_id is None or entry.project_id == project_id
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self._max_entries,
+            )
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls so one runs and every caller shares its outcome.
+
+    A follower waits under its own cancel scope: when it is cancelled or passes its
+    deadline it stops waiting and raises, while the leader keeps running for the
+    other callers.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        with self._lock:
+            return self._coalesced
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+        if not leader:
+            self._wait(flight)
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = func()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value
+
+    @staticmethod
+    def _wait(flight: _Flight) -> None:
+        scope = current_scope()
+        if scope is None:
+            flight.done.wait()
+            return
+        while True:
+            scope.check()
+            remaining = scope.remaining()
+            timeout = (
+                FOLLOWER_WAIT_SLICE_SECONDS
+                if remaining is None
+                else max(0.0, min(FOLLOWER_WAIT_SLICE_SECONDS, remaining))
+            )
+            if flight.done.wait(timeout):
+                return
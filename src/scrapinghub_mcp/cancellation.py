@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_CURRENT: contextvars.ContextVar[CancelScope | None] = contextvars.ContextVar(
+    "scrapinghub_mcp_cancel_scope", default=None
+)
+
+
+class ToolCancelled(RuntimeError):
+    """Raised inside a tool call whose MCP request was cancelled."""
+
+
+class DeadlineExceeded(ToolCancelled):
+    """Raised inside a tool call that ran past its deadline."""
+
+
+class CancelScope:
+    """Deadline and cancellation state for one tool call.
+
+    The scope is made current in the thread running the call, so the HTTP adapter,
+    upstream iterators and backoff sleeps can check it. ``cancel`` may be called
+    from any thread: it runs the registered abort callbacks (which shut down the
+    sockets of in-flight requests) and cancels child scopes.
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: float | None = None,
+        *,
+        parent: CancelScope | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._deadline_seconds = deadline_seconds
+        self._deadline = None if deadline_seconds is None else clock() + deadline_seconds
+        self._parent = parent
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._children: set[CancelScope] = set()
+        if parent is not None:
+            parent._adopt(self)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def remaining(self) -> float | None:
+        """Seconds left before the nearest deadline in this scope or its parents."""
+        remaining = None if self._deadline is None else self._deadline - self._clock()
+        if self._parent is not None:
+            inherited = self._parent.remaining()
+            if inherited is not None and (remaining is None or inherited < remaining):
+                remaining = inherited
+        return remaining
+
+    def error(self) -> ToolCancelled | None:
+        """The exception describing why this scope stopped, or None if it is live."""
+        if self.cancelled:
+            return ToolCancelled("The tool call was cancelled by the client.")
+        if self._deadline is not None and self._clock() >= self._deadline:
+            assert self._deadline_seconds is not None
+            return DeadlineExceeded(
+                f"The tool call exceeded its deadline of {self._deadline_seconds * 1000:.0f} ms."
+            )
+        return None if self._parent is None else self._parent.error()
+
+    def check(self) -> None:
+        error = self.error()
+        if error is not None:
+            raise error
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+            children = list(self._children)
+        for callback in callbacks:
+            callback()
+        for child in children:
+            child.cancel()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` when the scope is cancelled (immediately if it already is).
+
+        Returns a function that unregisters the callback; call it once the work the
+        callback would abort has finished, so long-lived scopes do not accumulate them.
+        """
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        callback()
+        return _noop
+
+    def _unregister(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep unless cancelled first; fail right away if the deadline is nearer."""
+        self.check()
+        remaining = self.remaining()
+        if remaining is not None and seconds > remaining:
+            raise DeadlineExceeded(
+                f"Waiting {seconds:.1f}s would pass the tool call's deadline "
+                f"({max(remaining, 0):.1f}s left)."
+            )
+        if self._cancelled.wait(seconds):
+            self.check()
+
+    @contextmanager
+    def activate(self) -> Iterator[CancelScope]:
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+            if self._parent is not None:
+                self._parent._release(self)
+
+    def run(self, func: Callable[..., T], *args: Any) -> T:
+        with self.activate():
+            return func(*args)
+
+    def _adopt(self, child: CancelScope) -> None:
+        with self._lock:
+            cancelled = self._cancelled.is_set()
+            if not cancelled:
+                self._children.add(child)
+        if cancelled:
+            child.cancel()
+
+    def _release(self, child: CancelScope) -> None:
+        with self._lock:
+            self._children.discard(child)
+
+
+def _noop() -> None:
+    return None
+
+
+def current_scope() -> CancelScope | None:
+    return _CURRENT.get()
+
+
+def interruption() -> ToolCancelled | None:
+    """Why the current tool call stopped, if it was cancelled or ran out of time."""
+    scope = _CURRENT.get()
+    return None if scope is None else scope.error()
+
+
+def check_cancelled() -> None:
+    scope = _CURRENT.get()
+    if scope is not None:
+        scope.check()
+
+
+def sleep(seconds: float) -> None:
+    """``time.sleep`` that honours the current tool call's cancellation and deadline."""
+    scope = _CURRENT.get()
+    if scope is None:
+        time.sleep(seconds)
+    else:
+        scope.sleep(seconds)
+
+
+def checked(items: Iterator[T]) -> Iterator[T]:
+    """Yield from ``items``, stopping at the next item once the tool call is cancelled."""
+    try:
+        for item in items:
+            check_cancelled()
+            yield item
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
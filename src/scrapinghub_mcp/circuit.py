@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+import structlog
+
+from scrapinghub_mcp.retry import is_retryable
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint family whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    name: str
+    state: CircuitState
+    consecutive_failures: int
+    opened: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """Fails fast for one endpoint family after repeated upstream failures.
+
+    Only transient upstream failures (timeouts, connection errors, 5xx, 429)
+    count; other errors prove the endpoint is answering. After
+    ``failure_threshold`` consecutive failures the circuit opens for
+    ``reset_seconds``, then lets a single probe through (half-open): success
+    closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1 or reset_seconds <= 0:
+            raise ValueError("Circuit breakers need failure_threshold >= 1 and reset_seconds > 0.")
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._opened = 0
+        self._rejected = 0
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == "open":
+                remaining = self._opened_at + self._reset_seconds - self._clock()
+                if remaining > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(
+                        f"Upstream '{self.name}' is failing; calls are paused for "
+                        f"{remaining:.0f}s more. Other tools are unaffected."
+                    )
+                self._state = "half_open"
+                logger.info("circuit.half_open", family=self.name)
+            if self._state == "half_open":
+                if self._probing:
+                    self._rejected += 1
+                    raise CircuitOpenError(
+                        f"Upstream '{self.name}' is being probed after failures. Retry shortly."
+                    )
+                self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self._state != "closed":
+                self._state = "closed"
+                logger.info("circuit.closed", family=self.name)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == "half_open" or self._failures >= self._failure_threshold:
+                if self._state != "open":
+                    self._opened += 1
+                    logger.warning("circuit.opened", family=self.name, failures=self._failures)
+                self._state = "open"
+                self._opened_at = self._clock()
+
+    def record_error(self, exc: BaseException) -> None:
+        if is_retryable(exc):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def release(self) -> None:
+        """End a call that never reached upstream without affecting the state."""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> CircuitStats:
+        with self._lock:
+            return CircuitStats(
+                name=self.name,
+                state=self._state,
+                consecutive_failures=self._failures,
+                opened=self._opened,
+                rejected=self._rejected,
+            )
+
+
+class CircuitBreakers:
+    """Lazily created circuit breakers, one per endpoint family."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    family,
+                    failure_threshold=self._failure_threshold,
+                    reset_seconds=self._reset_seconds,
+                    clock=self._clock,
+                )
+                self._breakers[family] = breaker
+            return breaker
+
+    def stats(self) -> list[CircuitStats]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.stats() for breaker in breakers]
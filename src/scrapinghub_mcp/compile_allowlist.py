@@ -0,0 +1,63 @@
+"""Regenerate the precompiled packaged allowlist.
+
+Run ``python -m scrapinghub_mcp.compile_allowlist`` after editing
+``scrapinghub-mcp.allowlist.yaml``; pass ``--check`` to fail instead of writing
+when the compiled module is stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+from pathlib import Path
+
+COMPILED_MODULE = Path(__file__).with_name("_allowlist_compiled.py")
+
+
+def allowlist_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def render_compiled_allowlist(content: str) -> str:
+    from scrapinghub_mcp.server import _parse_allowlist
+
+    operations = sorted(_parse_allowlist(content))
+    lines = [
+        "# Generated by `python -m scrapinghub_mcp.compile_allowlist`; do not edit.",
+        "from __future__ import annotations",
+        "",
+        f'SOURCE_SHA256 = "{allowlist_hash(content)}"',
+        "NON_MUTATING = frozenset(",
+        "    {",
+        *(f'        "{operation}",' for operation in operations),
+        "    }",
+        ")",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero if the compiled module is stale."
+    )
+    args = parser.parse_args(argv)
+
+    from scrapinghub_mcp.server import ALLOWLIST_FILENAME
+
+    source = Path(__file__).with_name(ALLOWLIST_FILENAME).read_text(encoding="utf-8")
+    rendered = render_compiled_allowlist(source)
+    current = COMPILED_MODULE.read_text(encoding="utf-8") if COMPILED_MODULE.is_file() else None
+    if current == rendered:
+        return 0
+    if args.check:
+        print(f"{COMPILED_MODULE.name} is stale; run python -m scrapinghub_mcp.compile_allowlist.")
+        return 1
+    COMPILED_MODULE.write_text(rendered, encoding="utf-8")
+    print(f"Wrote {COMPILED_MODULE}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
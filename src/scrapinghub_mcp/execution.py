@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Sequence, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    max_workers: int
+    in_flight: int
+    queued: int
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.max_workers
+
+
+class ToolExecutor:
+    """Runs blocking tool handlers on a bounded worker pool."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scrapinghub-mcp"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+        self._saturated = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                in_flight=self._in_flight,
+                queued=self._queued,
+            )
+
+    async def run(self, func: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued += 1
+            saturated = self._in_flight + self._queued > self._max_workers
+            if saturated and not self._saturated:
+                logger.warning(
+                    "executor.saturated",
+                    max_workers=self._max_workers,
+                    in_flight=self._in_flight,
+                    queued=self._queued,
+                )
+            self._saturated = saturated
+        future = self._pool.submit(self._invoke, func)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call cancelled while still queued never reaches _invoke.
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    async def run_all(self, funcs: Sequence[Callable[[], T]], *, limit: int) -> list[T]:
+        """Run ``funcs`` on the pool with at most ``limit`` in flight, preserving order."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_one(func: Callable[[], T]) -> T:
+            async with semaphore:
+                return await self.run(func)
+
+        return list(await asyncio.gather(*(run_one(func) for func in funcs)))
+
+    def _invoke(self, func: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if self._saturated and self._in_flight + self._queued < self._max_workers:
+                    self._saturated = False
+                    logger.info(
+                        "executor.recovered",
+                        max_workers=self._max_workers,
+                        in_flight=self._in_flight,
+                        queued=self._queued,
+                    )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import structlog
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from scrapinghub_mcp._http_defaults import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_STATS_EVERY,
+)
+from scrapinghub_mcp.cancellation import CancelScope, current_scope
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    host: str
+    requests: int
+    new_connections: int
+
+    @property
+    def hits(self) -> int:
+        """Requests served on an already-open connection."""
+        return max(self.requests - self.new_connections, 0)
+
+
+class _AbortableConnection:
+    """Connection mixin that shuts its socket down when the owning tool call is cancelled.
+
+    Shutting the socket down wakes the worker thread blocked on it, so a cancelled
+    call gives its thread back instead of waiting for the upstream response. The
+    abort callback stays registered until the response is released back to the
+    pool (streamed bodies are read after ``send`` returns), the connection closes,
+    or it starts its next request.
+    """
+
+    sock: socket.socket | None
+    _cancel_scope: CancelScope | None = None
+    _unregister_cancel: Callable[[], None] | None = None
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        self.release_scope()
+        scope = current_scope()
+        self._cancel_scope = scope
+        if scope is not None:
+            self._unregister_cancel = scope.on_cancel(lambda: self._abort(scope))
+        return super().request(*args, **kwargs)  # type: ignore[misc]
+
+    def release_scope(self) -> None:
+        """Detach the connection from the tool call that made its last request."""
+        unregister = self._unregister_cancel
+        self._cancel_scope = None
+        self._unregister_cancel = None
+        if unregister is not None:
+            unregister()
+
+    def close(self) -> None:
+        self.release_scope()
+        super().close()  # type: ignore[misc]
+
+    def _abort(self, scope: CancelScope) -> None:
+        # The connection may have gone back to the pool and be serving another call.
+        if self._cancel_scope is not scope or self.sock is None:
+            return
+        logger.info("http.request.aborted", host=getattr(self, "host", None))
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _AbortableHTTPConnection(_AbortableConnection, HTTPConnection):
+    pass
+
+
+class _AbortableHTTPSConnection(_AbortableConnection, HTTPSConnection):
+    pass
+
+
+class _ReleasingPool:
+    """Pool mixin that detaches connections from their tool call when they are returned."""
+
+    def _put_conn(self, conn: Any) -> None:
+        if isinstance(conn, _AbortableConnection):
+            conn.release_scope()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class _AbortableHTTPConnectionPool(_ReleasingPool, HTTPConnectionPool):
+    ConnectionCls = _AbortableHTTPConnection
+
+
+class _AbortableHTTPSConnectionPool(_ReleasingPool, HTTPSConnectionPool):
+    ConnectionCls = _AbortableHTTPSConnection
+
+
+def _cap_timeout(timeout: Any, remaining: float) -> Any:
+    """Clamp a requests timeout (None, seconds or a (connect, read) pair) to ``remaining``."""
+    if isinstance(timeout, tuple):
+        return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTP adapter with a sized connection pool that logs pool usage periodically.
+
+    urllib3 counts requests and newly opened connections per host pool; every
+    ``stats_every`` requests those counters are logged as ``http.pool.stats``.
+    Requests made inside a tool call honour its cancel scope: timeouts are capped
+    at the remaining deadline and cancelling the call aborts the request.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        stats_every: int = DEFAULT_STATS_EVERY,
+    ) -> None:
+        super().__init__(pool_connections=pool_size, pool_maxsize=max_connections_per_host)
+        self.name = name
+        self._stats_every = stats_every
+        self._sent = 0
+        self._lock = threading.Lock()
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _AbortableHTTPConnectionPool,
+            "https": _AbortableHTTPSConnectionPool,
+        }
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        scope = current_scope()
+        if scope is not None:
+            scope.check()
+            remaining = scope.remaining()
+            if remaining is not None and not args:
+                kwargs["timeout"] = _cap_timeout(kwargs.get("timeout"), max(remaining, 0.001))
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._sent += 1
+                report = self._sent % self._stats_every == 0
+            if report:
+                self.log_stats()
+
+    def stats(self) -> list[PoolStats]:
+        pools = self.poolmanager.pools
+        stats = []
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.append(
+                PoolStats(
+                    host=f"{pool.scheme}://{pool.host}:{pool.port}",
+                    requests=pool.num_requests,
+                    new_connections=pool.num_connections,
+                )
+            )
+        return stats
+
+    def log_stats(self) -> None:
+        for stat in self.stats():
+            logger.info(
+                "http.pool.stats",
+                session=self.name,
+                host=stat.host,
+                requests=stat.requests,
+                hits=stat.hits,
+                new_connections=stat.new_connections,
+            )
+
+
+def configure_session(
+    session: Session,
+    name: str,
+    *,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    keep_alive: bool = True,
+    stats_every: int = DEFAULT_STATS_EVERY,
+) -> PooledAdapter:
+    """Mount a ``PooledAdapter`` for http and https on ``session`` and return it."""
+    adapter = PooledAdapter(
+        name,
+        pool_size=pool_size,
+        max_connections_per_host=max_connections_per_host,
+        stats_every=stats_every,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    logger.info(
+        "http.pool.configured",
+        session=name,
+        pool_size=pool_size,
+        max_connections_per_host=max_connections_per_host,
+        keep_alive=keep_alive,
+    )
+    return adapter
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+STAGES = ("validation", "upstream", "build", "serialize")
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DEFAULT_TEXTFILE_INTERVAL_SECONDS = 15.0
+METRIC_PREFIX = "scrapinghub_mcp"
+
+_TIMER: contextvars.ContextVar[StageTimer | None] = contextvars.ContextVar(
+    "scrapinghub_mcp_stage_timer", default=None
+)
+_SERIALIZING_TOOL: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "scrapinghub_mcp_serializing_tool", default=None
+)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    # Cumulative counts per upper bound, like Prometheus ``le`` buckets.
+    buckets: tuple[tuple[float, int], ...]
+    count: int
+    sum: float
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (None past the last bucket)."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, cumulative in self.buckets:
+            if cumulative >= rank:
+                return bound
+        return None
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * len(self._bounds)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self._bounds):
+            if value <= bound:
+                self._counts[index] += 1
+                break
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative = 0
+        buckets = []
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return HistogramSnapshot(buckets=tuple(buckets), count=self._count, sum=self._sum)
+
+
+@dataclass(frozen=True)
+class ToolStats:
+    tool: str
+    calls: int
+    errors: int
+    items: int
+    bytes: int
+    latency: dict[str, HistogramSnapshot]
+
+
+class _ToolMetrics:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.items = 0
+        self.bytes = 0
+        self.latency = {stage: Histogram(buckets) for stage in STAGES}
+
+
+class MetricsRegistry:
+    """In-process counters and latency histograms per tool.
+
+    Latency is split into stages: ``validation`` of params, ``upstream`` time in
+    Scrapinghub calls and item iteration, ``build`` of the output model, and
+    ``serialize`` of the response sent to the client.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._buckets = buckets
+        self._tools: dict[str, _ToolMetrics] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def _tool(self, tool: str) -> _ToolMetrics:
+        metrics = self._tools.get(tool)
+        if metrics is None:
+            metrics = self._tools[tool] = _ToolMetrics(self._buckets)
+        return metrics
+
+    def record_call(self, tool: str, *, error: bool = False, items: int = 0) -> None:
+        with self._lock:
+            metrics = self._tool(tool)
+            metrics.calls += 1
+            metrics.errors += int(error)
+            metrics.items += items
+
+    def observe(self, tool: str, stage: str, seconds: float) -> None:
+        if stage not in STAGES:
+            raise ValueError(f"Unknown metrics stage '{stage}'.")
+        with self._lock:
+            self._tool(tool).latency[stage].observe(seconds)
+
+    def add_bytes(self, tool: str, count: int) -> None:
+        with self._lock:
+            self._tool(tool).bytes += count
+
+    def snapshot(self) -> list[ToolStats]:
+        with self._lock:
+            return [
+                ToolStats(
+                    tool=tool,
+                    calls=metrics.calls,
+                    errors=metrics.errors,
+                    items=metrics.items,
+                    bytes=metrics.bytes,
+                    latency={
+                        stage: histogram.snapshot() for stage, histogram in metrics.latency.items()
+                    },
+                )
+                for tool, metrics in sorted(self._tools.items())
+            ]
+
+    def prometheus_text(self) -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        stats = self.snapshot()
+        lines: list[str] = []
+        counters = (
+            ("tool_calls_total", "Tool calls, including cache hits.", "calls"),
+            ("tool_errors_total", "Tool calls that failed.", "errors"),
+            ("tool_items_total", "Items returned by tool calls.", "items"),
+            ("tool_response_bytes_total", "Bytes of serialized tool responses.", "bytes"),
+        )
+        for name, help_text, field in counters:
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            for stat in stats:
+                labels = _labels(tool=stat.tool)
+                lines.append(f"{METRIC_PREFIX}_{name}{labels} {getattr(stat, field)}")
+        name = f"{METRIC_PREFIX}_tool_stage_seconds"
+        lines.append(f"# HELP {name} Tool call latency by stage.")
+        lines.append(f"# TYPE {name} histogram")
+        for stat in stats:
+            for stage, histogram in stat.latency.items():
+                for bound, cumulative in histogram.buckets:
+                    labels = _labels(tool=stat.tool, stage=stage, le=f"{bound:g}")
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _labels(tool=stat.tool, stage=stage, le="+Inf")
+                lines.append(f"{name}_bucket{labels} {histogram.count}")
+                labels = _labels(tool=stat.tool, stage=stage)
+                lines.append(f"{name}_sum{labels} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+        name = f"{METRIC_PREFIX}_start_time_seconds"
+        lines.append(f"# HELP {name} Unix time the server started.")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {self.started:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """Atomically replace ``path`` so a scraper never reads a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp.write_text(self.prometheus_text(), encoding="utf-8")
+        os.replace(temp, path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class TextfileExporter:
+    """Rewrites a Prometheus textfile on a daemon thread for node_exporter to pick up."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        path: Path,
+        *,
+        interval_seconds: float = DEFAULT_TEXTFILE_INTERVAL_SECONDS,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive.")
+        self._registry = registry
+        self._path = path
+        self._interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> bool:
+        try:
+            self._registry.write_textfile(self._path)
+        except OSError:
+            logger.exception("metrics.textfile_failed", path=str(self._path))
+            return False
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.write()
+        self._thread = threading.Thread(
+            target=self._run, name="scrapinghub-mcp-metrics", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "metrics.textfile_started",
+            path=str(self._path),
+            interval_seconds=self._interval_seconds,
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            self.write()
+
+
+class StageTimer:
+    """Accumulates upstream time for one tool call.
+
+    Nested measurements (an iterator pulled while a handler call is already being
+    timed) count once, so upstream time never exceeds wall time.
+    """
+
+    def __init__(self) -> None:
+        self.upstream_seconds = 0.0
+        self.produce_seconds = 0.0
+        self.produced = False
+        self._depth = 0
+
+    @contextmanager
+    def upstream(self) -> Iterator[None]:
+        if self._depth:
+            yield
+            return
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.upstream_seconds += time.perf_counter() - started
+            self._depth -= 1
+
+    @contextmanager
+    def production(self) -> Iterator[None]:
+        """Time fetching and building a result; what is not upstream time is build time."""
+        self.produced = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.produce_seconds += time.perf_counter() - started
+
+    def observe(self, registry: MetricsRegistry, tool: str) -> None:
+        if not self.produced:
+            return
+        upstream = min(self.upstream_seconds, self.produce_seconds)
+        registry.observe(tool, "upstream", upstream)
+        registry.observe(tool, "build", self.produce_seconds - upstream)
+
+    @contextmanager
+    def activate(self) -> Iterator[StageTimer]:
+        token = _TIMER.set(self)
+        try:
+            yield self
+        finally:
+            _TIMER.reset(token)
+
+
+@contextmanager
+def producing() -> Iterator[None]:
+    timer = _TIMER.get()
+    if timer is None:
+        yield
+        return
+    with timer.production():
+        yield
+
+
+def upstream_call(func: Callable[[], T]) -> T:
+    """Call ``func``, counting its duration as upstream time of the current tool call."""
+    timer = _TIMER.get()
+    if timer is None:
+        return func()
+    with timer.upstream():
+        return func()
+
+
+def timed(items: Iterator[T]) -> Iterator[T]:
+    """Yield from ``items``, counting the time spent pulling each item as upstream time.
+
+    The timer is looked up for every item, so items pulled from a cursor resumed by a
+    later tool call count toward that call.
+    """
+    try:
+        while True:
+            timer = _TIMER.get()
+            if timer is None:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+            else:
+                with timer.upstream():
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        return
+            yield item
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+
+
+def metered_serializer(
+    registry: MetricsRegistry, dumps: Callable[[Any], bytes]
+) -> Callable[[Any], str]:
+    """Wrap a tool serializer to record serialize time and response bytes per tool."""
+
+    def serialize(value: Any) -> str:
+        started = time.perf_counter()
+        data = dumps(value)
+        tool = _SERIALIZING_TOOL.get()
+        if tool is not None:
+            registry.observe(tool, "serialize", time.perf_counter() - started)
+            registry.add_bytes(tool, len(data))
+        return data.decode("utf-8")
+
+    return serialize
+
+
+def serializer_middleware() -> Any:
+    """FastMCP middleware that tells ``metered_serializer`` which tool it is encoding."""
+    from fastmcp.server.middleware import Middleware
+
+    class ToolNameMiddleware(Middleware):
+        async def on_call_tool(self, context: Any, call_next: Any) -> Any:
+            token = _SERIALIZING_TOOL.set(context.message.name)
+            try:
+                return await call_next(context)
+            finally:
+                _SERIALIZING_TOOL.reset(token)
+
+    return ToolNameMiddleware()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import itertools
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+import structlog
+
+from scrapinghub_mcp.serialization import default_serializer
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CURSOR_TTL_SECONDS = 300.0
+DEFAULT_MAX_CURSORS = 64
+MAX_PAGE_SIZE = 10_000
+
+
+class CursorError(RuntimeError):
+    """Raised when a pagination cursor is unknown, expired, or reused."""
+
+
+@dataclass(frozen=True)
+class Page:
+    items: list[Any]
+    next_cursor: str | None
+    truncated: bool = False
+    # JSON encoding of each item, kept from sizing the page against a byte budget so
+    # the response can reuse it instead of encoding the items again.
+    encoded: list[bytes] | None = None
+
+
+# An item waiting for the next page, with its encoding if it was already sized.
+_Pending = tuple[Any, bytes | None]
+
+
+@dataclass
+class _CursorEntry:
+    tool_name: str
+    iterator: Iterator[Any]
+    pending: list[_Pending]
+    page_size: int | None
+    expires_at: float
+
+
+def _close_iterator(iterator: Iterator[Any]) -> None:
+    close = getattr(iterator, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            logger.warning("cursor.close_failed", exc_info=True)
+
+
+class CursorStore:
+    """Holds live upstream iterators between pages under a TTL with LRU eviction.
+
+    Cursors are single-use: resuming a cursor checks its iterator out of the store,
+    and the next page is issued under a fresh cursor.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_CURSOR_TTL_SECONDS,
+        max_cursors: int = DEFAULT_MAX_CURSORS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_cursors = max_cursors
+        self._clock = clock
+        self._entries: OrderedDict[str, _CursorEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def open(
+        self,
+        tool_name: str,
+        iterator: Iterator[Any],
+        page_size: int | None,
+        *,
+        max_bytes: int | None = None,
+    ) -> Page:
+        """Issue the first page; ``page_size`` of None only bounds the page by ``max_bytes``."""
+        return self._take(tool_name, iterator, [], page_size, max_bytes)
+
+    def resume(
+        self,
+        tool_name: str,
+        cursor: str,
+        page_size: int | None = None,
+        *,
+        max_bytes: int | None = None,
+    ) -> Page:
+        with self._lock:
+            expired = self._pop_expired()
+            entry = self._entries.pop(cursor, None)
+        self._close_entries(expired, reason="expired")
+        if entry is None:
+            raise CursorError("Unknown or expired cursor. Restart pagination without a cursor.")
+        if entry.tool_name != tool_name:
+            _close_iterator(entry.iterator)
+            raise CursorError(f"Cursor was issued by '{entry.tool_name}', not '{tool_name}'.")
+        return self._take(
+            tool_name, entry.iterator, entry.pending, page_size or entry.page_size, max_bytes
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        self._close_entries(entries, reason="cleared")
+
+    def _take(
+        self,
+        tool_name: str,
+        iterator: Iterator[Any],
+        pending: list[_Pending],
+        page_size: int | None,
+        max_bytes: int | None,
+    ) -> Page:
+        truncated = False
+        encoded = None
+        if max_bytes is None and page_size is not None:
+            items = [item for item, _ in pending[:page_size]]
+            items.extend(itertools.islice(iterator, page_size - len(items)))
+            leftover = pending[page_size:]
+        else:
+            items, encoded, leftover, truncated = self._take_within_budget(
+                iterator, pending, page_size, max_bytes
+            )
+        if not leftover:
+            sentinel = object()
+            peeked = next(iterator, sentinel)
+            if peeked is sentinel:
+                return Page(items=items, next_cursor=None, truncated=truncated, encoded=encoded)
+            leftover = [(peeked, None)]
+        cursor = secrets.token_urlsafe(16)
+        entry = _CursorEntry(
+            tool_name=tool_name,
+            iterator=iterator,
+            pending=leftover,
+            page_size=page_size,
+            expires_at=self._clock() + self._ttl_seconds,
+        )
+        with self._lock:
+            evicted = self._pop_expired()
+            self._entries[cursor] = entry
+            while len(self._entries) > self._max_cursors:
+                _, oldest = self._entries.popitem(last=False)
+                evicted.append(oldest)
+        self._close_entries(evicted, reason="evicted")
+        return Page(items=items, next_cursor=cursor, truncated=truncated, encoded=encoded)
+
+    @staticmethod
+    def _take_within_budget(
+        iterator: Iterator[Any],
+        pending: list[_Pending],
+        page_size: int | None,
+        max_bytes: int | None,
+    ) -> tuple[list[Any], list[bytes] | None, list[_Pending], bool]:
+        """Take items until ``page_size`` or the serialized ``max_bytes`` budget is reached.
+
+        Each item is encoded once as it is taken; the encodings are returned for the
+        response to reuse, and an item that does not fit keeps its encoding for the
+        next page. The budget counts the items' share of the response, not the
+        response wrapper. A first item larger than the whole budget is still
+        returned on its own so pagination always makes progress.
+        """
+        queued = deque(pending)
+        items: list[Any] = []
+        encoded: list[bytes] = []
+        used = 0
+        while page_size is None or len(items) < page_size:
+            if queued:
+                item, data = queued.popleft()
+            else:
+                sentinel = object()
+                item, data = next(iterator, sentinel), None
+                if item is sentinel:
+                    break
+            if max_bytes is not None:
+                if data is None:
+                    data = default_serializer.dumps(item)
+                # Each element also adds a separator to the array.
+                if items and used + len(data) + 1 > max_bytes:
+                    queued.appendleft((item, data))
+                    return items, encoded, list(queued), True
+                used += len(data) + 1
+                encoded.append(data)
+            items.append(item)
+        return items, encoded if max_bytes is not None else None, list(queued), False
+
+    def _pop_expired(self) -> list[_CursorEntry]:
+        now = self._clock()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        return [self._entries.pop(key) for key in expired]
+
+    def _close_entries(self, entries: list[_CursorEntry], *, reason: str) -> None:
+        for entry in entries:
+            logger.info("cursor.released", tool=entry.tool_name, reason=reason)
+            _close_iterator(entry.iterator)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import structlog
+
+from scrapinghub_mcp import cancellation
+
+logger = structlog.get_logger(__name__)
+
+GLOBAL_BUCKET = "global"
+DEFAULT_MAX_WAIT_SECONDS = 10.0
+
+
+class RateLimitError(RuntimeError):
+    """Raised when a call would wait longer than the limiter's bounded queue allows."""
+
+
+@dataclass(frozen=True)
+class BucketLimit:
+    rate: float
+    burst: int
+
+
+@dataclass(frozen=True)
+class BucketStats:
+    name: str
+    tokens: float
+    rate: float
+    burst: int
+    waits: int
+    queued: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations, so waiters are served in arrival order.
+
+    A call takes a token immediately; if the bucket is empty the balance goes
+    negative and the caller sleeps until its reservation is covered by refill.
+    """
+
+    def __init__(
+        self, name: str, limit: BucketLimit, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if limit.rate <= 0 or limit.burst < 1:
+            raise ValueError("Rate limits need rate > 0 and burst >= 1.")
+        self.name = name
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._waits = 0
+        self._queued = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._tokens + elapsed * self.limit.rate, float(self.limit.burst))
+        self._updated = now
+
+    def reserve(self, max_wait: float) -> float | None:
+        """Take one token; return the wait it needs, or None if that exceeds ``max_wait``."""
+        with self._lock:
+            self._refill(self._clock())
+            wait = max(-(self._tokens - 1) / self.limit.rate, 0.0)
+            if wait > max_wait:
+                return None
+            self._tokens -= 1
+            if wait > 0:
+                self._waits += 1
+                self._queued += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def release(self) -> None:
+        """Give back a reservation that was not used."""
+        with self._lock:
+            self._tokens = min(self._tokens + 1, float(self.limit.burst))
+
+    def done_waiting(self) -> None:
+        with self._lock:
+            self._queued -= 1
+
+    def stats(self) -> BucketStats:
+        with self._lock:
+            self._refill(self._clock())
+            return BucketStats(
+                name=self.name,
+                tokens=round(self._tokens, 3),
+                rate=self.limit.rate,
+                burst=self.limit.burst,
+                waits=self._waits,
+                queued=self._queued,
+                total_wait_seconds=round(self._total_wait, 3),
+                max_wait_seconds=round(self._max_wait, 3),
+            )
+
+
+class RateLimiter:
+    """Global token bucket plus optional buckets per endpoint family.
+
+    ``acquire`` takes a token from the global bucket and from the family's bucket
+    (when one is configured) and sleeps until both are available. Calls that would
+    wait longer than ``max_wait_seconds`` fail with ``RateLimitError``.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_limit: BucketLimit | None = None,
+        family_limits: dict[str, BucketLimit] | None = None,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = cancellation.sleep,
+    ) -> None:
+        self._global = (
+            TokenBucket(GLOBAL_BUCKET, global_limit, clock=clock) if global_limit else None
+        )
+        self._families = {
+            family: TokenBucket(family, limit, clock=clock)
+            for family, limit in (family_limits or {}).items()
+        }
+        self._max_wait = max_wait_seconds
+        self._sleep = sleep
+
+    def acquire(self, family: str) -> float:
+        """Wait for a token for ``family``; return the seconds spent queued."""
+        buckets = [
+            bucket for bucket in (self._families.get(family), self._global) if bucket is not None
+        ]
+        reserved: list[tuple[TokenBucket, float]] = []
+        for bucket in buckets:
+            needed = bucket.reserve(self._max_wait)
+            if needed is None:
+                for taken, taken_wait in reserved:
+                    taken.release()
+                    if taken_wait > 0:
+                        taken.done_waiting()
+                logger.warning("ratelimit.rejected", family=family, bucket=bucket.name)
+                raise RateLimitError(
+                    f"Rate limit for '{bucket.name}' would queue this call for more than "
+                    f"{self._max_wait:g}s. Retry later or lower concurrency."
+                )
+            reserved.append((bucket, needed))
+        wait = max((needed for _, needed in reserved), default=0.0)
+        if wait > 0:
+            logger.info("ratelimit.waiting", family=family, wait=round(wait, 3))
+            try:
+                self._sleep(wait)
+            except BaseException:
+                # A cancelled or expired wait never makes its call, so hand the
+                # tokens back rather than charging the bucket for it.
+                for bucket, _ in reserved:
+                    bucket.release()
+                raise
+            finally:
+                for bucket, needed in reserved:
+                    if needed > 0:
+                        bucket.done_waiting()
+        return wait
+
+    def stats(self) -> list[BucketStats]:
+        buckets = [*self._families.values()]
+        if self._global is not None:
+            buckets.insert(0, self._global)
+        return [bucket.stats() for bucket in buckets]
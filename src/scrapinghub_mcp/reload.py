@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable
+
+import structlog
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POLL_SECONDS = 5.0
+NOTIFY_TIMEOUT_SECONDS = 5.0
+
+Signature = tuple[tuple[str, int | None, int | None], ...]
+
+
+def file_signature(paths: list[Path]) -> Signature:
+    """Return (path, mtime_ns, size) for each path, with None for missing files."""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append((str(path), None, None))
+        else:
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class AllowlistWatcher:
+    """Polls file mtimes and calls ``reload`` when any watched file changes.
+
+    ``paths`` is re-evaluated on every poll so files that appear later (a repo
+    override or a newly created config) are picked up. A failing reload is logged
+    and the previous state is kept until the files change again.
+    """
+
+    def __init__(
+        self,
+        paths: Callable[[], list[Path]],
+        reload: Callable[[], None],
+        *,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        if poll_seconds <= 0:
+            raise ValueError("poll_seconds must be positive.")
+        self._paths = paths
+        self._reload = reload
+        self._poll_seconds = poll_seconds
+        self._signature = file_signature(paths())
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> bool:
+        """Reload if the watched files changed since the last check."""
+        signature = file_signature(self._paths())
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            self._reload()
+        except Exception:
+            logger.exception("allowlist.reload_failed")
+            return False
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="scrapinghub-mcp-reload", daemon=True
+        )
+        self._thread.start()
+        logger.info("allowlist.watch_started", poll_seconds=self._poll_seconds)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_seconds):
+            self.check()
+
+
+class SessionTracker(Middleware):
+    """Remembers connected client sessions so background reloads can notify them."""
+
+    def __init__(self) -> None:
+        self._sessions: weakref.WeakKeyDictionary[Any, asyncio.AbstractEventLoop] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    async def on_request(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        fastmcp_context = context.fastmcp_context
+        if fastmcp_context is not None and fastmcp_context.request_context is not None:
+            with self._lock:
+                self._sessions[fastmcp_context.session] = asyncio.get_running_loop()
+        return await call_next(context)
+
+    def notify_tool_list_changed(self) -> int:
+        """Send tools/list_changed to every live session; return how many were notified."""
+        with self._lock:
+            sessions = list(self._sessions.items())
+        notified = 0
+        for session, loop in sessions:
+            try:
+                future = asyncio.run_coroutine_threadsafe(session.send_tool_list_changed(), loop)
+                future.result(timeout=NOTIFY_TIMEOUT_SECONDS)
+            except Exception:
+                logger.info("allowlist.notify_failed", exc_info=True)
+                with self._lock:
+                    self._sessions.pop(session, None)
+                continue
+            notified += 1
+        logger.info("allowlist.notified", sessions=notified)
+        return notified
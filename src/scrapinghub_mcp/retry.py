@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+import structlog
+
+from scrapinghub_mcp import cancellation
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_MAX_ELAPSED_SECONDS = 30.0
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS
+    max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS
+    max_elapsed_seconds: float = DEFAULT_MAX_ELAPSED_SECONDS
+    # Mutating operations are never retried unless they are listed here.
+    mutating_methods: frozenset[str] = field(default_factory=frozenset)
+
+
+def _http_response(exc: BaseException) -> Any:
+    from requests import HTTPError
+
+    # scrapinghub.client wraps HTTP errors (ServerError, ...) and keeps the original.
+    http_error = exc if isinstance(exc, HTTPError) else getattr(exc, "http_error", None)
+    return getattr(http_error, "response", None)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return whether ``exc`` is a transient upstream failure worth retrying."""
+    from requests import ConnectionError, Timeout
+    from scrapinghub.legacy import APIError
+
+    if isinstance(exc, (ConnectionError, Timeout)):
+        return True
+    if isinstance(exc, APIError):
+        return exc._type == APIError.ERR_SERVER_ERROR
+    return getattr(_http_response(exc), "status_code", None) in RETRY_STATUSES
+
+
+def retry_after_seconds(exc: BaseException, now: float | None = None) -> float | None:
+    """Parse ``Retry-After`` (delta seconds or HTTP date) from the failed response."""
+    headers = getattr(_http_response(exc), "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+class Retrier:
+    """Calls a function again on transient failures, with capped exponential backoff.
+
+    Delays use full jitter (uniform between zero and the backoff step) unless the
+    server sent ``Retry-After``. Attempts stop at ``max_attempts``, when the next
+    delay would pass ``max_elapsed_seconds`` since the first attempt, or as soon as
+    the tool call is cancelled or its deadline is reached.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        *,
+        sleep: Callable[[float], None] = cancellation.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.policy = RetryPolicy() if policy is None else policy
+        self._sleep = sleep
+        self._clock = clock
+        self._jitter = jitter
+
+    def allows(self, method_name: str, *, mutating: bool) -> bool:
+        return not mutating or method_name in self.policy.mutating_methods
+
+    def delay_for(self, attempt: int, exc: BaseException) -> float:
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            return retry_after
+        step = min(
+            self.policy.max_delay_seconds,
+            self.policy.base_delay_seconds * 2 ** (attempt - 1),
+        )
+        return step * self._jitter()
+
+    def call(self, func: Callable[[], T], **log_fields: Any) -> T:
+        started = self._clock()
+        attempt = 1
+        while True:
+            try:
+                result = func()
+            except Exception as exc:
+                interrupted = cancellation.interruption()
+                if interrupted is not None:
+                    raise interrupted from exc
+                if attempt >= self.policy.max_attempts or not is_retryable(exc):
+                    if attempt > 1:
+                        logger.warning("retry.exhausted", retries=attempt - 1, **log_fields)
+                    raise
+                delay = self.delay_for(attempt, exc)
+                elapsed = self._clock() - started
+                if elapsed + delay > self.policy.max_elapsed_seconds:
+                    logger.warning(
+                        "retry.exhausted", retries=attempt - 1, elapsed=elapsed, **log_fields
+                    )
+                    raise
+                logger.info(
+                    "retry.scheduled",
+                    attempt=attempt,
+                    delay=round(delay, 3),
+                    error=type(exc).__name__,
+                    **log_fields,
+                )
+                self._sleep(delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                logger.info("retry.succeeded", retries=attempt - 1, **log_fields)
+            return result
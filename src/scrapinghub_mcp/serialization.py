@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import inspect
+import json
+import re
+import secrets
+from typing import Any, Callable, Sequence
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+SERIALIZER_BACKENDS = ("orjson", "json")
+
+
+class EncodedArray:
+    """A JSON array whose elements are already encoded.
+
+    The serializer splices the encoded elements into its output instead of
+    encoding the values again.
+    """
+
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: Sequence[bytes]) -> None:
+        self.elements = elements
+
+    def encode(self) -> bytes:
+        return b"[" + b",".join(self.elements) + b"]"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        # Models may substitute pre-encoded values for some fields (see EncodedArray).
+        json_fields = getattr(value, "json_fields", None)
+        return json_fields() if callable(json_fields) else dict(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("utf-8", errors="replace")
+    if isinstance(value, (dt.datetime, dt.date, dt.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _orjson_default(value: Any) -> Any:
+    assert orjson is not None
+    if isinstance(value, EncodedArray):
+        return orjson.Fragment(value.encode())
+    return _default(value)
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    assert orjson is not None
+    return orjson.dumps(value, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_dumps(value: Any) -> bytes:
+    # The stdlib encoder cannot emit raw JSON, so encoded arrays are written as
+    # placeholder strings (control characters are always escaped) and swapped in after.
+    fragments: list[bytes] = []
+    token = secrets.token_hex(8)
+
+    def default(value: Any) -> Any:
+        if isinstance(value, EncodedArray):
+            fragments.append(value.encode())
+            return f"\x00{token}:{len(fragments) - 1}\x00"
+        return _default(value)
+
+    data = json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    if not fragments:
+        return data
+    placeholder = re.compile(rb'"\\u0000' + token.encode() + rb':(\d+)\\u0000"')
+    return placeholder.sub(lambda match: fragments[int(match.group(1))], data)
+
+
+class Serializer:
+    """Encodes tool results and upstream items to JSON bytes.
+
+    Uses orjson when it is installed and the stdlib ``json`` module otherwise.
+    Values JSON cannot represent natively (bytes, datetimes, pydantic models) are
+    converted on the fly, falling back to ``str()``. ``EncodedArray`` values are
+    copied into the output as they are.
+    """
+
+    def __init__(self, backend: str | None = None) -> None:
+        if backend is None:
+            backend = "orjson" if orjson is not None else "json"
+        if backend not in SERIALIZER_BACKENDS:
+            raise ValueError(f"Unknown serializer backend '{backend}'.")
+        if backend == "orjson" and orjson is None:
+            raise ValueError("The orjson serializer backend requires orjson to be installed.")
+        self.backend = backend
+        self._dumps: Callable[[Any], bytes] = _orjson_dumps if backend == "orjson" else _json_dumps
+        self._loads: Callable[[str | bytes], Any] = (
+            orjson.loads if backend == "orjson" and orjson is not None else json.loads
+        )
+
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value)
+
+    def dumps_text(self, value: Any) -> str:
+        return self._dumps(value).decode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._loads(data)
+
+
+default_serializer = Serializer()
+
+
+def tool_result(value: Any, serialize: Callable[[Any], str]) -> Any:
+    """Encode ``value`` once into a FastMCP ``ToolResult``.
+
+    FastMCP would serialize a returned model for the text content and then convert
+    it again with ``to_jsonable_python`` for the structured content. Here the
+    structured content is decoded from the encoded text instead.
+    """
+    from fastmcp.tools.tool import ToolResult
+    from mcp.types import TextContent
+
+    text = serialize(value)
+    result = ToolResult(content=[TextContent(type="text", text=text)])
+    # Assigned after construction: the decoded payload is already plain JSON, so the
+    # conversion ToolResult.__init__ applies to structured content is skipped.
+    result.structured_content = default_serializer.loads(text)
+    return result
+
+
+def returning_tool_results(
+    func: Callable[..., Any], serialize: Callable[[Any], str]
+) -> Callable[..., Any]:
+    """Wrap a tool function so it returns ``tool_result`` of its result.
+
+    The wrapper keeps ``func``'s signature and annotations, so FastMCP derives the
+    same input and output schemas.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return tool_result(await func(*args, **kwargs), serialize)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return tool_result(func(*args, **kwargs), serialize)
+
+    return wrapper
@@ -1,23 +1,119 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import os
 import sys
+import threading
+import time
 import tomllib
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
 from importlib import resources
 from pathlib import Path
-from typing import Any, Callable, Protocol, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Literal,
+    NoReturn,
+    Protocol,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
-import jsonschema
 import pydantic_core
 import structlog
-import yaml
-from dotenv import load_dotenv
-from fastmcp import FastMCP
-from pydantic import BaseModel, ConfigDict, Field
-from requests import HTTPError
-from scrapinghub import ScrapinghubClient
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+
+from scrapinghub_mcp._http_defaults import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_STATS_EVERY,
+)
+from scrapinghub_mcp.aggregation import RequestStatsAccumulator, RequestStatsSummary
+from scrapinghub_mcp.cache import (
+    DEFAULT_MAX_RESPONSES,
+    CacheStats,
+    ProjectHandleCache,
+    ResponseCache,
+    SingleFlight,
+)
+from scrapinghub_mcp.cancellation import (
+    CancelScope,
+    ToolCancelled,
+    checked,
+    current_scope,
+    interruption,
+)
+from scrapinghub_mcp.circuit import (
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_SECONDS,
+    CircuitBreakers,
+    CircuitOpenError,
+    CircuitStats,
+)
+from scrapinghub_mcp.execution import DEFAULT_MAX_WORKERS, ExecutorStats, ToolExecutor
+from scrapinghub_mcp.metrics import (
+    DEFAULT_TEXTFILE_INTERVAL_SECONDS,
+    MetricsRegistry,
+    StageTimer,
+    TextfileExporter,
+    metered_serializer,
+    producing,
+    serializer_middleware,
+    timed,
+    upstream_call,
+)
+from scrapinghub_mcp.pagination import (
+    DEFAULT_CURSOR_TTL_SECONDS,
+    DEFAULT_MAX_CURSORS,
+    MAX_PAGE_SIZE,
+    CursorError,
+    CursorStore,
+    Page,
+)
+from scrapinghub_mcp.ratelimit import (
+    DEFAULT_MAX_WAIT_SECONDS,
+    BucketLimit,
+    BucketStats,
+    RateLimiter,
+    RateLimitError,
+)
+from scrapinghub_mcp.retry import (
+    DEFAULT_BASE_DELAY_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_DELAY_SECONDS,
+    DEFAULT_MAX_ELAPSED_SECONDS,
+    Retrier,
+    RetryPolicy,
+)
+from scrapinghub_mcp.serialization import (
+    EncodedArray,
+    default_serializer,
+    returning_tool_results,
+)
+from scrapinghub_mcp.spill import (
+    DEFAULT_MAX_SPILL_FILES,
+    SPILL_URI_PREFIX,
+    SpillError,
+    SpillFile,
+    SpillStore,
+)
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+    from scrapinghub_mcp.http_pool import PooledAdapter
+    from scrapinghub_mcp.reload import AllowlistWatcher
+
+# jsonschema, yaml, dotenv, requests, scrapinghub, and fastmcp are imported where they
+# are first used: each stdio session is a fresh process, so startup cost adds up.
 
 
 class MCPProtocol(Protocol):
@@ -27,8 +123,11 @@ class MCPProtocol(Protocol):
         self, name: str | None = None
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
+    def remove_tool(self, name: str) -> None: ...
+
 
 MCPType = TypeVar("MCPType", bound=MCPProtocol)
+T = TypeVar("T")
 
 
 class HasModelDump(Protocol):
@@ -43,7 +142,27 @@ API_KEY_ENV = "SCRAPINGHUB_API_KEY"
 DOCS_URL = "https://github.com/lambdamechanic/scrapinghub-mcp"
 ALLOWLIST_FILENAME = "scrapinghub-mcp.allowlist.yaml"
 ALLOWLIST_SCHEMA_FILENAME = "allowlist-schema.json"
+EXECUTION_MODES = ("async", "sync")
+CONTROL_FIELDS = frozenset({"max_age", "page_size", "cursor", "max_bytes", "deadline_ms"})
+BATCH_TOOL_NAME = "batch_call"
+SERVER_STATS_TOOL_NAME = "server_stats"
+MAX_BATCH_CALLS = 100
+DEFAULT_BATCH_CONCURRENCY = 4
+DEFAULT_FANOUT_CONCURRENCY = 8
+MAX_FANOUT_CONCURRENCY = 32
+DEFAULT_ITEMS_PAGE_SIZE = 1000
+DEFAULT_LOG_TAIL_LINES = 500
+DEFAULT_TOP_DOMAINS = 20
+MAX_TOP_DOMAINS = 1000
+FANOUT_PREFIX = "fanout."
+_FAMILY_ALIASES = {"get_job": "project.jobs", "get_project": "projects", "close": "client"}
+DEFAULT_HTTP_TIMEOUT_SECONDS = 60.0
 _ALLOWLIST_SCHEMA: dict[str, object] | None = None
+_CONFIG_LOCK = threading.Lock()
+_FANOUT_POOL: ThreadPoolExecutor | None = None
+_FANOUT_POOL_LOCK = threading.Lock()
+_CONFIG_PATHS: dict[Path, Path] = {}
+_CONFIG_SNAPSHOTS: dict[Path, tuple[tuple[int, int], ServerConfig]] = {}
 logger = structlog.get_logger(__name__)
 
 
@@ -57,32 +176,78 @@ class ConfigError(RuntimeError):
 JsonValue = dict[str, Any] | list[Any] | str | int | float | bool | None
 
 
-class EmptyParams(BaseModel):
+class ToolParams(BaseModel):
     model_config = ConfigDict(extra="forbid")
+    deadline_ms: int | None = Field(
+        default=None,
+        ge=1,
+        description="Abort the call after this many milliseconds; overrides the tool default.",
+    )
 
 
-class ProjectParams(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+class EmptyParams(ToolParams):
+    pass
+
+
+class ProjectParams(ToolParams):
     project_id: int = Field(..., description="Scrapinghub project id.")
 
 
-class ProjectsSummaryParams(BaseModel):
+class CacheControlParams(ToolParams):
+    max_age: float | None = Field(
+        default=None,
+        ge=0,
+        description="Maximum age in seconds of a cached response; 0 forces a fresh call.",
+    )
+
+
+class PageParams(CacheControlParams):
+    page_size: int | None = Field(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Return at most this many items plus a next_cursor for the rest.",
+    )
+    cursor: str | None = Field(
+        default=None,
+        min_length=1,
+        description="Opaque next_cursor from a previous page; other filters are ignored.",
+    )
+    max_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Stop adding items once their serialized size would exceed this many bytes; "
+            "the response is then marked truncated with a next_cursor for the rest."
+        ),
+    )
+
+
+class ProjectPageParams(ProjectParams, PageParams):
+    pass
+
+
+class ProjectsListParams(PageParams):
+    pass
+
+
+class ProjectsSummaryParams(CacheControlParams):
     model_config = ConfigDict(extra="forbid")
     state: str | list[str] | None = Field(
         default=None, description="Filter summaries by job state."
     )
 
 
-class ProjectsGetParams(BaseModel):
+class ProjectsGetParams(CacheControlParams):
     model_config = ConfigDict(extra="forbid")
     project_id: int = Field(..., description="Scrapinghub project id.")
 
 
-class ProjectsIterParams(EmptyParams):
+class ProjectsIterParams(PageParams):
     pass
 
 
-class JobsListParams(ProjectParams):
+class JobsListParams(ProjectParams, PageParams):
     count: int | None = None
     start: int | None = None
     spider: str | None = None
@@ -99,7 +264,7 @@ class JobsIterParams(JobsListParams):
     pass
 
 
-class JobsCountParams(ProjectParams):
+class JobsCountParams(ProjectParams, CacheControlParams):
     spider: str | None = None
     state: str | list[str] | None = None
     has_tag: str | list[str] | None = None
@@ -109,13 +274,13 @@ class JobsCountParams(ProjectParams):
     params: dict[str, JsonValue] | None = None
 
 
-class JobsSummaryParams(ProjectParams):
+class JobsSummaryParams(ProjectParams, PageParams):
     state: str | list[str] | None = None
     spider: str | None = None
     params: dict[str, JsonValue] | None = None
 
 
-class JobsIterLastParams(ProjectParams):
+class JobsIterLastParams(ProjectParams, PageParams):
     start: int | None = None
     start_after: int | None = None
     count: int | None = None
@@ -123,7 +288,7 @@ class JobsIterLastParams(ProjectParams):
     params: dict[str, JsonValue] | None = None
 
 
-class JobsGetParams(ProjectParams):
+class JobsGetParams(ProjectParams, CacheControlParams):
     job_key: str = Field(
         ...,
         description="Job key in the form project_id/spider_id/job_id.",
@@ -156,16 +321,16 @@ class JobsUpdateTagsParams(ProjectParams):
     spider: str | None = None
 
 
-class SpidersGetParams(ProjectParams):
+class SpidersGetParams(ProjectParams, CacheControlParams):
     spider: str = Field(..., description="Spider name or id.")
     params: dict[str, JsonValue] | None = None
 
 
-class ActivityListParams(ProjectParams):
+class ActivityListParams(ProjectParams, PageParams):
     params: dict[str, JsonValue] | None = None
 
 
-class ActivityIterParams(ProjectParams):
+class ActivityIterParams(ProjectParams, PageParams):
     count: int | None = None
     params: dict[str, JsonValue] | None = None
 
@@ -175,16 +340,16 @@ class ActivityAddParams(ProjectParams):
     params: dict[str, JsonValue] | None = None
 
 
-class CollectionsGetParams(ProjectParams):
+class CollectionsGetParams(ProjectParams, CacheControlParams):
     type_: str
     name: str
 
 
-class CollectionsNameParams(ProjectParams):
+class CollectionsNameParams(ProjectParams, CacheControlParams):
     name: str
 
 
-class FrontiersNameParams(ProjectParams):
+class FrontiersNameParams(ProjectParams, CacheControlParams):
     name: str
 
 
@@ -192,6 +357,10 @@ class SettingsKeyParams(ProjectParams):
     key: str
 
 
+class SettingsGetParams(SettingsKeyParams, CacheControlParams):
+    pass
+
+
 class SettingsSetParams(ProjectParams):
     key: str
     value: JsonValue
@@ -201,11 +370,11 @@ class SettingsUpdateParams(ProjectParams):
     values: dict[str, JsonValue]
 
 
-class SettingsListParams(ProjectParams):
+class SettingsListParams(ProjectParams, PageParams):
     params: dict[str, JsonValue] | None = None
 
 
-class GetJobParams(BaseModel):
+class GetJobParams(CacheControlParams):
     model_config = ConfigDict(extra="forbid")
     job_key: str = Field(
         ...,
@@ -214,19 +383,134 @@ class GetJobParams(BaseModel):
     )
 
 
-class GetProjectParams(BaseModel):
+class JobItemsIterParams(PageParams):
+    job_key: str = Field(
+        ...,
+        description="Job key in the form project_id/spider_id/job_id.",
+        min_length=1,
+    )
+    page_size: int = Field(
+        default=DEFAULT_ITEMS_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Return at most this many items plus a next_cursor for the rest.",
+    )
+    count: int | None = Field(default=None, ge=1, description="Stop after this many items.")
+    start: int | None = Field(default=None, ge=0, description="Index of the first item to read.")
+    fields: list[str] | None = Field(
+        default=None, min_length=1, description="Only return these item fields."
+    )
+    filter: list[tuple[str, str, list[JsonValue]]] | None = Field(
+        default=None,
+        description='Filters applied by Scrapinghub, e.g. [["size", ">", [30000]]].',
+    )
+    meta: list[str] | None = Field(
+        default=None, description="Item metadata fields to include, e.g. _key or _ts."
+    )
+
+
+class JobLogsTailParams(CacheControlParams):
+    job_key: str = Field(
+        ...,
+        description="Job key in the form project_id/spider_id/job_id.",
+        min_length=1,
+    )
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = Field(
+        default=None, description="Only return lines at or above this level."
+    )
+    offset: int = Field(
+        default=0, ge=0, description="next_offset from a previous call; 0 reads from the start."
+    )
+    count: int = Field(
+        default=DEFAULT_LOG_TAIL_LINES,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Return at most this many lines.",
+    )
+
+
+class JobRequestsStatsParams(CacheControlParams):
+    job_key: str = Field(
+        ...,
+        description="Job key in the form project_id/spider_id/job_id.",
+        min_length=1,
+    )
+    count: int | None = Field(
+        default=None, ge=1, description="Only aggregate the first this many requests."
+    )
+    top_domains: int = Field(
+        default=DEFAULT_TOP_DOMAINS,
+        ge=1,
+        le=MAX_TOP_DOMAINS,
+        description="Number of busiest domains to report.",
+    )
+
+
+class GetProjectParams(CacheControlParams):
     model_config = ConfigDict(extra="forbid")
     project_id: int = Field(..., description="Scrapinghub project id.")
 
 
-class CloseClientParams(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+class CloseClientParams(ToolParams):
     timeout: float | None = None
 
 
+class FanOutParams(CacheControlParams):
+    project_ids: list[int] | None = Field(
+        default=None,
+        min_length=1,
+        description="Projects to query; defaults to every project from projects.list.",
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_FANOUT_CONCURRENCY,
+        ge=1,
+        le=MAX_FANOUT_CONCURRENCY,
+        description="Maximum number of projects queried at once.",
+    )
+
+
+class FanOutJobsSummaryParams(FanOutParams):
+    state: str | list[str] | None = None
+    spider: str | None = None
+    params: dict[str, JsonValue] | None = None
+
+
+class FanOutJobsCountParams(FanOutParams):
+    spider: str | None = None
+    state: str | list[str] | None = None
+    has_tag: str | list[str] | None = None
+    lacks_tag: str | list[str] | None = None
+    startts: int | None = None
+    endts: int | None = None
+    params: dict[str, JsonValue] | None = None
+
+
+class FanOutSpidersListParams(FanOutParams):
+    pass
+
+
+class BatchCallEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    tool: str = Field(..., min_length=1, description="Name of the tool to call.")
+    params: dict[str, JsonValue] | None = Field(
+        default=None, description="Params for the tool, as it would receive them directly."
+    )
+
+
+class BatchCallParams(ToolParams):
+    calls: list[BatchCallEntry] = Field(..., min_length=1, max_length=MAX_BATCH_CALLS)
+    max_concurrency: int = Field(
+        default=DEFAULT_BATCH_CONCURRENCY,
+        ge=1,
+        description="Maximum number of calls from this batch running at once.",
+    )
+
+
 class ListProjectsResult(BaseModel):
     model_config = ConfigDict(extra="forbid")
     items: list[int]
+    next_cursor: str | None = None
+    truncated: bool = False
 
 
 class ProjectSummaryItem(BaseModel):
@@ -256,9 +540,59 @@ class GetProjectResult(BaseModel):
     key: str
 
 
+class SpillInfo(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    uri: str
+    rows: int
+    bytes: int
+
+
 class ItemsResult(BaseModel):
     model_config = ConfigDict(extra="forbid")
     items: list[JsonValue]
+    next_cursor: str | None = None
+    truncated: bool = False
+    spill: SpillInfo | None = None
+    # Encodings of ``items`` kept from sizing a budgeted page, reused by the serializer.
+    _encoded_items: list[bytes] | None = PrivateAttr(default=None)
+
+    def json_fields(self) -> dict[str, Any]:
+        fields = dict(self)
+        if self._encoded_items is not None:
+            fields["items"] = EncodedArray(self._encoded_items)
+        return fields
+
+
+class LogTailResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    lines: list[JsonValue]
+    next_offset: int
+
+
+class DomainCount(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    domain: str
+    count: int
+
+
+class DurationStats(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    count: int
+    mean: float | None
+    min: float | None
+    max: float | None
+    percentiles: dict[str, float | None]
+
+
+class RequestStatsResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    total: int
+    status_counts: dict[str, int]
+    top_domains: list[DomainCount]
+    tracked_domains: int
+    domains_truncated: bool
+    untracked_domain_requests: int
+    duration_ms: DurationStats
 
 
 class ResultWrapper(BaseModel):
@@ -281,6 +615,148 @@ class CloseClientResult(BaseModel):
     closed: bool
 
 
+class ProjectFanOutEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    project_id: int
+    ok: bool
+    result: JsonValue = None
+    error: str | None = None
+
+
+class FanOutResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    items: list[ProjectFanOutEntry]
+    failed: int
+
+
+class FanOutCountResult(FanOutResult):
+    total: int
+
+
+class BatchCallOutcome(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    tool: str
+    ok: bool
+    result: dict[str, JsonValue] | None = None
+    error: str | None = None
+
+
+class BatchCallResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    results: list[BatchCallOutcome]
+
+
+class StageLatency(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    count: int
+    total_seconds: float
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p99_seconds: float | None
+
+
+class ToolStatsEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    tool: str
+    calls: int
+    errors: int
+    items: int
+    bytes: int
+    latency: dict[str, StageLatency]
+
+
+class HttpPoolStatsEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    session: str
+    host: str
+    requests: int
+    new_connections: int
+    hits: int
+
+
+class ServerStatsResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    uptime_seconds: float
+    tools: list[ToolStatsEntry]
+    executor: ExecutorStats | None = None
+    caches: dict[str, CacheStats] = Field(default_factory=dict)
+    rate_limits: list[BucketStats] = Field(default_factory=list)
+    circuits: list[CircuitStats] = Field(default_factory=list)
+    http_pools: list[HttpPoolStatsEntry] = Field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    mode: str = "async"
+    max_workers: int = DEFAULT_MAX_WORKERS
+
+
+@dataclass(frozen=True)
+class PaginationConfig:
+    cursor_ttl_seconds: float = DEFAULT_CURSOR_TTL_SECONDS
+    max_cursors: int = DEFAULT_MAX_CURSORS
+    max_bytes: int | None = None
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    default_ttl_seconds: float = 0.0
+    ttl_seconds: dict[str, float] = field(default_factory=dict)
+    max_entries: int = DEFAULT_MAX_RESPONSES
+
+
+@dataclass(frozen=True)
+class SpillConfig:
+    threshold_bytes: int | None = None
+    directory: Path | None = None
+    max_files: int = DEFAULT_MAX_SPILL_FILES
+
+
+@dataclass(frozen=True)
+class ReloadConfig:
+    poll_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class WarmupConfig:
+    enabled: bool = False
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    textfile: Path | None = None
+    textfile_interval_seconds: float = DEFAULT_TEXTFILE_INTERVAL_SECONDS
+
+
+@dataclass(frozen=True)
+class DeadlineConfig:
+    default_ms: int | None = None
+    tools: dict[str, int] = field(default_factory=dict)
+
+    def for_tool(self, tool_name: str) -> int | None:
+        return self.tools.get(tool_name, self.default_ms)
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    pool_size: int = DEFAULT_POOL_SIZE
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    keep_alive: bool = True
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    stats_every: int = DEFAULT_STATS_EVERY
+
+    @property
+    def timeout(self) -> tuple[float, float] | None:
+        """Per-request (connect, read) timeout, or None to keep the client default."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (
+            self.connect_timeout or DEFAULT_HTTP_TIMEOUT_SECONDS,
+            self.read_timeout or DEFAULT_HTTP_TIMEOUT_SECONDS,
+        )
+
+
 @dataclass(frozen=True)
 class ToolSpec:
     method_name: str
@@ -294,8 +770,8 @@ class ToolSpec:
 def _model_kwargs(params: HasModelDump, *, exclude: set[str]) -> dict[str, Any]:
     data = params.model_dump(exclude_none=True)
     extra = data.pop("params", None)
-    for field in exclude:
-        data.pop(field, None)
+    for name in exclude | CONTROL_FIELDS:
+        data.pop(name, None)
     if isinstance(extra, dict):
         merged = dict(extra)
         merged.update(data)
@@ -303,6 +779,89 @@ def _model_kwargs(params: HasModelDump, *, exclude: set[str]) -> dict[str, Any]:
     return data
 
 
+def _is_page_request(params: BaseModel, max_bytes: int | None = None) -> bool:
+    return isinstance(params, PageParams) and (
+        params.page_size is not None or params.cursor is not None or max_bytes is not None
+    )
+
+
+def _byte_budget(params: BaseModel, server_max_bytes: int | None) -> int | None:
+    requested = params.max_bytes if isinstance(params, PageParams) else None
+    if requested is None or server_max_bytes is None:
+        return requested if requested is not None else server_max_bytes
+    return min(requested, server_max_bytes)
+
+
+def _items_returned(output: BaseModel) -> int:
+    spill = getattr(output, "spill", None)
+    if isinstance(spill, SpillInfo):
+        return spill.rows
+    for name in ("items", "lines", "results"):
+        value = getattr(output, name, None)
+        if isinstance(value, list):
+            return len(value)
+    return 0
+
+
+def _tool_stats_entries(metrics: MetricsRegistry) -> list[ToolStatsEntry]:
+    return [
+        ToolStatsEntry(
+            tool=stats.tool,
+            calls=stats.calls,
+            errors=stats.errors,
+            items=stats.items,
+            bytes=stats.bytes,
+            latency={
+                stage: StageLatency(
+                    count=histogram.count,
+                    total_seconds=round(histogram.sum, 6),
+                    p50_seconds=histogram.quantile(0.5),
+                    p95_seconds=histogram.quantile(0.95),
+                    p99_seconds=histogram.quantile(0.99),
+                )
+                for stage, histogram in stats.latency.items()
+                if histogram.count
+            },
+        )
+        for stats in metrics.snapshot()
+    ]
+
+
+def _http_pool_entries(adapters: Sequence[PooledAdapter]) -> list[HttpPoolStatsEntry]:
+    return [
+        HttpPoolStatsEntry(
+            session=adapter.name,
+            host=stats.host,
+            requests=stats.requests,
+            new_connections=stats.new_connections,
+            hits=stats.hits,
+        )
+        for adapter in adapters
+        for stats in adapter.stats()
+    ]
+
+
+def _deadline_seconds(deadline_ms: int | None) -> float | None:
+    return None if deadline_ms is None else deadline_ms / 1000
+
+
+def _response_cache_key(params: BaseModel) -> str:
+    data = params.model_dump(exclude_none=True, exclude={"max_age", "deadline_ms"})
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _params_project_id(params: BaseModel) -> int | None:
+    project_id = getattr(params, "project_id", None)
+    if isinstance(project_id, int):
+        return project_id
+    job_key = getattr(params, "job_key", None)
+    if isinstance(job_key, str):
+        head = job_key.split("/", 1)[0]
+        if head.isdigit():
+            return int(head)
+    return None
+
+
 def _to_jsonable(value: Any) -> JsonValue:
     try:
         return cast(JsonValue, pydantic_core.to_jsonable_python(value))
@@ -320,13 +879,23 @@ def _collect_items(result: Any) -> list[Any]:
     if isinstance(result, list):
         return result
     if hasattr(result, "__iter__"):
-        return list(result)
+        return list(timed(checked(iter(result))))
     return [result]
 
 
+def _iter_items(result: Any) -> Iterator[Any]:
+    if isinstance(result, (dict, bytes, str)) or not hasattr(result, "__iter__"):
+        return iter(_collect_items(result))
+    return timed(checked(iter(result)))
+
+
 def _build_items_result(result: Any) -> BaseModel:
-    items = [_to_jsonable(item) for item in _collect_items(result)]
-    return ItemsResult(items=items)
+    # Upstream dicts are decoded JSON/msgpack and go to the serializer as-is; other items
+    # are converted here. Either way items are JSON-compatible, so skip re-validating them.
+    items = [
+        item if isinstance(item, dict) else _to_jsonable(item) for item in _collect_items(result)
+    ]
+    return ItemsResult.model_construct(items=items)
 
 
 def _build_result_wrapper(result: Any) -> BaseModel:
@@ -389,6 +958,47 @@ def _build_get_project_result(result: Any) -> BaseModel:
     return GetProjectResult(project_id=project_id, key=key)
 
 
+def _build_fan_out_result(result: Any) -> BaseModel:
+    items = cast(list[ProjectFanOutEntry], result)
+    return FanOutResult(items=items, failed=sum(1 for item in items if not item.ok))
+
+
+def _build_fan_out_count_result(result: Any) -> BaseModel:
+    items = cast(list[ProjectFanOutEntry], result)
+    total = sum(item.result for item in items if item.ok and isinstance(item.result, int))
+    return FanOutCountResult(
+        items=items, failed=sum(1 for item in items if not item.ok), total=total
+    )
+
+
+def _build_log_tail_result(result: Any) -> BaseModel:
+    lines, next_offset = cast(tuple[list[Any], int], result)
+    return LogTailResult.model_construct(
+        lines=[_to_jsonable(line) for line in lines], next_offset=next_offset
+    )
+
+
+def _build_request_stats_result(result: Any) -> BaseModel:
+    summary = cast(RequestStatsSummary, result)
+    return RequestStatsResult(
+        total=summary.total,
+        status_counts=summary.status_counts,
+        top_domains=[
+            DomainCount(domain=domain, count=count) for domain, count in summary.top_domains
+        ],
+        tracked_domains=summary.tracked_domains,
+        domains_truncated=summary.domains_truncated,
+        untracked_domain_requests=summary.untracked_domain_requests,
+        duration_ms=DurationStats(
+            count=summary.duration_count,
+            mean=summary.duration_mean,
+            min=summary.duration_min,
+            max=summary.duration_max,
+            percentiles=summary.duration_percentiles,
+        ),
+    )
+
+
 def _build_close_client_result(_: Any) -> BaseModel:
     return CloseClientResult(closed=True)
 
@@ -405,6 +1015,73 @@ def _call_projects_method(client: Any, method_name: str, params: BaseModel) -> A
     return method(**kwargs) if kwargs else method()
 
 
+def _endpoint_family(method_name: str) -> str:
+    """Group operations by upstream resource, e.g. project.jobs.iter -> project.jobs."""
+    name = method_name.removeprefix(FANOUT_PREFIX)
+    if name in _FAMILY_ALIASES:
+        return _FAMILY_ALIASES[name]
+    parts = name.split(".")
+    return ".".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+class _UpstreamGuard:
+    """Applies the endpoint family's circuit breaker and rate limits around one call."""
+
+    def __init__(self, limiter: RateLimiter | None, breakers: CircuitBreakers | None) -> None:
+        self._limiter = limiter
+        self._breakers = breakers
+
+    def call(self, method_name: str, func: Callable[[], T]) -> T:
+        family = _endpoint_family(method_name)
+        breaker = None if self._breakers is None else self._breakers.get(family)
+        if breaker is not None:
+            # Checked before queueing for a token so an open circuit fails fast.
+            breaker.before_call()
+        try:
+            if self._limiter is not None:
+                self._limiter.acquire(family)
+            result = func()
+        except RateLimitError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception as exc:
+            if breaker is not None:
+                # A call aborted by its caller says nothing about the endpoint's health.
+                if interruption() is None:
+                    breaker.record_error(exc)
+                else:
+                    breaker.release()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+class _ProjectCachingClient:
+    """Delegates to a Scrapinghub client, serving get_project from a shared handle cache."""
+
+    def __init__(
+        self, client: Any, projects: ProjectHandleCache, guard: _UpstreamGuard | None = None
+    ) -> None:
+        self._client = client
+        self._projects = projects
+        self._guard = guard
+
+    def get_project(self, project_id: int) -> Any:
+        return self._projects.get(project_id)
+
+    def call_upstream(self, method_name: str, func: Callable[[], T]) -> T:
+        return func() if self._guard is None else self._guard.call(method_name, func)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
 def _call_project_method(client: Any, resource: str, method_name: str, params: HasProjectId) -> Any:
     project = client.get_project(params.project_id)
     target = getattr(project, resource)
@@ -413,10 +1090,150 @@ def _call_project_method(client: Any, resource: str, method_name: str, params: H
     return method(**kwargs) if kwargs else method()
 
 
+def _project_fields(items: Iterator[Any], fields: list[str]) -> Iterator[Any]:
+    try:
+        for item in items:
+            if isinstance(item, dict):
+                yield {name: item[name] for name in fields if name in item}
+            else:
+                yield item
+    finally:
+        close = getattr(items, "close", None)
+        if callable(close):
+            close()
+
+
+def _call_job_items_iter(client: Any, params: JobItemsIterParams) -> Iterator[Any]:
+    job = client.get_job(params.job_key)
+    kwargs = _model_kwargs(params, exclude={"job_key", "start", "fields"})
+    if params.start is not None:
+        kwargs["start"] = f"{params.job_key}/{params.start}"
+    items = job.items.iter(**kwargs)
+    if params.fields is None:
+        return items
+    return _project_fields(items, list(params.fields) + list(params.meta or []))
+
+
+def _call_job_logs_tail(client: Any, params: JobLogsTailParams) -> tuple[list[Any], int]:
+    job = client.get_job(params.job_key)
+    kwargs = _model_kwargs(params, exclude={"job_key"})
+    lines: list[Any] = []
+    next_offset = params.offset
+    for entry in checked(job.logs.iter(meta=["_key"], **kwargs)):
+        key = entry.pop("_key", None) if isinstance(entry, dict) else None
+        index = key.rsplit("/", 1)[-1] if isinstance(key, str) else ""
+        next_offset = int(index) + 1 if index.isdigit() else next_offset + 1
+        lines.append(entry)
+    return lines, next_offset
+
+
+def _call_job_requests_stats(client: Any, params: JobRequestsStatsParams) -> RequestStatsSummary:
+    job = client.get_job(params.job_key)
+    kwargs = _model_kwargs(params, exclude={"job_key", "top_domains"})
+    stats = RequestStatsAccumulator()
+    stats.add_all(checked(job.requests.iter(**kwargs)))
+    return stats.summary(top_domains=params.top_domains)
+
+
+def _fan_out_items(value: Any) -> JsonValue:
+    return [_to_jsonable(item) for item in _collect_items(value)]
+
+
+def _fan_out_count(value: Any) -> JsonValue:
+    return _build_count_result(value).model_dump()["count"]
+
+
+def _fan_out_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for per-project calls, shared by every fan-out tool call."""
+    global _FANOUT_POOL
+    with _FANOUT_POOL_LOCK:
+        if _FANOUT_POOL is None:
+            _FANOUT_POOL = ThreadPoolExecutor(
+                max_workers=MAX_FANOUT_CONCURRENCY, thread_name_prefix="scrapinghub-mcp-fanout"
+            )
+        return _FANOUT_POOL
+
+
+def _run_fan_out(funcs: list[Callable[[], T]], limit: int) -> list[T]:
+    """Run ``funcs`` on the shared fan-out pool with at most ``limit`` in flight, in order.
+
+    Concurrent fan-out calls share ``MAX_FANOUT_CONCURRENCY`` threads, so upstream
+    parallelism stays bounded however many tool workers run fan-outs at once.
+    """
+    pool = _fan_out_pool()
+    results: list[T | None] = [None] * len(funcs)
+    waiting = iter(enumerate(funcs))
+    running: dict[Future[T], int] = {}
+
+    def submit_next() -> None:
+        for index, func in waiting:
+            # Copy the context per call so each one sees the tool call's cancel scope.
+            running[pool.submit(contextvars.copy_context().run, func)] = index
+            return
+
+    for _ in range(limit):
+        submit_next()
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[running.pop(future)] = future.result()
+            submit_next()
+    return cast(list[T], results)
+
+
+def _call_fan_out_method(
+    client: Any,
+    resource: str,
+    method_name: str,
+    params: FanOutParams,
+    build: Callable[[Any], JsonValue],
+) -> list[ProjectFanOutEntry]:
+    call_upstream = getattr(client, "call_upstream", None)
+    if params.project_ids is not None:
+        project_ids = list(params.project_ids)
+    else:
+        listed = (
+            client.projects.list()
+            if call_upstream is None
+            else call_upstream("projects.list", client.projects.list)
+        )
+        project_ids = [int(project_id) for project_id in listed]
+    kwargs = _model_kwargs(params, exclude={"project_ids", "max_concurrency"})
+
+    def fetch(project_id: int) -> JsonValue:
+        project = client.get_project(project_id)
+        method = getattr(getattr(project, resource), method_name)
+        return build(method(**kwargs) if kwargs else method())
+
+    def query(project_id: int) -> ProjectFanOutEntry:
+        try:
+            if call_upstream is None:
+                value = fetch(project_id)
+            else:
+                # Each project is a separate upstream call with its own token and outcome.
+                value = call_upstream(
+                    f"project.{resource}.{method_name}", partial(fetch, project_id)
+                )
+        except Exception as exc:
+            logger.warning(
+                "fanout.project_failed",
+                project_id=project_id,
+                method=f"project.{resource}.{method_name}",
+                error=repr(exc),
+            )
+            return ProjectFanOutEntry(project_id=project_id, ok=False, error=str(exc) or repr(exc))
+        return ProjectFanOutEntry(project_id=project_id, ok=True, result=value)
+
+    workers = min(params.max_concurrency, len(project_ids))
+    if workers <= 1:
+        return [query(project_id) for project_id in project_ids]
+    return _run_fan_out([partial(query, project_id) for project_id in project_ids], workers)
+
+
 TOOL_SPECS: dict[str, ToolSpec] = {
     "list_projects": ToolSpec(
         method_name="projects.list",
-        input_model=EmptyParams,
+        input_model=ProjectsListParams,
         output_model=ListProjectsResult,
         output_builder=_build_list_projects_result,
         handler=lambda client, params: _call_projects_method(client, "list", params),
@@ -454,6 +1271,39 @@ TOOL_SPECS: dict[str, ToolSpec] = {
         handler=lambda client, params: _call_client_method(client, "get_job", params),
         description="Fetch job metadata for a given job key.",
     ),
+    "job_items_iter": ToolSpec(
+        method_name="job.items.iter",
+        input_model=JobItemsIterParams,
+        output_model=ItemsResult,
+        output_builder=_build_items_result,
+        handler=lambda client, params: _call_job_items_iter(client, params),
+        description=(
+            "Stream a job's items in pages of page_size with a next_cursor, "
+            "with optional field projection and Scrapinghub-side filters."
+        ),
+    ),
+    "job_logs_tail": ToolSpec(
+        method_name="job.logs.iter",
+        input_model=JobLogsTailParams,
+        output_model=LogTailResult,
+        output_builder=_build_log_tail_result,
+        handler=lambda client, params: _call_job_logs_tail(client, params),
+        description=(
+            "Return a job's log lines after offset, optionally at or above a level, "
+            "plus the next_offset to poll from."
+        ),
+    ),
+    "job_requests_stats": ToolSpec(
+        method_name="job.requests.stats",
+        input_model=JobRequestsStatsParams,
+        output_model=RequestStatsResult,
+        output_builder=_build_request_stats_result,
+        handler=lambda client, params: _call_job_requests_stats(client, params),
+        description=(
+            "Summarize a job's requests: HTTP status counts, busiest domains, and "
+            "response-time percentiles, computed while streaming."
+        ),
+    ),
     "get_project": ToolSpec(
         method_name="get_project",
         input_model=GetProjectParams,
@@ -544,7 +1394,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_spiders_list": ToolSpec(
         method_name="project.spiders.list",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "spiders", "list", params),
@@ -552,7 +1402,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_spiders_iter": ToolSpec(
         method_name="project.spiders.iter",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "spiders", "iter", params),
@@ -592,7 +1442,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_collections_list": ToolSpec(
         method_name="project.collections.list",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "collections", "list", params),
@@ -600,7 +1450,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_collections_iter": ToolSpec(
         method_name="project.collections.iter",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "collections", "iter", params),
@@ -656,7 +1506,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_frontiers_list": ToolSpec(
         method_name="project.frontiers.list",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "frontiers", "list", params),
@@ -664,7 +1514,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_frontiers_iter": ToolSpec(
         method_name="project.frontiers.iter",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "frontiers", "iter", params),
@@ -704,7 +1554,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_settings_iter": ToolSpec(
         method_name="project.settings.iter",
-        input_model=ProjectParams,
+        input_model=ProjectPageParams,
         output_model=ItemsResult,
         output_builder=_build_items_result,
         handler=lambda client, params: _call_project_method(client, "settings", "iter", params),
@@ -712,7 +1562,7 @@ TOOL_SPECS: dict[str, ToolSpec] = {
     ),
     "project_settings_get": ToolSpec(
         method_name="project.settings.get",
-        input_model=SettingsKeyParams,
+        input_model=SettingsGetParams,
         output_model=ResultWrapper,
         output_builder=_build_result_wrapper,
         handler=lambda client, params: _call_project_method(client, "settings", "get", params),
@@ -742,6 +1592,36 @@ TOOL_SPECS: dict[str, ToolSpec] = {
         handler=lambda client, params: _call_project_method(client, "settings", "delete", params),
         description="Delete a project setting.",
     ),
+    "projects_jobs_summary": ToolSpec(
+        method_name="fanout.project.jobs.summary",
+        input_model=FanOutJobsSummaryParams,
+        output_model=FanOutResult,
+        output_builder=_build_fan_out_result,
+        handler=lambda client, params: _call_fan_out_method(
+            client, "jobs", "summary", params, _fan_out_items
+        ),
+        description="Summarize jobs across projects concurrently, with per-project errors.",
+    ),
+    "projects_jobs_count": ToolSpec(
+        method_name="fanout.project.jobs.count",
+        input_model=FanOutJobsCountParams,
+        output_model=FanOutCountResult,
+        output_builder=_build_fan_out_count_result,
+        handler=lambda client, params: _call_fan_out_method(
+            client, "jobs", "count", params, _fan_out_count
+        ),
+        description="Count jobs across projects concurrently, with per-project errors.",
+    ),
+    "projects_spiders_list": ToolSpec(
+        method_name="fanout.project.spiders.list",
+        input_model=FanOutSpidersListParams,
+        output_model=FanOutResult,
+        output_builder=_build_fan_out_result,
+        handler=lambda client, params: _call_fan_out_method(
+            client, "spiders", "list", params, _fan_out_items
+        ),
+        description="List spiders across projects concurrently, with per-project errors.",
+    ),
 }
 
 
@@ -752,6 +1632,56 @@ def _find_parent(start: Path, predicate: Callable[[Path], bool]) -> Path | None:
     return None
 
 
+@dataclass(frozen=True)
+class ServerConfig:
+    """One parsed snapshot of scrapinghub-mcp.toml shared by every subsystem."""
+
+    path: Path | None = None
+    raw: dict[str, Any] = field(default_factory=dict)
+
+    def table(self, name: str) -> dict[str, Any] | None:
+        table = self.raw.get(name)
+        if table is None:
+            return None
+        if not isinstance(table, dict):
+            raise RuntimeError(f"{name} section in scrapinghub-mcp.toml must be a table.")
+        return table
+
+
+def _cached_config_path() -> Path | None:
+    search_root = Path.cwd()
+    with _CONFIG_LOCK:
+        cached = _CONFIG_PATHS.get(search_root)
+    if cached is not None and cached.is_file():
+        return cached
+    try:
+        config_path = _resolve_config_path()
+    except RuntimeError:
+        return None
+    with _CONFIG_LOCK:
+        _CONFIG_PATHS[search_root] = config_path
+    return config_path
+
+
+def load_server_config() -> ServerConfig:
+    """Return the parsed config, re-reading the file only when its mtime or size changes."""
+    config_path = _cached_config_path()
+    if config_path is None:
+        return ServerConfig()
+    stat = config_path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_LOCK:
+        cached = _CONFIG_SNAPSHOTS.get(config_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    config = ServerConfig(
+        path=config_path, raw=tomllib.loads(config_path.read_text(encoding="utf-8"))
+    )
+    with _CONFIG_LOCK:
+        _CONFIG_SNAPSHOTS[config_path] = (version, config)
+    return config
+
+
 def _resolve_config_path() -> Path:
     search_root = Path.cwd()
     direct_path = search_root / "scrapinghub-mcp.toml"
@@ -773,9 +1703,8 @@ def _resolve_config_path() -> Path:
     raise RuntimeError(f"Missing scrapinghub-mcp.toml. See {DOCS_URL} for setup.")
 
 
-def _load_auth_config(config_path: Path) -> tuple[str | None, str | None]:
-    raw = tomllib.loads(config_path.read_text(encoding="utf-8"))
-    auth = raw.get("auth")
+def _load_auth_config(config: ServerConfig) -> tuple[str | None, str | None]:
+    auth = config.raw.get("auth")
     if not isinstance(auth, dict):
         return None, None
     api_key = auth.get("api_key")
@@ -813,6 +1742,9 @@ def _load_allowlist_schema() -> dict[str, object]:
 
 
 def _parse_allowlist(content: str) -> set[str]:
+    import jsonschema
+    import yaml
+
     try:
         payload = yaml.safe_load(content) or {}
     except yaml.YAMLError as exc:
@@ -829,18 +1761,16 @@ def _parse_allowlist(content: str) -> set[str]:
     return set(operations)
 
 
-def _load_safety_config() -> tuple[set[str], set[str], str | None]:
-    try:
-        config_path = _resolve_config_path()
-    except RuntimeError:
+def _load_safety_config(
+    config: ServerConfig | None = None,
+) -> tuple[set[str], set[str], str | None]:
+    config = load_server_config() if config is None else config
+    if config.path is None:
         return set(), set(), None
 
-    raw = tomllib.loads(config_path.read_text(encoding="utf-8"))
-    safety = raw.get("safety")
+    safety = config.table("safety")
     if safety is None:
-        return set(), set(), str(config_path)
-    if not isinstance(safety, dict):
-        raise RuntimeError("safety section in scrapinghub-mcp.toml must be a table.")
+        return set(), set(), str(config.path)
 
     extra = safety.get("extra_non_mutating")
     if extra is None:
@@ -864,13 +1794,352 @@ def _load_safety_config() -> tuple[set[str], set[str], str | None]:
             raise RuntimeError("safety.block_non_mutating must contain only strings.")
         block_items = set(block_values)
 
-    return extra_items, block_items, str(config_path)
+    return extra_items, block_items, str(config.path)
+
+
+def _config_positive_int(table: dict[str, Any], section: str, key: str, default: int) -> int:
+    value = table.get(key, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise RuntimeError(f"{section}.{key} must be a positive integer.")
+    return value
+
+
+def _config_positive_number(table: dict[str, Any], section: str, key: str, default: float) -> float:
+    value = table.get(key, default)
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        raise RuntimeError(f"{section}.{key} must be a positive number.")
+    return float(value)
+
+
+def _config_non_negative_number(value: object, name: str) -> float:
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+        raise RuntimeError(f"{name} must be a non-negative number.")
+    return float(value)
+
+
+def _load_execution_config(config: ServerConfig | None = None) -> ExecutionConfig:
+    config = load_server_config() if config is None else config
+    execution = config.table("execution")
+    if execution is None:
+        return ExecutionConfig()
+
+    mode = execution.get("mode", ExecutionConfig.mode)
+    if mode not in EXECUTION_MODES:
+        raise RuntimeError('execution.mode must be "async" or "sync".')
+    max_workers = _config_positive_int(execution, "execution", "max_workers", DEFAULT_MAX_WORKERS)
+    return ExecutionConfig(mode=mode, max_workers=max_workers)
+
+
+def _load_pagination_config(config: ServerConfig | None = None) -> PaginationConfig:
+    config = load_server_config() if config is None else config
+    pagination = config.table("pagination")
+    if pagination is None:
+        return PaginationConfig()
+
+    return PaginationConfig(
+        cursor_ttl_seconds=_config_positive_number(
+            pagination, "pagination", "cursor_ttl_seconds", DEFAULT_CURSOR_TTL_SECONDS
+        ),
+        max_cursors=_config_positive_int(
+            pagination, "pagination", "max_cursors", DEFAULT_MAX_CURSORS
+        ),
+        max_bytes=(
+            _config_positive_int(pagination, "pagination", "max_bytes", 1)
+            if "max_bytes" in pagination
+            else None
+        ),
+    )
+
+
+def _load_cache_config(config: ServerConfig | None = None) -> CacheConfig:
+    config = load_server_config() if config is None else config
+    cache = config.table("cache")
+    if cache is None:
+        return CacheConfig()
+
+    default_ttl_seconds = _config_non_negative_number(
+        cache.get("default_ttl_seconds", 0.0), "cache.default_ttl_seconds"
+    )
+    ttl_table = cache.get("ttl_seconds", {})
+    if not isinstance(ttl_table, dict):
+        raise RuntimeError("cache.ttl_seconds must be a table of operation names to seconds.")
+    ttl_seconds = {
+        str(method): _config_non_negative_number(value, f"cache.ttl_seconds.{method}")
+        for method, value in ttl_table.items()
+    }
+    max_entries = _config_positive_int(cache, "cache", "max_entries", DEFAULT_MAX_RESPONSES)
+    return CacheConfig(
+        default_ttl_seconds=default_ttl_seconds,
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+    )
+
+
+def _load_spill_config(config: ServerConfig | None = None) -> SpillConfig:
+    config = load_server_config() if config is None else config
+    spill = config.table("spill")
+    if spill is None:
+        return SpillConfig()
+
+    threshold_bytes = (
+        _config_positive_int(spill, "spill", "threshold_bytes", 1)
+        if "threshold_bytes" in spill
+        else None
+    )
+    directory = spill.get("directory")
+    if directory is not None and (not isinstance(directory, str) or not directory.strip()):
+        raise RuntimeError("spill.directory must be a non-empty string.")
+    return SpillConfig(
+        threshold_bytes=threshold_bytes,
+        directory=(config.path.parent / directory).resolve()
+        if directory and config.path is not None
+        else None,
+        max_files=_config_positive_int(spill, "spill", "max_files", DEFAULT_MAX_SPILL_FILES),
+    )
+
+
+def _load_reload_config(config: ServerConfig | None = None) -> ReloadConfig:
+    config = load_server_config() if config is None else config
+    reload = config.table("reload")
+    if reload is None or "poll_seconds" not in reload:
+        return ReloadConfig()
+    return ReloadConfig(poll_seconds=_config_positive_number(reload, "reload", "poll_seconds", 1.0))
+
+
+def _load_retry_config(config: ServerConfig | None = None) -> RetryPolicy:
+    config = load_server_config() if config is None else config
+    retry = config.table("retry")
+    if retry is None:
+        return RetryPolicy()
+
+    mutating = retry.get("mutating_methods", [])
+    if not isinstance(mutating, list) or not all(
+        isinstance(item, str) and item.strip() for item in mutating
+    ):
+        raise RuntimeError("retry.mutating_methods must be a list of strings.")
+    return RetryPolicy(
+        max_attempts=_config_positive_int(retry, "retry", "max_attempts", DEFAULT_MAX_ATTEMPTS),
+        base_delay_seconds=_config_positive_number(
+            retry, "retry", "base_delay_seconds", DEFAULT_BASE_DELAY_SECONDS
+        ),
+        max_delay_seconds=_config_positive_number(
+            retry, "retry", "max_delay_seconds", DEFAULT_MAX_DELAY_SECONDS
+        ),
+        max_elapsed_seconds=_config_positive_number(
+            retry, "retry", "max_elapsed_seconds", DEFAULT_MAX_ELAPSED_SECONDS
+        ),
+        mutating_methods=frozenset(mutating),
+    )
+
+
+def _config_bucket_limit(table: dict[str, Any], section: str) -> BucketLimit:
+    if "rate" not in table:
+        raise RuntimeError(f"{section}.rate is required.")
+    rate = _config_positive_number(table, section, "rate", 1.0)
+    burst = _config_positive_int(table, section, "burst", max(int(rate), 1))
+    return BucketLimit(rate=rate, burst=burst)
+
+
+def _load_rate_limiter(config: ServerConfig | None = None) -> RateLimiter | None:
+    config = load_server_config() if config is None else config
+    rate_limit = config.table("rate_limit")
+    if rate_limit is None:
+        return None
+
+    families = rate_limit.get("families", {})
+    if not isinstance(families, dict):
+        raise RuntimeError("rate_limit.families must be a table of endpoint families.")
+    known = {_endpoint_family(spec.method_name) for spec in TOOL_SPECS.values()}
+    family_limits = {}
+    for family, table in families.items():
+        section = f"rate_limit.families.{family}"
+        if family not in known:
+            raise RuntimeError(f"{section} is not a known endpoint family: {sorted(known)}.")
+        if not isinstance(table, dict):
+            raise RuntimeError(f"{section} must be a table.")
+        family_limits[family] = _config_bucket_limit(table, section)
+    return RateLimiter(
+        global_limit=_config_bucket_limit(rate_limit, "rate_limit")
+        if "rate" in rate_limit
+        else None,
+        family_limits=family_limits,
+        max_wait_seconds=_config_non_negative_number(
+            rate_limit.get("max_wait_seconds", DEFAULT_MAX_WAIT_SECONDS),
+            "rate_limit.max_wait_seconds",
+        ),
+    )
+
+
+def _load_circuit_breakers(config: ServerConfig | None = None) -> CircuitBreakers | None:
+    config = load_server_config() if config is None else config
+    circuit = config.table("circuit_breaker") or {}
+    enabled = circuit.get("enabled", True)
+    if not isinstance(enabled, bool):
+        raise RuntimeError("circuit_breaker.enabled must be a boolean.")
+    if not enabled:
+        return None
+    return CircuitBreakers(
+        failure_threshold=_config_positive_int(
+            circuit, "circuit_breaker", "failure_threshold", DEFAULT_FAILURE_THRESHOLD
+        ),
+        reset_seconds=_config_positive_number(
+            circuit, "circuit_breaker", "reset_seconds", DEFAULT_RESET_SECONDS
+        ),
+    )
+
+
+def _load_metrics_config(config: ServerConfig | None = None) -> MetricsConfig:
+    config = load_server_config() if config is None else config
+    metrics = config.table("metrics")
+    if metrics is None:
+        return MetricsConfig()
+    textfile = metrics.get("textfile")
+    if textfile is not None and (not isinstance(textfile, str) or not textfile.strip()):
+        raise RuntimeError("metrics.textfile must be a non-empty string.")
+    return MetricsConfig(
+        textfile=(config.path.parent / textfile).resolve()
+        if textfile and config.path is not None
+        else None,
+        textfile_interval_seconds=_config_positive_number(
+            metrics,
+            "metrics",
+            "textfile_interval_seconds",
+            DEFAULT_TEXTFILE_INTERVAL_SECONDS,
+        ),
+    )
+
 
+def _load_deadline_config(config: ServerConfig | None = None) -> DeadlineConfig:
+    config = load_server_config() if config is None else config
+    deadlines = config.table("deadlines")
+    if deadlines is None:
+        return DeadlineConfig()
+    default_ms = (
+        _config_positive_int(deadlines, "deadlines", "default_ms", 1)
+        if "default_ms" in deadlines
+        else None
+    )
+    tools = deadlines.get("tools", {})
+    if not isinstance(tools, dict):
+        raise RuntimeError("deadlines.tools must be a table of tool names to milliseconds.")
+    known = set(TOOL_SPECS) | {BATCH_TOOL_NAME, SERVER_STATS_TOOL_NAME}
+    for tool_name in tools:
+        if tool_name not in known:
+            raise RuntimeError(f"deadlines.tools.{tool_name} is not a known tool.")
+    return DeadlineConfig(
+        default_ms=default_ms,
+        tools={
+            tool_name: _config_positive_int(tools, "deadlines.tools", tool_name, 1)
+            for tool_name in tools
+        },
+    )
+
+
+def _load_warmup_config(config: ServerConfig | None = None) -> WarmupConfig:
+    config = load_server_config() if config is None else config
+    warmup = config.table("warmup")
+    if warmup is None:
+        return WarmupConfig()
+    enabled = warmup.get("enabled", WarmupConfig.enabled)
+    if not isinstance(enabled, bool):
+        raise RuntimeError("warmup.enabled must be a boolean.")
+    return WarmupConfig(enabled=enabled)
+
+
+def _load_http_config(config: ServerConfig | None = None) -> HttpConfig:
+    config = load_server_config() if config is None else config
+    http = config.table("http")
+    if http is None:
+        return HttpConfig()
+
+    keep_alive = http.get("keep_alive", HttpConfig.keep_alive)
+    if not isinstance(keep_alive, bool):
+        raise RuntimeError("http.keep_alive must be a boolean.")
+    timeouts = {
+        key: _config_positive_number(http, "http", key, 1.0) if key in http else None
+        for key in ("connect_timeout", "read_timeout")
+    }
+    return HttpConfig(
+        pool_size=_config_positive_int(http, "http", "pool_size", HttpConfig.pool_size),
+        max_connections_per_host=_config_positive_int(
+            http, "http", "max_connections_per_host", HttpConfig.max_connections_per_host
+        ),
+        keep_alive=keep_alive,
+        connect_timeout=timeouts["connect_timeout"],
+        read_timeout=timeouts["read_timeout"],
+        stats_every=_config_positive_int(http, "http", "stats_every", HttpConfig.stats_every),
+    )
+
+
+def configure_client_http(client: Any, http: HttpConfig) -> list[PooledAdapter]:
+    """Apply pool settings to the app API and storage API sessions of ``client``.
+
+    Returns the mounted adapters so their pool counters can be reported.
+    """
+    from scrapinghub_mcp.http_pool import configure_session
+
+    return [
+        configure_session(
+            session,
+            name,
+            pool_size=http.pool_size,
+            max_connections_per_host=http.max_connections_per_host,
+            keep_alive=http.keep_alive,
+            stats_every=http.stats_every,
+        )
+        for name, session in (
+            ("app", client._connection._session),
+            ("storage", client._hsclient.session),
+        )
+    ]
 
-def load_non_mutating_operations() -> set[str]:
+
+def create_client(api_key: str, http: HttpConfig) -> Any:
+    """Build the Scrapinghub client with no storage-side retries.
+
+    The storage client retries idempotent requests on its own (3 retries over up to
+    60 seconds by default). That would multiply our ``Retrier`` attempts and sleep
+    past tool call deadlines, so it is limited to a single attempt.
+    """
+    from scrapinghub import ScrapinghubClient
+
+    return ScrapinghubClient(api_key, connection_timeout=http.timeout, max_retries=0)
+
+
+def _allowlist_watch_paths() -> list[Path]:
+    """Files whose edits change the gating set: allowlist override, package copy, config."""
+    paths = []
+    repo_root = _find_parent(Path.cwd(), lambda root: (root / ".git").is_dir())
+    if repo_root is not None:
+        paths.append(repo_root / ALLOWLIST_FILENAME)
+    packaged = resources.files("scrapinghub_mcp").joinpath(ALLOWLIST_FILENAME)
+    if isinstance(packaged, Path):
+        paths.append(packaged)
+    config_path = _cached_config_path()
+    if config_path is not None:
+        paths.append(config_path)
+    return paths
+
+
+def _load_compiled_allowlist(content: str) -> set[str] | None:
+    """Return the precompiled packaged allowlist if it was built from ``content``."""
+    from scrapinghub_mcp import _allowlist_compiled as compiled
+    from scrapinghub_mcp.compile_allowlist import allowlist_hash
+
+    if allowlist_hash(content) != compiled.SOURCE_SHA256:
+        logger.warning("allowlist.compiled_stale", expected=compiled.SOURCE_SHA256)
+        return None
+    return set(compiled.NON_MUTATING)
+
+
+def load_non_mutating_operations(config: ServerConfig | None = None) -> set[str]:
     content, source = _load_allowlist_content()
-    operations = _parse_allowlist(content)
-    overrides, blocklist, config_path = _load_safety_config()
+    operations = None
+    if source.startswith("package:"):
+        operations = _load_compiled_allowlist(content)
+    if operations is None:
+        operations = _parse_allowlist(content)
+    overrides, blocklist, config_path = _load_safety_config(config)
     merged = (operations | overrides) - blocklist
     logger.info(
         "allowlist.loaded",
@@ -884,22 +2153,24 @@ def load_non_mutating_operations() -> set[str]:
     return merged
 
 
-def resolve_api_key() -> str:
+def resolve_api_key(config: ServerConfig | None = None) -> str:
     print(f"scrapinghub-mcp: using working directory {Path.cwd()}", file=sys.stderr)
-    try:
-        config_path = _resolve_config_path()
-    except RuntimeError:
+    config = load_server_config() if config is None else config
+    config_path = config.path
+    if config_path is None:
         api_key = os.environ.get(API_KEY_ENV)
         if api_key:
             return api_key
         raise ConfigError(
             f"Missing scrapinghub-mcp.toml and {API_KEY_ENV}. "
             f"Create scrapinghub-mcp.toml or set {API_KEY_ENV}. See {DOCS_URL} for setup."
-        ) from None
+        )
 
-    api_key, env_file = _load_auth_config(config_path)
+    api_key, env_file = _load_auth_config(config)
 
     if env_file:
+        from dotenv import load_dotenv
+
         env_path = (config_path.parent / env_file).resolve()
         logger.info("auth.env_file.load", path=str(env_path))
         load_dotenv(env_path)
@@ -923,7 +2194,41 @@ def register_scrapinghub_tools(
     *,
     allow_mutate: bool,
     non_mutating_operations: set[str],
-) -> None:
+    executor: ToolExecutor | None = None,
+    cursor_store: CursorStore | None = None,
+    project_cache: ProjectHandleCache | None = None,
+    response_cache: ResponseCache | None = None,
+    single_flight: SingleFlight | None = None,
+    max_bytes: int | None = None,
+    spill_store: SpillStore | None = None,
+    retrier: Retrier | None = None,
+    rate_limiter: RateLimiter | None = None,
+    circuit_breakers: CircuitBreakers | None = None,
+    deadlines: DeadlineConfig | None = None,
+    metrics: MetricsRegistry | None = None,
+    http_pools: Sequence[PooledAdapter] = (),
+    response_serializer: Callable[[Any], str] | None = None,
+) -> Callable[[set[str]], bool]:
+    """Register every permitted tool and return a hook that swaps the allowlist.
+
+    The hook replaces the gating set atomically, registers or removes tools to
+    match it, and returns whether the tool list changed. Caches are kept. With a
+    ``response_serializer`` the registered functions return FastMCP tool results
+    encoded once by it, instead of models.
+    """
+    gate = frozenset(non_mutating_operations)
+    reload_lock = threading.Lock()
+    cursors = CursorStore() if cursor_store is None else cursor_store
+    responses = ResponseCache() if response_cache is None else response_cache
+    flights = SingleFlight() if single_flight is None else single_flight
+    projects = ProjectHandleCache(client.get_project) if project_cache is None else project_cache
+    guard = None
+    if rate_limiter is not None or circuit_breakers is not None:
+        guard = _UpstreamGuard(rate_limiter, circuit_breakers)
+    client = _ProjectCachingClient(client, projects, guard)
+    deadlines = DeadlineConfig() if deadlines is None else deadlines
+    registry = MetricsRegistry() if metrics is None else metrics
+
     def auth_error_message(status_code: int | None) -> str:
         detail = f"HTTP {status_code}" if status_code is not None else "an auth error"
         return (
@@ -932,6 +2237,8 @@ def register_scrapinghub_tools(
         )
 
     def auth_error_status(exc: Exception) -> int | None:
+        from requests import HTTPError
+
         if isinstance(exc, HTTPError):
             response = getattr(exc, "response", None)
             status_code = getattr(response, "status_code", None)
@@ -946,8 +2253,43 @@ def register_scrapinghub_tools(
         input_model: type[BaseModel],
         output_builder: Callable[[Any], BaseModel],
         description: str,
+        spillable: bool,
     ) -> Callable[..., Any]:
-        def tool_wrapper(params: BaseModel | None = None) -> BaseModel:
+        def fetch(validated: BaseModel) -> Any:
+            if isinstance(validated, PageParams):
+                budget = _byte_budget(validated, max_bytes)
+                if validated.cursor is not None:
+                    explicit = "page_size" in validated.model_fields_set
+                    page_size = validated.page_size if explicit else None
+                    return cursors.resume(tool_name, validated.cursor, page_size, max_bytes=budget)
+                if validated.page_size is not None or budget is not None:
+                    items = _iter_items(handler(client, validated))
+                    return cursors.open(tool_name, items, validated.page_size, max_bytes=budget)
+                if spillable and spill_store is not None:
+                    return spill_store.collect(_iter_items(handler(client, validated)))
+            return handler(client, validated)
+
+        params_adapter = TypeAdapter(input_model)
+        # Fan-out tools guard each per-project call inside the handler instead.
+        tool_guard = None if method_name.startswith(FANOUT_PREFIX) else guard
+
+        def raise_tool_error(exc: Exception) -> NoReturn:
+            status_code = auth_error_status(exc)
+            if status_code is not None:
+                logger.warning(
+                    "tool.auth_failed",
+                    tool=tool_name,
+                    method=method_name,
+                    status_code=status_code,
+                )
+                raise RuntimeError(auth_error_message(status_code)) from exc
+            logger.exception("tool.failed", tool=tool_name, method=method_name)
+            raise RuntimeError(f"Scrapinghub tool '{tool_name}' failed.") from exc
+
+        def validate(params: BaseModel | dict[str, Any] | None) -> BaseModel:
+            if type(params) is input_model:
+                # FastMCP has already validated params against the tool's input model.
+                return params
             try:
                 if params is None:
                     raw = {}
@@ -957,60 +2299,435 @@ def register_scrapinghub_tools(
                     raw = params
                 else:
                     raise TypeError("Tool params must be a JSON object.")
-                validated = input_model.model_validate(raw)
-                result = handler(client, validated)
+                return params_adapter.validate_python(raw)
             except Exception as exc:
-                status_code = auth_error_status(exc)
-                if status_code is not None:
-                    logger.warning(
-                        "tool.auth_failed",
-                        tool=tool_name,
-                        method=method_name,
-                        status_code=status_code,
-                    )
-                    raise RuntimeError(auth_error_message(status_code)) from exc
-                logger.exception("tool.failed", tool=tool_name, method=method_name)
-                raise RuntimeError(f"Scrapinghub tool '{tool_name}' failed.") from exc
+                raise_tool_error(exc)
+
+        def attempt(validated: BaseModel) -> BaseModel:
+            with producing():
+                return build(upstream_call(partial(fetch, validated)))
+
+        def produce(validated: BaseModel) -> BaseModel:
+            if tool_guard is None:
+                return attempt(validated)
+            return tool_guard.call(method_name, partial(attempt, validated))
+
+        def build(result: Any) -> BaseModel:
+            if isinstance(result, Page):
+                output = output_builder(result.items).model_copy(
+                    update={"next_cursor": result.next_cursor, "truncated": result.truncated}
+                )
+                if isinstance(output, ItemsResult) and result.encoded is not None:
+                    output._encoded_items = result.encoded
+                return output
+            if isinstance(result, SpillFile):
+                spill = SpillInfo(uri=result.uri, rows=result.rows, bytes=result.size)
+                return output_builder([]).model_copy(update={"spill": spill})
             return output_builder(result)
 
+        def run(validated: BaseModel, mutating: bool) -> BaseModel:
+            active = retrier
+            # A resumed cursor cannot be replayed: its iterator is consumed by the attempt.
+            if active is not None and (
+                getattr(validated, "cursor", None) is not None
+                or not active.allows(method_name, mutating=mutating)
+            ):
+                active = None
+            try:
+                if active is None:
+                    output = produce(validated)
+                else:
+                    output = active.call(
+                        lambda: produce(validated), tool=tool_name, method=method_name
+                    )
+            except (CursorError, RateLimitError, CircuitOpenError):
+                raise
+            except Exception as exc:
+                # Errors caused by aborting the call (e.g. a shut-down socket) are reported
+                # as the cancellation or deadline that caused them.
+                interrupted = exc if isinstance(exc, ToolCancelled) else interruption()
+                if interrupted is None:
+                    raise_tool_error(exc)
+                logger.info(
+                    "tool.interrupted", tool=tool_name, method=method_name, reason=str(interrupted)
+                )
+                if interrupted is exc:
+                    raise
+                raise interrupted from exc
+            if mutating:
+                project_id = _params_project_id(validated)
+                dropped = responses.invalidate_project(project_id)
+                if dropped:
+                    logger.info(
+                        "cache.invalidated", tool=tool_name, project_id=project_id, count=dropped
+                    )
+            return output
+
+        def shared(key: str, validated: BaseModel) -> BaseModel:
+            try:
+                return flights.do((method_name, key), lambda: run(validated, False))
+            except ToolCancelled:
+                if interruption() is not None:
+                    raise
+                # The caller leading the shared call was cancelled, not this one.
+                return run(validated, False)
+
+        def serve(validated: BaseModel) -> BaseModel:
+            mutating = method_name not in gate
+            if mutating or _is_page_request(validated, _byte_budget(validated, max_bytes)):
+                return run(validated, mutating)
+            key = _response_cache_key(validated)
+            if responses.ttl_for(method_name) <= 0:
+                return shared(key, validated)
+            cached = responses.get(method_name, key, max_age=getattr(validated, "max_age", None))
+            if cached is not None:
+                return cached
+            generation = responses.generation()
+            output = shared(key, validated)
+            if getattr(output, "spill", None) is not None:
+                return output
+            responses.put(
+                method_name,
+                key,
+                output,
+                project_id=_params_project_id(validated),
+                generation=generation,
+            )
+            return output
+
+        def tool_wrapper(params: BaseModel | None = None) -> BaseModel:
+            timer = StageTimer()
+            started = time.perf_counter()
+            try:
+                validated = validate(params)
+                registry.observe(tool_name, "validation", time.perf_counter() - started)
+                deadline_ms = getattr(validated, "deadline_ms", None) or deadlines.for_tool(
+                    tool_name
+                )
+                scope = CancelScope(_deadline_seconds(deadline_ms), parent=current_scope())
+                with scope.activate(), timer.activate():
+                    output = serve(validated)
+            except Exception:
+                registry.record_call(tool_name, error=True)
+                raise
+            finally:
+                timer.observe(registry, tool_name)
+            registry.record_call(tool_name, items=_items_returned(output))
+            return output
+
         return tool_wrapper
 
+    async def run_cancellable(scope: CancelScope, run: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await run()
+        except asyncio.CancelledError:
+            # MCP cancellation cancels the awaiting task; abort the work on the pool too.
+            scope.cancel()
+            raise
+
+    def run_on_pool(tool_wrapper: Callable[..., BaseModel]) -> Callable[..., Any]:
+        if executor is None:
+            return tool_wrapper
+        pool = executor
+
+        async def async_tool_wrapper(params: BaseModel | None = None) -> BaseModel:
+            scope = CancelScope()
+            return await run_cancellable(
+                scope, lambda: pool.run(partial(scope.run, tool_wrapper, params))
+            )
+
+        return async_tool_wrapper
+
+    sync_wrappers: dict[str, Callable[..., BaseModel]] = {}
+    registered: set[str] = set()
+
+    def expose(func: Callable[..., Any]) -> Callable[..., Any]:
+        if response_serializer is None:
+            return func
+        return returning_tool_results(func, response_serializer)
+
+    def permitted(spec: ToolSpec) -> bool:
+        return allow_mutate or spec.method_name in gate
+
+    def register_tool(tool_name: str, spec: ToolSpec) -> None:
+        if tool_name not in sync_wrappers:
+            sync_wrappers[tool_name] = make_tool_wrapper(
+                spec.handler,
+                tool_name,
+                spec.method_name,
+                spec.input_model,
+                spec.output_builder,
+                spec.description,
+                spillable=spec.output_model is ItemsResult,
+            )
+        wrapper = run_on_pool(sync_wrappers[tool_name])
+        wrapper.__annotations__ = {
+            "params": spec.input_model | None,
+            "return": spec.output_model,
+        }
+        wrapper.__doc__ = spec.description
+        mcp.tool(name=tool_name)(expose(wrapper))
+        registered.add(tool_name)
+        logger.info("tool.registered", tool=tool_name, method=spec.method_name)
+
     for tool_name, spec in TOOL_SPECS.items():
-        if spec.method_name not in non_mutating_operations and not allow_mutate:
+        if permitted(spec):
+            register_tool(tool_name, spec)
+        else:
             logger.info(
                 "tool.skipped",
                 tool=tool_name,
                 method=spec.method_name,
                 reason="mutating-default",
             )
-            continue
-        wrapper = make_tool_wrapper(
-            spec.handler,
-            tool_name,
-            spec.method_name,
-            spec.input_model,
-            spec.output_builder,
-            spec.description,
+
+    def call_batch_entry(entry: BatchCallEntry) -> BatchCallOutcome:
+        tool_wrapper = sync_wrappers.get(entry.tool) if entry.tool in registered else None
+        if tool_wrapper is None:
+            return BatchCallOutcome(
+                tool=entry.tool,
+                ok=False,
+                error=f"Tool '{entry.tool}' is not available on this server.",
+            )
+        try:
+            output = tool_wrapper(entry.params)
+        except Exception as exc:
+            return BatchCallOutcome(tool=entry.tool, ok=False, error=str(exc))
+        return BatchCallOutcome(tool=entry.tool, ok=True, result=output.model_dump(mode="json"))
+
+    def validate_batch(params: BatchCallParams | dict[str, Any] | None) -> BatchCallParams:
+        started = time.perf_counter()
+        try:
+            raw = params.model_dump() if isinstance(params, BaseModel) else params
+            validated = BatchCallParams.model_validate(raw or {})
+        except Exception as exc:
+            registry.record_call(BATCH_TOOL_NAME, error=True)
+            logger.exception("tool.failed", tool=BATCH_TOOL_NAME)
+            raise RuntimeError(f"Scrapinghub tool '{BATCH_TOOL_NAME}' failed.") from exc
+        registry.observe(BATCH_TOOL_NAME, "validation", time.perf_counter() - started)
+        return validated
+
+    def batch_scope(validated: BatchCallParams) -> CancelScope:
+        # Each entry runs in a child scope, so the batch deadline bounds all of them.
+        deadline_ms = validated.deadline_ms or deadlines.for_tool(BATCH_TOOL_NAME)
+        return CancelScope(_deadline_seconds(deadline_ms))
+
+    if executor is None:
+
+        def batch_call(params: BatchCallParams | None = None) -> BatchCallResult:
+            validated = validate_batch(params)
+            with batch_scope(validated).activate():
+                results = [call_batch_entry(entry) for entry in validated.calls]
+            registry.record_call(BATCH_TOOL_NAME, items=len(results))
+            return BatchCallResult(results=results)
+
+    else:
+        pool = executor
+
+        async def batch_call(params: BatchCallParams | None = None) -> BatchCallResult:
+            validated = validate_batch(params)
+            scope = batch_scope(validated)
+            calls = [partial(scope.run, call_batch_entry, entry) for entry in validated.calls]
+            results = await run_cancellable(
+                scope, lambda: pool.run_all(calls, limit=validated.max_concurrency)
+            )
+            registry.record_call(BATCH_TOOL_NAME, items=len(results))
+            return BatchCallResult(results=results)
+
+    batch_call.__annotations__ = {"params": BatchCallParams | None, "return": BatchCallResult}
+    batch_call.__doc__ = (
+        "Run several tools in one request. Each entry is gated like a direct call; "
+        "results are returned in order with per-entry errors."
+    )
+    mcp.tool(name=BATCH_TOOL_NAME)(expose(batch_call))
+    logger.info("tool.registered", tool=BATCH_TOOL_NAME, calls=len(registered))
+
+    def server_stats(params: EmptyParams | None = None) -> ServerStatsResult:
+        registry.record_call(SERVER_STATS_TOOL_NAME)
+        return ServerStatsResult(
+            uptime_seconds=round(time.time() - registry.started, 3),
+            tools=_tool_stats_entries(registry),
+            executor=None if executor is None else executor.stats(),
+            caches={"project_handles": projects.stats(), "responses": responses.stats()},
+            rate_limits=[] if rate_limiter is None else rate_limiter.stats(),
+            circuits=[] if circuit_breakers is None else circuit_breakers.stats(),
+            http_pools=_http_pool_entries(http_pools),
         )
-        wrapper.__annotations__ = {
-            "params": spec.input_model | None,
-            "return": spec.output_model,
-        }
-        wrapper.__doc__ = spec.description
-        mcp.tool(name=tool_name)(wrapper)
-        logger.info("tool.registered", tool=tool_name, method=spec.method_name)
+
+    server_stats.__annotations__ = {"params": EmptyParams | None, "return": ServerStatsResult}
+    server_stats.__doc__ = (
+        "Report per-tool call and error counts, items returned, response bytes and "
+        "latency by stage (validation, upstream, build, serialize) since startup, "
+        "plus worker pool queue depth and in-flight calls, cache hit/miss counts, "
+        "rate limit bucket levels and waits, circuit breaker states and HTTP "
+        "connection pool reuse."
+    )
+    mcp.tool(name=SERVER_STATS_TOOL_NAME)(expose(server_stats))
+    logger.info("tool.registered", tool=SERVER_STATS_TOOL_NAME)
+
+    def reload_allowlist(operations: set[str]) -> bool:
+        nonlocal gate
+        with reload_lock:
+            gate = frozenset(operations)
+            removed = sorted(name for name in registered if not permitted(TOOL_SPECS[name]))
+            for tool_name in removed:
+                mcp.remove_tool(tool_name)
+                registered.discard(tool_name)
+                logger.info("tool.unregistered", tool=tool_name, reason="allowlist-reload")
+            added = [
+                tool_name
+                for tool_name, spec in TOOL_SPECS.items()
+                if tool_name not in registered and permitted(spec)
+            ]
+            for tool_name in added:
+                register_tool(tool_name, TOOL_SPECS[tool_name])
+        logger.info("allowlist.reloaded", added=len(added), removed=len(removed))
+        return bool(added or removed)
+
+    return reload_allowlist
+
+
+def register_spill_resources(mcp: FastMCP, spill_store: SpillStore) -> None:
+    def read(reader: Callable[[], Any]) -> Any:
+        try:
+            return reader()
+        except SpillError:
+            raise
+        except OSError as exc:
+            logger.exception("spill.read_failed")
+            raise SpillError("Spilled result could not be read. Re-run the tool.") from exc
+
+    @mcp.resource(
+        f"{SPILL_URI_PREFIX}{{spill_id}}/lines/{{start}}/{{count}}",
+        mime_type="application/x-ndjson",
+    )
+    def spill_lines(spill_id: str, start: int, count: int) -> str:
+        """Read count NDJSON lines of a spilled result, starting at line start (0-based)."""
+        return read(lambda: spill_store.read_lines(spill_id, start, count))
+
+    @mcp.resource(
+        f"{SPILL_URI_PREFIX}{{spill_id}}/bytes/{{offset}}/{{length}}",
+        mime_type="application/octet-stream",
+    )
+    def spill_bytes(spill_id: str, offset: int, length: int) -> bytes:
+        """Read length raw bytes of a spilled result, starting at byte offset."""
+        return read(lambda: spill_store.read_bytes(spill_id, offset, length))
+
+    logger.info("resource.registered", uri=f"{SPILL_URI_PREFIX}{{spill_id}}")
+
+
+def start_allowlist_watcher(
+    mcp: MCPProtocol, reload_allowlist: Callable[[set[str]], bool], *, poll_seconds: float
+) -> AllowlistWatcher:
+    """Reload the allowlist and safety lists in the background when their files change."""
+    from fastmcp import FastMCP
+
+    from scrapinghub_mcp.reload import AllowlistWatcher, SessionTracker
+
+    tracker = None
+    if isinstance(mcp, FastMCP):
+        tracker = SessionTracker()
+        mcp.add_middleware(tracker)
+
+    def reload() -> None:
+        if reload_allowlist(load_non_mutating_operations()) and tracker is not None:
+            tracker.notify_tool_list_changed()
+
+    watcher = AllowlistWatcher(_allowlist_watch_paths, reload, poll_seconds=poll_seconds)
+    watcher.start()
+    return watcher
 
 
 def build_server(*, allow_mutate: bool = False, mcp_cls: type[MCPType] | None = None) -> MCPType:
-    api_key = resolve_api_key()
-    cls = cast(type[MCPType], FastMCP) if mcp_cls is None else mcp_cls
-    mcp = cls("scrapinghub-mcp")
-    client = cast(Any, ScrapinghubClient(api_key))
-    non_mutating_operations = load_non_mutating_operations()
-    register_scrapinghub_tools(
+    from fastmcp import FastMCP
+
+    config = load_server_config()
+    api_key = resolve_api_key(config)
+    metrics = MetricsRegistry()
+    serializer = metered_serializer(metrics, default_serializer.dumps)
+    if mcp_cls is None:
+        mcp = cast(MCPType, FastMCP("scrapinghub-mcp", tool_serializer=serializer))
+    else:
+        mcp = mcp_cls("scrapinghub-mcp")
+    encode_results = isinstance(mcp, FastMCP)
+    if encode_results:
+        mcp.add_middleware(serializer_middleware())
+    http = _load_http_config(config)
+    client = create_client(api_key, http)
+    http_pools = configure_client_http(client, http)
+    non_mutating_operations = load_non_mutating_operations(config)
+    execution = _load_execution_config(config)
+    executor = ToolExecutor(execution.max_workers) if execution.mode == "async" else None
+    logger.info("executor.configured", mode=execution.mode, max_workers=execution.max_workers)
+    pagination = _load_pagination_config(config)
+    cursor_store = CursorStore(
+        ttl_seconds=pagination.cursor_ttl_seconds, max_cursors=pagination.max_cursors
+    )
+    cache = _load_cache_config(config)
+    response_cache = ResponseCache(
+        default_ttl_seconds=cache.default_ttl_seconds,
+        ttl_seconds=cache.ttl_seconds,
+        max_entries=cache.max_entries,
+    )
+    spill = _load_spill_config(config)
+    spill_store = None
+    if spill.threshold_bytes is not None and pagination.max_bytes is not None:
+        logger.warning(
+            "spill.disabled_by_max_bytes",
+            reason="[pagination] max_bytes pages every item response, so nothing is spilled.",
+        )
+    if spill.threshold_bytes is not None:
+        spill_store = SpillStore(
+            threshold_bytes=spill.threshold_bytes,
+            directory=spill.directory,
+            max_files=spill.max_files,
+        )
+    deadlines = _load_deadline_config(config)
+    if execution.mode == "sync" and (deadlines.default_ms is not None or deadlines.tools):
+        logger.warning(
+            "deadlines.sync_mode",
+            reason=(
+                'execution.mode = "sync" runs tools inline: client cancellation is ignored '
+                "and [deadlines] are only checked between upstream steps."
+            ),
+        )
+    rate_limiter = _load_rate_limiter(config)
+    circuit_breakers = _load_circuit_breakers(config)
+    reload_allowlist = register_scrapinghub_tools(
         mcp,
         client,
         allow_mutate=allow_mutate,
         non_mutating_operations=non_mutating_operations,
+        executor=executor,
+        cursor_store=cursor_store,
+        response_cache=response_cache,
+        max_bytes=pagination.max_bytes,
+        spill_store=spill_store,
+        retrier=Retrier(_load_retry_config(config)),
+        rate_limiter=rate_limiter,
+        circuit_breakers=circuit_breakers,
+        deadlines=deadlines,
+        metrics=metrics,
+        http_pools=http_pools,
+        response_serializer=serializer if encode_results else None,
     )
+    if spill_store is not None and isinstance(mcp, FastMCP):
+        register_spill_resources(mcp, spill_store)
+    reload = _load_reload_config(config)
+    if reload.poll_seconds is not None:
+        start_allowlist_watcher(mcp, reload_allowlist, poll_seconds=reload.poll_seconds)
+    metrics_config = _load_metrics_config(config)
+    if metrics_config.textfile is not None:
+        TextfileExporter(
+            metrics,
+            metrics_config.textfile,
+            interval_seconds=metrics_config.textfile_interval_seconds,
+        ).start()
+    if _load_warmup_config(config).enabled:
+        from scrapinghub_mcp.warmup import start_warmup
+
+        guard = None
+        if rate_limiter is not None or circuit_breakers is not None:
+            guard = _UpstreamGuard(rate_limiter, circuit_breakers)
+        start_warmup(client, call_upstream=None if guard is None else guard.call)
     return mcp
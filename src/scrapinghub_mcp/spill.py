@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import atexit
+import secrets
+import shutil
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import structlog
+
+from scrapinghub_mcp.serialization import default_serializer
+
+logger = structlog.get_logger(__name__)
+
+SPILL_URI_PREFIX = "scrapinghub-mcp://spill/"
+DEFAULT_MAX_SPILL_FILES = 16
+MAX_READ_LINES = 10_000
+MAX_READ_BYTES = 1 << 20
+# One offset is kept per this many lines, so the index stays small for huge exports.
+INDEX_STRIDE = 1024
+
+
+class SpillError(RuntimeError):
+    """Raised when a spilled result is unknown, evicted, or read out of range."""
+
+
+@dataclass(frozen=True)
+class SpillFile:
+    spill_id: str
+    path: Path
+    rows: int
+    size: int
+    offsets: array[int]
+
+    @property
+    def uri(self) -> str:
+        return f"{SPILL_URI_PREFIX}{self.spill_id}"
+
+
+class SpillStore:
+    """Writes results above a size threshold to local NDJSON files.
+
+    Small results are returned in memory unchanged. Once the serialized items pass
+    ``threshold_bytes`` the buffered items and the rest of the stream go to disk,
+    with a sparse line-offset index so ranges can be read without a full scan.
+    Spill files are removed at interpreter exit, along with the temporary
+    directory when the store created one.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_bytes: int,
+        directory: Path | None = None,
+        max_files: int = DEFAULT_MAX_SPILL_FILES,
+    ) -> None:
+        if threshold_bytes < 1:
+            raise ValueError("threshold_bytes must be at least 1.")
+        if max_files < 1:
+            raise ValueError("max_files must be at least 1.")
+        self._threshold_bytes = threshold_bytes
+        self._directory = directory
+        self._max_files = max_files
+        self._files: OrderedDict[str, SpillFile] = OrderedDict()
+        self._lock = threading.Lock()
+        self._owns_directory = False
+        self._cleanup_registered = False
+
+    def collect(self, iterator: Iterator[Any]) -> list[Any] | SpillFile:
+        """Return every item, or a ``SpillFile`` once they exceed the threshold."""
+        items: list[Any] = []
+        lines: list[bytes] = []
+        size = 0
+        for item in iterator:
+            line = default_serializer.dumps(item) + b"\n"
+            items.append(item)
+            lines.append(line)
+            size += len(line)
+            if size > self._threshold_bytes:
+                return self._write(lines, iterator)
+        return items
+
+    def get(self, spill_id: str) -> SpillFile:
+        with self._lock:
+            spill = self._files.get(spill_id)
+        if spill is None:
+            raise SpillError(f"Unknown or evicted spill '{spill_id}'. Re-run the tool.")
+        return spill
+
+    def read_lines(self, spill_id: str, start: int, count: int) -> str:
+        spill = self.get(spill_id)
+        if start < 0 or count < 1 or count > MAX_READ_LINES:
+            raise SpillError(f"Line ranges need start >= 0 and 1 <= count <= {MAX_READ_LINES}.")
+        if start >= spill.rows:
+            return ""
+        block, skip = divmod(start, INDEX_STRIDE)
+        with spill.path.open("rb") as handle:
+            handle.seek(spill.offsets[block])
+            for _ in range(skip):
+                handle.readline()
+            chunk = [handle.readline() for _ in range(min(count, spill.rows - start))]
+        return b"".join(chunk).decode("utf-8")
+
+    def read_bytes(self, spill_id: str, offset: int, length: int) -> bytes:
+        spill = self.get(spill_id)
+        if offset < 0 or length < 1 or length > MAX_READ_BYTES:
+            raise SpillError(f"Byte ranges need offset >= 0 and 1 <= length <= {MAX_READ_BYTES}.")
+        with spill.path.open("rb") as handle:
+            handle.seek(offset)
+            return handle.read(length)
+
+    def clear(self) -> None:
+        with self._lock:
+            spills = list(self._files.values())
+            self._files.clear()
+        for spill in spills:
+            self._remove(spill, reason="cleared")
+
+    def close(self) -> None:
+        """Remove every spill file, and the spill directory if this store created it.
+
+        Runs at interpreter exit, when the log stream may already be closed, so it
+        removes files without logging.
+        """
+        with self._lock:
+            spills = list(self._files.values())
+            self._files.clear()
+            directory = self._directory if self._owns_directory else None
+            if directory is not None:
+                self._directory = None
+                self._owns_directory = False
+        for spill in spills:
+            spill.path.unlink(missing_ok=True)
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _write(self, lines: list[bytes], iterator: Iterator[Any]) -> SpillFile:
+        directory = self._spill_directory()
+        spill_id = secrets.token_urlsafe(12)
+        path = directory / f"{spill_id}.ndjson"
+        offsets = array("Q")
+        rows = 0
+        size = 0
+        try:
+            with path.open("wb") as handle:
+
+                def write(line: bytes) -> None:
+                    nonlocal rows, size
+                    if rows % INDEX_STRIDE == 0:
+                        offsets.append(size)
+                    handle.write(line)
+                    rows += 1
+                    size += len(line)
+
+                for line in lines:
+                    write(line)
+                lines.clear()
+                for item in iterator:
+                    write(default_serializer.dumps(item) + b"\n")
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        spill = SpillFile(spill_id=spill_id, path=path, rows=rows, size=size, offsets=offsets)
+        logger.info("spill.written", spill_id=spill_id, rows=rows, size=size)
+        with self._lock:
+            self._files[spill_id] = spill
+            evicted = []
+            while len(self._files) > self._max_files:
+                _, oldest = self._files.popitem(last=False)
+                evicted.append(oldest)
+        for oldest in evicted:
+            self._remove(oldest, reason="evicted")
+        return spill
+
+    def _spill_directory(self) -> Path:
+        with self._lock:
+            if self._directory is None:
+                self._directory = Path(tempfile.mkdtemp(prefix="scrapinghub-mcp-spill-"))
+                self._owns_directory = True
+            if not self._cleanup_registered:
+                atexit.register(self.close)
+                self._cleanup_registered = True
+            directory = self._directory
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    @staticmethod
+    def _remove(spill: SpillFile, *, reason: str) -> None:
+        logger.info("spill.removed", spill_id=spill.spill_id, reason=reason)
+        spill.path.unlink(missing_ok=True)
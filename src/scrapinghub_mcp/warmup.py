@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+UpstreamCall = Callable[[str, Callable[[], T]], T]
+
+WARMUP_OK = "ok"
+WARMUP_AUTH_FAILED = "auth_failed"
+WARMUP_FAILED = "failed"
+
+
+def _is_auth_error(exc: Exception) -> bool:
+    from requests import HTTPError
+    from scrapinghub.legacy import APIError
+
+    if isinstance(exc, APIError):
+        return exc._type == APIError.ERR_AUTH_ERROR
+    # scrapinghub.client wraps HTTP errors (Unauthorized, Forbidden) and keeps the original.
+    http_error = exc if isinstance(exc, HTTPError) else getattr(exc, "http_error", None)
+    response = getattr(http_error, "response", None)
+    return getattr(response, "status_code", None) in {401, 403}
+
+
+def _warm(host: str, request: Callable[[], Any]) -> str:
+    started = time.perf_counter()
+    try:
+        request()
+    except Exception as exc:
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        if _is_auth_error(exc):
+            logger.error(
+                "warmup.auth_failed",
+                host=host,
+                elapsed_ms=elapsed_ms,
+                hint="Check SCRAPINGHUB_API_KEY or auth.api_key in scrapinghub-mcp.toml.",
+            )
+            return WARMUP_AUTH_FAILED
+        logger.warning("warmup.failed", host=host, elapsed_ms=elapsed_ms, error=str(exc))
+        return WARMUP_FAILED
+    logger.info(
+        "warmup.ready", host=host, elapsed_ms=round((time.perf_counter() - started) * 1000, 1)
+    )
+    return WARMUP_OK
+
+
+def _storage_timestamp(hsclient: Any) -> Any:
+    # HubstorageClient.server_timestamp sends its request without a timeout, so an
+    # unreachable storage host would hang the warm-up thread; go through
+    # ``request`` with the client's (``[http]``) connect/read timeouts instead.
+    from scrapinghub.hubstorage.utils import urlpathjoin
+
+    url = urlpathjoin(hsclient.endpoint, "system/ts")
+    return hsclient.request(method="GET", url=url, timeout=hsclient.connection_timeout)
+
+
+def warm_up(client: Any, call_upstream: UpstreamCall[Any] | None = None) -> dict[str, str]:
+    """Open pooled connections to the app and storage hosts and check the API key.
+
+    The app host is warmed with an authenticated project listing, so a bad key is
+    reported here rather than on the first tool call; the storage host is warmed
+    with its timestamp endpoint. Both requests use the client's connection timeout,
+    which follows the ``[http]`` connect/read timeouts. ``call_upstream`` applies
+    the server's rate limits and circuit breakers to the listing. Returns the
+    outcome per host.
+    """
+    list_projects = client.projects.list
+    if call_upstream is not None:
+        list_projects = partial(call_upstream, "projects.list", list_projects)
+    return {
+        "app": _warm("app", list_projects),
+        "storage": _warm("storage", partial(_storage_timestamp, client._hsclient)),
+    }
+
+
+def start_warmup(client: Any, call_upstream: UpstreamCall[Any] | None = None) -> threading.Thread:
+    """Run ``warm_up`` on a daemon thread so server startup does not wait for it."""
+    thread = threading.Thread(
+        target=warm_up,
+        args=(client, call_upstream),
+        name="scrapinghub-mcp-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
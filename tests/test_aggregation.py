@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scrapinghub_mcp.aggregation import DurationHistogram, RequestStatsAccumulator
+
+
+def test_duration_histogram_percentiles_are_within_bucket_error() -> None:
+    rng = random.Random(7)
+    values = [rng.uniform(1, 5000) for _ in range(10_000)]
+    histogram = DurationHistogram()
+    for value in values:
+        histogram.add(value)
+
+    ordered = sorted(values)
+    for percent in (50, 90, 99):
+        exact = ordered[int(len(ordered) * percent / 100) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.03)
+    assert histogram.percentile(100) == max(values)
+
+
+def test_duration_histogram_is_empty_without_values() -> None:
+    assert DurationHistogram().percentile(50) is None
+
+
+def test_request_stats_accumulator_aggregates_records() -> None:
+    stats = RequestStatsAccumulator()
+    stats.add_all(
+        [
+            {"url": "https://a.example/1", "status": 200, "duration": 100},
+            {"url": "https://a.example/2", "status": 200, "duration": 300},
+            {"url": "https://b.example/", "status": 404, "duration": 200},
+            {"url": "not a url", "status": None},
+            {"url": "http://[bad/x", "status": 200},
+        ]
+    )
+
+    summary = stats.summary(top_domains=1)
+
+    assert summary.total == 5
+    assert summary.status_counts == {"200": 3, "404": 1, "unknown": 1}
+    assert summary.top_domains == [("a.example", 2)]
+    assert summary.tracked_domains == 3
+    assert not summary.domains_truncated
+    assert summary.duration_count == 3
+    assert summary.duration_mean == 200
+    assert (summary.duration_min, summary.duration_max) == (100, 300)
+
+
+def test_request_stats_accumulator_bounds_tracked_domains() -> None:
+    stats = RequestStatsAccumulator(max_domains=2)
+    stats.add_all({"url": f"https://host{index % 5}.example/"} for index in range(10))
+
+    summary = stats.summary(top_domains=10)
+
+    assert summary.tracked_domains == 2
+    assert summary.domains_truncated
+    assert sum(count for _, count in summary.top_domains) == 4
+    assert summary.untracked_domain_requests == 6
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from scrapinghub_mcp.cache import ProjectHandleCache, ResponseCache, SingleFlight
+from scrapinghub_mcp.cancellation import CancelScope, DeadlineExceeded, ToolCancelled
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_project_handle_cache_counts_hits_and_misses() -> None:
+    loaded: list[int] = []
+
+    def loader(project_id: int) -> str:
+        loaded.append(project_id)
+        return f"project-{project_id}"
+
+    cache = ProjectHandleCache(loader)
+
+    assert cache.get(1) == "project-1"
+    assert cache.get(1) == "project-1"
+    assert cache.get(2) == "project-2"
+
+    assert loaded == [1, 2]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+
+def test_project_handle_cache_evicts_least_recently_used() -> None:
+    loaded: list[int] = []
+
+    def loader(project_id: int) -> int:
+        loaded.append(project_id)
+        return project_id
+
+    cache = ProjectHandleCache(loader, max_size=2)
+    cache.get(1)
+    cache.get(2)
+    cache.get(1)
+    cache.get(3)
+    cache.get(1)
+    cache.get(2)
+
+    assert loaded == [1, 2, 3, 2]
+    assert cache.stats().size == 2
+
+
+def test_project_handle_cache_rejects_empty_size() -> None:
+    with pytest.raises(ValueError):
+        ProjectHandleCache(lambda project_id: project_id, max_size=0)
+
+
+def test_response_cache_expires_entries_after_method_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(ttl_seconds={"projects.summary": 10}, clock=clock)
+    cache.put("projects.summary", "{}", "summary", project_id=None)
+
+    clock.now = 9
+    assert cache.get("projects.summary", "{}") == "summary"
+    clock.now = 10
+    assert cache.get("projects.summary", "{}") is None
+
+
+def test_response_cache_skips_methods_without_ttl() -> None:
+    cache = ResponseCache(ttl_seconds={"projects.summary": 10})
+    cache.put("project.jobs.count", "{}", 5, project_id=1)
+
+    assert cache.get("project.jobs.count", "{}") is None
+
+
+def test_response_cache_default_ttl_skips_volatile_methods() -> None:
+    cache = ResponseCache(default_ttl_seconds=60)
+    assert cache.ttl_for("projects.summary") == 60
+    assert cache.ttl_for("job.logs.iter") == 0
+
+    explicit = ResponseCache(default_ttl_seconds=60, ttl_seconds={"job.logs.iter": 5})
+    assert explicit.ttl_for("job.logs.iter") == 5
+
+
+def test_response_cache_max_age_demands_fresher_entry() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(default_ttl_seconds=60, clock=clock)
+    cache.put("project.jobs.count", "{}", 5, project_id=1)
+
+    clock.now = 5
+    assert cache.get("project.jobs.count", "{}", max_age=2) is None
+    assert cache.get("project.jobs.count", "{}", max_age=10) == 5
+
+
+def test_response_cache_invalidates_project_and_cross_project_entries() -> None:
+    cache = ResponseCache(default_ttl_seconds=60)
+    cache.put("project.jobs.count", "1", 5, project_id=1)
+    cache.put("project.jobs.count", "2", 7, project_id=2)
+    cache.put("projects.summary", "{}", [], project_id=None)
+
+    assert cache.invalidate_project(1) == 2
+    assert cache.get("project.jobs.count", "2") == 7
+    assert cache.get("projects.summary", "{}") is None
+
+
+def test_response_cache_drops_responses_fetched_before_invalidation() -> None:
+    cache = ResponseCache(default_ttl_seconds=60)
+    generation = cache.generation()
+    cache.invalidate_project(1)
+    cache.put("project.jobs.count", "1", 5, project_id=1, generation=generation)
+
+    assert cache.get("project.jobs.count", "1") is None
+
+
+def _wait_for(predicate: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for condition.")
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers() -> None:
+    flights = SingleFlight()
+    release = threading.Event()
+    calls: list[int] = []
+    results: list[str] = []
+
+    def upstream() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "summary"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do("key", upstream)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: flights.coalesced == 3)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [1]
+    assert results == ["summary"] * 4
+
+
+def test_single_flight_shares_errors_and_forgets_finished_calls() -> None:
+    flights = SingleFlight()
+
+    def failing() -> str:
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        flights.do("key", failing)
+
+    assert flights.do("key", lambda: "recovered") == "recovered"
+
+
+def test_single_flight_follower_gives_up_at_its_own_deadline() -> None:
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    results: list[str] = []
+
+    def slow_upstream() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "summary"
+
+    leader = threading.Thread(target=lambda: results.append(flights.do("key", slow_upstream)))
+    leader.start()
+    started.wait(timeout=5)
+    follower = CancelScope(0.05)
+
+    began = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        follower.run(flights.do, "key", lambda: "unused")
+    assert time.monotonic() - began < 1
+
+    cancelled = CancelScope()
+    threading.Timer(0.05, cancelled.cancel).start()
+    with pytest.raises(ToolCancelled, match="cancelled by the client"):
+        cancelled.run(flights.do, "key", lambda: "unused")
+
+    release.set()
+    leader.join(timeout=5)
+    assert results == ["summary"]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterator
+
+import pytest
+
+from scrapinghub_mcp.cancellation import (
+    CancelScope,
+    DeadlineExceeded,
+    ToolCancelled,
+    check_cancelled,
+    checked,
+    current_scope,
+    interruption,
+    sleep,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_scope_without_deadline_never_expires() -> None:
+    scope = CancelScope()
+
+    assert scope.remaining() is None
+    assert scope.error() is None
+    scope.check()
+
+
+def test_deadline_expires_and_reports_milliseconds() -> None:
+    clock = FakeClock()
+    scope = CancelScope(0.25, clock=clock)
+
+    assert scope.remaining() == 0.25
+    clock.now = 0.25
+
+    with pytest.raises(DeadlineExceeded, match="deadline of 250 ms"):
+        scope.check()
+
+
+def test_child_inherits_nearer_parent_deadline() -> None:
+    clock = FakeClock()
+    parent = CancelScope(1.0, clock=clock)
+    child = CancelScope(5.0, parent=parent, clock=clock)
+
+    assert child.remaining() == 1.0
+    clock.now = 1.0
+    assert isinstance(child.error(), DeadlineExceeded)
+
+
+def test_cancel_runs_callbacks_and_cancels_children() -> None:
+    parent = CancelScope()
+    child = CancelScope(parent=parent)
+    aborted: list[str] = []
+    child.on_cancel(lambda: aborted.append("request"))
+
+    parent.cancel()
+
+    assert child.cancelled
+    assert aborted == ["request"]
+    with pytest.raises(ToolCancelled, match="cancelled by the client"):
+        child.check()
+
+
+def test_on_cancel_runs_immediately_for_cancelled_scope() -> None:
+    scope = CancelScope()
+    scope.cancel()
+    aborted: list[bool] = []
+
+    scope.on_cancel(lambda: aborted.append(True))
+
+    assert aborted == [True]
+
+
+def test_on_cancel_handle_unregisters_callback() -> None:
+    scope = CancelScope()
+    aborted: list[str] = []
+    unregister = scope.on_cancel(lambda: aborted.append("finished"))
+    scope.on_cancel(lambda: aborted.append("in flight"))
+
+    unregister()
+    unregister()
+    scope.cancel()
+
+    assert aborted == ["in flight"]
+
+
+def test_child_of_cancelled_parent_starts_cancelled() -> None:
+    parent = CancelScope()
+    parent.cancel()
+
+    assert CancelScope(parent=parent).cancelled
+
+
+def test_run_makes_scope_current_only_for_the_call() -> None:
+    scope = CancelScope()
+
+    assert scope.run(current_scope) is scope
+    assert current_scope() is None
+    assert interruption() is None
+    check_cancelled()
+
+
+def test_sleep_wakes_up_when_cancelled() -> None:
+    scope = CancelScope()
+    threading.Timer(0.05, scope.cancel).start()
+
+    with pytest.raises(ToolCancelled):
+        scope.run(sleep, 30)
+
+
+def test_sleep_past_deadline_fails_without_waiting() -> None:
+    clock = FakeClock()
+    scope = CancelScope(1.0, clock=clock)
+
+    with pytest.raises(DeadlineExceeded, match="would pass"):
+        scope.sleep(2.0)
+
+
+def test_checked_stops_iteration_and_closes_source() -> None:
+    closed: list[bool] = []
+    scope = CancelScope()
+
+    def source() -> Iterator[int]:
+        try:
+            yield from range(10)
+        finally:
+            closed.append(True)
+
+    def consume() -> list[int]:
+        seen = []
+        for item in checked(source()):
+            seen.append(item)
+            if item == 2:
+                scope.cancel()
+        return seen
+
+    with pytest.raises(ToolCancelled):
+        scope.run(consume)
+    assert closed == [True]
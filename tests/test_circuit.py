@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+from requests import HTTPError, Response
+
+from scrapinghub_mcp.circuit import CircuitBreaker, CircuitBreakers, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def http_error(status_code: int) -> HTTPError:
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(response=response)
+
+
+def test_circuit_opens_after_consecutive_upstream_failures() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("project.jobs", failure_threshold=2, reset_seconds=10, clock=clock)
+
+    breaker.before_call()
+    breaker.record_error(http_error(503))
+    breaker.before_call()
+    breaker.record_error(http_error(404))
+    breaker.before_call()
+    breaker.record_error(http_error(503))
+    assert breaker.stats().state == "closed"
+
+    breaker.before_call()
+    breaker.record_error(http_error(502))
+    assert breaker.stats().state == "open"
+    with pytest.raises(CircuitOpenError, match="project.jobs"):
+        breaker.before_call()
+    assert breaker.stats().rejected == 1
+
+
+def test_half_open_allows_one_probe_then_closes_or_reopens() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("project.jobs", failure_threshold=1, reset_seconds=10, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+
+    clock.now = 10
+    breaker.before_call()
+    assert breaker.stats().state == "half_open"
+    with pytest.raises(CircuitOpenError, match="probed"):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.stats().state == "open"
+
+    clock.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    stats = breaker.stats()
+    assert (stats.state, stats.opened, stats.consecutive_failures) == ("closed", 2, 0)
+
+
+def test_release_frees_the_probe_without_changing_state() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("project.jobs", failure_threshold=1, reset_seconds=1, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+    clock.now = 1
+
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+    assert breaker.stats().state == "half_open"
+
+
+def test_circuit_breakers_are_created_per_family() -> None:
+    breakers = CircuitBreakers(failure_threshold=1)
+
+    breakers.get("project.jobs").record_failure()
+
+    assert breakers.get("project.jobs") is breakers.get("project.jobs")
+    assert {stats.name: stats.state for stats in breakers.stats()} == {"project.jobs": "open"}
+    breakers.get("project.collections").before_call()
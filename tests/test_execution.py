@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from scrapinghub_mcp.execution import ToolExecutor
+
+
+def test_tool_executor_runs_calls_concurrently() -> None:
+    executor = ToolExecutor(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blocking_call() -> str:
+        barrier.wait()
+        return "done"
+
+    async def run_both() -> list[str]:
+        return list(await asyncio.gather(executor.run(blocking_call), executor.run(blocking_call)))
+
+    try:
+        assert asyncio.run(run_both()) == ["done", "done"]
+    finally:
+        executor.shutdown()
+
+
+def test_tool_executor_reports_queue_depth_when_saturated() -> None:
+    executor = ToolExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_call() -> int:
+        started.set()
+        release.wait(timeout=5)
+        return 1
+
+    async def run_saturated() -> tuple[int, int, bool]:
+        first = asyncio.ensure_future(executor.run(blocking_call))
+        second = asyncio.ensure_future(executor.run(blocking_call))
+        await asyncio.sleep(0)
+        await asyncio.to_thread(started.wait, 5)
+        stats = executor.stats()
+        release.set()
+        await asyncio.gather(first, second)
+        return stats.in_flight, stats.queued, stats.saturated
+
+    try:
+        assert asyncio.run(run_saturated()) == (1, 1, True)
+        final = executor.stats()
+        assert (final.in_flight, final.queued) == (0, 0)
+    finally:
+        executor.shutdown()
+
+
+def test_tool_executor_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError):
+        ToolExecutor(max_workers=0)
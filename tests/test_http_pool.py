@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+from requests import RequestException, Session, Timeout
+
+from scrapinghub_mcp.cancellation import CancelScope, ToolCancelled
+from scrapinghub_mcp.http_pool import PooledAdapter, configure_session
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def local_url() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_configure_session_mounts_sized_pool() -> None:
+    session = Session()
+
+    adapter = configure_session(session, "app", pool_size=3, max_connections_per_host=7)
+
+    assert session.get_adapter("https://app.zyte.com/api/") is adapter
+    assert session.get_adapter("http://localhost/") is adapter
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+    assert adapter.poolmanager.pools._maxsize == 3
+    assert session.headers.get("Connection") != "close"
+
+
+def test_configure_session_can_disable_keep_alive() -> None:
+    session = Session()
+
+    configure_session(session, "storage", keep_alive=False)
+
+    assert session.headers["Connection"] == "close"
+
+
+def test_pool_stats_count_reused_connections(local_url: str) -> None:
+    session = Session()
+    adapter = configure_session(session, "app", stats_every=2)
+
+    for _ in range(3):
+        assert session.get(local_url).text == "ok"
+
+    [stats] = adapter.stats()
+    assert stats.host.startswith("http://127.0.0.1:")
+    assert (stats.requests, stats.new_connections, stats.hits) == (3, 1, 2)
+
+
+def test_pooled_adapter_defaults() -> None:
+    adapter = PooledAdapter("app")
+
+    assert adapter.stats() == []
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        time.sleep(5)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def slow_url() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_cancelling_scope_aborts_in_flight_request(slow_url: str) -> None:
+    session = Session()
+    configure_session(session, "app")
+    scope = CancelScope()
+    threading.Timer(0.1, scope.cancel).start()
+    started = time.monotonic()
+
+    with pytest.raises(RequestException):
+        scope.run(lambda: session.get(slow_url, timeout=30))
+
+    assert time.monotonic() - started < 2
+    with pytest.raises(ToolCancelled):
+        scope.run(lambda: session.get(slow_url, timeout=30))
+
+
+def test_deadline_caps_request_timeout(slow_url: str) -> None:
+    session = Session()
+    configure_session(session, "app")
+    scope = CancelScope(0.2)
+    started = time.monotonic()
+
+    with pytest.raises(Timeout):
+        scope.run(lambda: session.get(slow_url, timeout=30))
+
+    assert time.monotonic() - started < 2
+
+
+def test_finished_requests_unregister_their_abort_callbacks(local_url: str) -> None:
+    session = Session()
+    configure_session(session, "app")
+    scope = CancelScope()
+
+    for _ in range(3):
+        assert scope.run(lambda: session.get(local_url).text) == "ok"
+        assert scope._callbacks == []
+    streamed = scope.run(lambda: session.get(local_url, stream=True))
+    assert len(scope._callbacks) == 1
+    assert streamed.text == "ok"
+    assert scope._callbacks == []
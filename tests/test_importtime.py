@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Generous enough for slow CI runners; importing fastmcp alone takes longer than this.
+IMPORT_BUDGET_SECONDS = 1.2
+DEFERRED_MODULES = {"dotenv", "fastmcp", "jsonschema", "requests", "scrapinghub", "yaml"}
+
+
+def _import_times(module: str) -> dict[str, int]:
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_server_import_defers_heavy_dependencies() -> None:
+    times = _import_times("scrapinghub_mcp.server")
+
+    assert DEFERRED_MODULES.isdisjoint(times)
+    assert times["scrapinghub_mcp.server"] / 1_000_000 < IMPORT_BUDGET_SECONDS
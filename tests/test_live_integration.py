@@ -23,6 +23,9 @@ class DummyMCP:
 
         return decorator
 
+    def remove_tool(self, name: str) -> None:
+        del self.tool_registry[name]
+
 
 @dataclass
 class LiveTools:
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from scrapinghub_mcp.metrics import (
+    Histogram,
+    MetricsRegistry,
+    StageTimer,
+    TextfileExporter,
+    metered_serializer,
+    timed,
+    upstream_call,
+)
+
+
+def test_histogram_counts_cumulatively_and_estimates_quantiles() -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.buckets == ((0.1, 1), (1.0, 3))
+    assert snapshot.count == 4
+    assert snapshot.sum == pytest.approx(6.05)
+    assert snapshot.quantile(0.5) == 1.0
+    assert snapshot.quantile(0.99) is None
+
+
+def test_registry_records_calls_per_tool() -> None:
+    registry = MetricsRegistry()
+    registry.record_call("get_job", items=1)
+    registry.record_call("get_job", error=True)
+    registry.observe("get_job", "upstream", 0.2)
+    registry.add_bytes("get_job", 120)
+
+    [stats] = registry.snapshot()
+
+    assert (stats.tool, stats.calls, stats.errors, stats.items, stats.bytes) == (
+        "get_job",
+        2,
+        1,
+        1,
+        120,
+    )
+    assert stats.latency["upstream"].count == 1
+    assert stats.latency["build"].count == 0
+    with pytest.raises(ValueError, match="Unknown metrics stage"):
+        registry.observe("get_job", "network", 0.1)
+
+
+def test_prometheus_text_renders_counters_and_histograms() -> None:
+    registry = MetricsRegistry(buckets=(0.5,))
+    registry.record_call('odd"tool', items=3)
+    registry.observe('odd"tool', "build", 0.25)
+
+    text = registry.prometheus_text()
+
+    assert "# TYPE scrapinghub_mcp_tool_calls_total counter" in text
+    assert 'scrapinghub_mcp_tool_calls_total{tool="odd\\"tool"} 1' in text
+    assert 'scrapinghub_mcp_tool_items_total{tool="odd\\"tool"} 3' in text
+    assert (
+        'scrapinghub_mcp_tool_stage_seconds_bucket{tool="odd\\"tool",stage="build",le="0.5"} 1'
+    ) in text
+    assert (
+        'scrapinghub_mcp_tool_stage_seconds_bucket{tool="odd\\"tool",stage="build",le="+Inf"} 1'
+    ) in text
+    assert 'scrapinghub_mcp_tool_stage_seconds_count{tool="odd\\"tool",stage="build"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_textfile_exporter_replaces_file(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    path = tmp_path / "textfile" / "scrapinghub_mcp.prom"
+    exporter = TextfileExporter(registry, path, interval_seconds=60)
+
+    assert exporter.write()
+    registry.record_call("list_projects")
+    assert exporter.write()
+
+    assert 'scrapinghub_mcp_tool_calls_total{tool="list_projects"} 1' in path.read_text()
+    assert [entry.name for entry in path.parent.iterdir()] == ["scrapinghub_mcp.prom"]
+
+
+def test_stage_timer_counts_nested_upstream_time_once() -> None:
+    registry = MetricsRegistry()
+    timer = StageTimer()
+
+    def items() -> Iterator[int]:
+        for index in range(3):
+            time.sleep(0.01)
+            yield index
+
+    with timer.activate(), timer.production():
+        pulled = upstream_call(lambda: list(timed(items())))
+        time.sleep(0.01)
+    timer.observe(registry, "job_items_iter")
+
+    assert pulled == [0, 1, 2]
+    [stats] = registry.snapshot()
+    upstream = stats.latency["upstream"].sum
+    build = stats.latency["build"].sum
+    assert 0.03 <= upstream < timer.produce_seconds
+    assert build == pytest.approx(timer.produce_seconds - upstream)
+
+
+def test_timed_passes_items_through_without_timer() -> None:
+    assert list(timed(iter([1, 2]))) == [1, 2]
+
+
+def test_timed_charges_each_item_to_the_current_timer() -> None:
+    first, second = StageTimer(), StageTimer()
+
+    def items() -> Iterator[int]:
+        for index in range(2):
+            time.sleep(0.01)
+            yield index
+
+    with first.activate():
+        pulled = timed(items())
+        assert next(pulled) == 0
+    first_seconds = first.upstream_seconds
+    with second.activate():
+        assert next(pulled) == 1
+
+    assert first_seconds >= 0.01
+    assert first.upstream_seconds == first_seconds
+    assert second.upstream_seconds >= 0.01
+
+
+def test_metered_serializer_ignores_calls_outside_tools() -> None:
+    registry = MetricsRegistry()
+    serialize = metered_serializer(registry, lambda value: b'{"ok":true}')
+
+    assert serialize({"ok": True}) == '{"ok":true}'
+    assert registry.snapshot() == []
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pytest
+
+from scrapinghub_mcp.pagination import CursorError, CursorStore
+from scrapinghub_mcp.serialization import default_serializer
+
+
+def json_size(item: Any) -> int:
+    return len(default_serializer.dumps(item)) + 1
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TrackingIterator:
+    def __init__(self, count: int) -> None:
+        self._inner: Iterator[int] = iter(range(count))
+        self.pulled = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[int]:
+        return self
+
+    def __next__(self) -> int:
+        value = next(self._inner)
+        self.pulled += 1
+        return value
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_cursor_store_pages_through_iterator_lazily() -> None:
+    store = CursorStore()
+    upstream = TrackingIterator(5)
+
+    first = store.open("tool", upstream, 2)
+    assert first.items == [0, 1]
+    assert first.next_cursor is not None
+    assert upstream.pulled == 3
+
+    second = store.resume("tool", first.next_cursor)
+    assert second.items == [2, 3]
+    assert second.next_cursor is not None
+
+    last = store.resume("tool", second.next_cursor)
+    assert last.items == [4]
+    assert last.next_cursor is None
+    assert len(store) == 0
+
+
+def test_cursor_store_cursors_are_single_use() -> None:
+    store = CursorStore()
+    page = store.open("tool", iter(range(4)), 2)
+    assert page.next_cursor is not None
+    store.resume("tool", page.next_cursor)
+
+    with pytest.raises(CursorError):
+        store.resume("tool", page.next_cursor)
+
+
+def test_cursor_store_rejects_cursor_from_other_tool() -> None:
+    store = CursorStore()
+    upstream = TrackingIterator(4)
+    page = store.open("tool_a", upstream, 2)
+    assert page.next_cursor is not None
+
+    with pytest.raises(CursorError):
+        store.resume("tool_b", page.next_cursor)
+    assert upstream.closed
+
+
+def test_cursor_store_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    store = CursorStore(ttl_seconds=10, clock=clock)
+    upstream = TrackingIterator(4)
+    page = store.open("tool", upstream, 2)
+    assert page.next_cursor is not None
+
+    clock.now = 11
+    with pytest.raises(CursorError):
+        store.resume("tool", page.next_cursor)
+    assert upstream.closed
+
+
+def test_cursor_store_evicts_least_recently_issued() -> None:
+    store = CursorStore(max_cursors=2)
+    iterators = [TrackingIterator(4) for _ in range(3)]
+    cursors = [store.open("tool", upstream, 1).next_cursor for upstream in iterators]
+
+    assert len(store) == 2
+    assert iterators[0].closed
+    assert not iterators[1].closed
+    with pytest.raises(CursorError):
+        store.resume("tool", cursors[0] or "")
+
+
+def test_cursor_store_stops_at_byte_budget() -> None:
+    store = CursorStore()
+    items = ["a" * 10, "b" * 10, "c" * 10, "d" * 10]
+    budget = json_size(items[0]) * 2 + 1
+
+    first = store.open("tool", iter(items), None, max_bytes=budget)
+    assert first.items == items[:2]
+    assert first.truncated
+    assert first.next_cursor is not None
+
+    second = store.resume("tool", first.next_cursor, max_bytes=budget)
+    assert second.items == items[2:]
+    assert second.next_cursor is None
+
+
+def test_cursor_store_encodes_each_budgeted_item_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = CursorStore()
+    items = ["a" * 10, "b" * 10, "c" * 10]
+    budget = json_size(items[0]) * 2 + 1
+    encoded: list[Any] = []
+    dumps = default_serializer.dumps
+
+    def counting_dumps(value: Any) -> bytes:
+        encoded.append(value)
+        return dumps(value)
+
+    monkeypatch.setattr(default_serializer, "dumps", counting_dumps)
+
+    first = store.open("tool", iter(items), None, max_bytes=budget)
+    assert first.next_cursor is not None
+    second = store.resume("tool", first.next_cursor, max_bytes=budget)
+
+    assert first.encoded == [dumps(item) for item in items[:2]]
+    assert second.encoded == [dumps(items[2])]
+    assert encoded == items
+
+
+def test_cursor_store_returns_oversized_item_alone() -> None:
+    store = CursorStore()
+
+    page = store.open("tool", iter(["x" * 100, "y"]), 10, max_bytes=5)
+
+    assert page.items == ["x" * 100]
+    assert page.truncated
+    assert page.next_cursor is not None
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from scrapinghub_mcp.cancellation import DeadlineExceeded
+from scrapinghub_mcp.ratelimit import BucketLimit, RateLimiter, RateLimitError, TokenBucket
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_reserves_in_order() -> None:
+    fake = FakeTime()
+    bucket = TokenBucket("global", BucketLimit(rate=2, burst=2), clock=fake.clock)
+
+    assert [bucket.reserve(10) for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    stats = bucket.stats()
+    assert (stats.tokens, stats.waits, stats.queued, stats.max_wait_seconds) == (-2.0, 2, 2, 1.0)
+
+    fake.now = 10
+    assert bucket.stats().tokens == 2.0
+
+
+def test_token_bucket_rejects_waits_beyond_limit() -> None:
+    fake = FakeTime()
+    bucket = TokenBucket("global", BucketLimit(rate=1, burst=1), clock=fake.clock)
+
+    assert bucket.reserve(0) == 0.0
+    assert bucket.reserve(0.5) is None
+    assert bucket.stats().tokens == 0.0
+
+
+def test_rate_limiter_queues_on_global_and_family_buckets() -> None:
+    fake = FakeTime()
+    limiter = RateLimiter(
+        global_limit=BucketLimit(rate=10, burst=10),
+        family_limits={"project.jobs": BucketLimit(rate=1, burst=1)},
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+
+    assert limiter.acquire("project.jobs") == 0.0
+    assert limiter.acquire("project.jobs") == 1.0
+    assert limiter.acquire("project.collections") == 0.0
+    assert fake.sleeps == [1.0]
+    stats = {bucket.name: bucket for bucket in limiter.stats()}
+    assert stats["global"].tokens == pytest.approx(9.0)
+    assert (stats["project.jobs"].waits, stats["project.jobs"].queued) == (1, 0)
+
+
+def test_rate_limiter_rejects_and_returns_tokens() -> None:
+    fake = FakeTime()
+    limiter = RateLimiter(
+        global_limit=BucketLimit(rate=1, burst=1),
+        family_limits={"project.jobs": BucketLimit(rate=1, burst=5)},
+        max_wait_seconds=0,
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+
+    limiter.acquire("project.jobs")
+    with pytest.raises(RateLimitError, match="'global'"):
+        limiter.acquire("project.jobs")
+    stats = {bucket.name: bucket for bucket in limiter.stats()}
+    assert stats["project.jobs"].tokens == 4.0
+
+
+def test_rate_limiter_refunds_tokens_when_wait_is_interrupted() -> None:
+    fake = FakeTime()
+
+    def interrupted_sleep(seconds: float) -> None:
+        fake.sleeps.append(seconds)
+        raise DeadlineExceeded("deadline")
+
+    limiter = RateLimiter(
+        global_limit=BucketLimit(rate=1, burst=1),
+        family_limits={"project.jobs": BucketLimit(rate=1, burst=5)},
+        clock=fake.clock,
+        sleep=interrupted_sleep,
+    )
+
+    limiter.acquire("project.jobs")
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("project.jobs")
+    assert fake.sleeps == [1.0]
+    stats = {bucket.name: bucket for bucket in limiter.stats()}
+    assert (stats["global"].tokens, stats["global"].queued) == (0.0, 0)
+    assert stats["project.jobs"].tokens == 4.0
+    # The next caller waits behind one call, not behind the abandoned one too.
+    fake.now = 1.0
+    assert limiter.stats()[0].tokens == 1.0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import mcp.types
+from fastmcp import Client, FastMCP
+from fastmcp.client.messages import MessageHandler
+
+from scrapinghub_mcp.reload import AllowlistWatcher, SessionTracker, file_signature
+
+
+def touch(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_signature_marks_missing_files(tmp_path: Path) -> None:
+    present = tmp_path / "present.yaml"
+    touch(present, "a", 1_000_000_000)
+
+    assert file_signature([present, tmp_path / "missing.yaml"]) == (
+        (str(present), 1_000_000_000, 1),
+        (str(tmp_path / "missing.yaml"), None, None),
+    )
+
+
+def test_watcher_reloads_only_when_files_change(tmp_path: Path) -> None:
+    allowlist = tmp_path / "allowlist.yaml"
+    touch(allowlist, "a", 1_000_000_000)
+    reloads: list[int] = []
+    watcher = AllowlistWatcher(lambda: [allowlist], lambda: reloads.append(1))
+
+    assert watcher.check() is False
+    touch(allowlist, "b", 2_000_000_000)
+    assert watcher.check() is True
+    assert watcher.check() is False
+    allowlist.unlink()
+    assert watcher.check() is True
+    assert len(reloads) == 2
+
+
+def test_watcher_keeps_running_after_failed_reload(tmp_path: Path) -> None:
+    allowlist = tmp_path / "allowlist.yaml"
+    touch(allowlist, "a", 1_000_000_000)
+    attempts: list[int] = []
+
+    def reload() -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("invalid allowlist")
+
+    watcher = AllowlistWatcher(lambda: [allowlist], reload)
+    touch(allowlist, "bad", 2_000_000_000)
+    assert watcher.check() is False
+    assert watcher.check() is False
+    touch(allowlist, "good", 3_000_000_000)
+    assert watcher.check() is True
+    assert len(attempts) == 2
+
+
+def test_watcher_thread_polls_in_background(tmp_path: Path) -> None:
+    allowlist = tmp_path / "allowlist.yaml"
+    touch(allowlist, "a", 1_000_000_000)
+    reloaded = asyncio.Event()
+    loop = asyncio.new_event_loop()
+    watcher = AllowlistWatcher(
+        lambda: [allowlist], lambda: loop.call_soon_threadsafe(reloaded.set), poll_seconds=0.01
+    )
+    watcher.start()
+    try:
+        touch(allowlist, "b", 2_000_000_000)
+        loop.run_until_complete(asyncio.wait_for(reloaded.wait(), timeout=5))
+    finally:
+        watcher.stop()
+        loop.close()
+
+
+class ToolListChanges(MessageHandler):
+    def __init__(self) -> None:
+        self.received = asyncio.Event()
+
+    async def on_tool_list_changed(self, message: mcp.types.ToolListChangedNotification) -> None:
+        self.received.set()
+
+
+def test_session_tracker_notifies_connected_clients() -> None:
+    server = FastMCP("scrapinghub-mcp")
+    tracker = SessionTracker()
+    server.add_middleware(tracker)
+
+    @server.tool(name="ping")
+    def ping() -> str:
+        return "pong"
+
+    handler = ToolListChanges()
+
+    async def scenario() -> Any:
+        async with Client(server, message_handler=handler) as client:
+            await client.list_tools()
+            notified = await asyncio.to_thread(tracker.notify_tool_list_changed)
+            await asyncio.wait_for(handler.received.wait(), timeout=5)
+            return notified
+
+    assert asyncio.run(scenario()) == 1
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from requests import ConnectionError, HTTPError, Response
+from scrapinghub.client.exceptions import ServerError
+from scrapinghub.legacy import APIError
+
+from scrapinghub_mcp.retry import (
+    Retrier,
+    RetryPolicy,
+    is_retryable,
+    retry_after_seconds,
+)
+
+
+def http_error(status_code: int, retry_after: str | None = None) -> HTTPError:
+    response = Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return HTTPError(response=response)
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_retrier(policy: RetryPolicy, fake: FakeTime) -> Retrier:
+    return Retrier(policy, sleep=fake.sleep, clock=fake.clock, jitter=lambda: 1.0)
+
+
+def failing(errors: list[Exception], result: Any = "ok") -> Any:
+    calls: list[int] = []
+
+    def func() -> Any:
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    func.calls = calls  # type: ignore[attr-defined]
+    return func
+
+
+def test_is_retryable_covers_transient_failures_only() -> None:
+    assert is_retryable(http_error(503))
+    assert is_retryable(http_error(429))
+    assert is_retryable(ConnectionError("reset"))
+    assert is_retryable(ServerError(http_error=http_error(502)))
+    assert is_retryable(APIError("boom", _type=APIError.ERR_SERVER_ERROR))
+    assert not is_retryable(http_error(401))
+    assert not is_retryable(http_error(404))
+    assert not is_retryable(RuntimeError("bug"))
+
+
+def test_retry_after_parses_seconds_and_dates() -> None:
+    assert retry_after_seconds(http_error(429, "7")) == 7.0
+    assert retry_after_seconds(http_error(429, "Thu, 01 Jan 1970 00:01:40 GMT"), now=40.0) == 60.0
+    assert retry_after_seconds(http_error(429, "soon")) is None
+    assert retry_after_seconds(http_error(503)) is None
+
+
+def test_retrier_backs_off_exponentially_until_success() -> None:
+    fake = FakeTime()
+    func = failing([http_error(503), http_error(503)])
+
+    result = make_retrier(RetryPolicy(max_attempts=3, base_delay_seconds=1), fake).call(func)
+
+    assert result == "ok"
+    assert fake.sleeps == [1.0, 2.0]
+
+
+def test_retrier_honors_retry_after_and_caps_delay() -> None:
+    fake = FakeTime()
+    func = failing([http_error(429, "4"), http_error(503), http_error(503)])
+    policy = RetryPolicy(max_attempts=4, base_delay_seconds=3, max_delay_seconds=5)
+
+    assert make_retrier(policy, fake).call(func) == "ok"
+    assert fake.sleeps == [4.0, 5.0, 5.0]
+
+
+def test_retrier_stops_at_attempt_and_elapsed_limits() -> None:
+    fake = FakeTime()
+    func = failing([http_error(503)] * 5)
+    with pytest.raises(HTTPError):
+        make_retrier(RetryPolicy(max_attempts=2), fake).call(func)
+    assert len(func.calls) == 2
+
+    fake = FakeTime()
+    func = failing([http_error(429, "20"), http_error(429, "20")])
+    with pytest.raises(HTTPError):
+        make_retrier(RetryPolicy(max_attempts=5, max_elapsed_seconds=30), fake).call(func)
+    assert fake.sleeps == [20.0]
+
+
+def test_retrier_does_not_retry_permanent_errors() -> None:
+    fake = FakeTime()
+    func = failing([http_error(401)])
+
+    with pytest.raises(HTTPError):
+        make_retrier(RetryPolicy(), fake).call(func)
+    assert fake.sleeps == []
+
+
+def test_retrier_allows_mutating_methods_only_when_listed() -> None:
+    retrier = Retrier(RetryPolicy(mutating_methods=frozenset({"project.jobs.run"})))
+
+    assert retrier.allows("project.jobs.count", mutating=False)
+    assert retrier.allows("project.jobs.run", mutating=True)
+    assert not retrier.allows("project.jobs.cancel", mutating=True)
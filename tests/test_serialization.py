@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from scrapinghub_mcp.serialization import EncodedArray, Serializer
+
+
+class Nested(BaseModel):
+    name: str
+    raw: bytes
+
+
+VALUE = {
+    "when": dt.datetime(2024, 1, 2, 3, 4, 5),
+    "raw": b"caf\xc3\xa9",
+    "model": Nested(name="n", raw=b"x"),
+    "tags": ("a", "b"),
+    "other": object,
+}
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_serializer_encodes_upstream_values_in_one_pass(backend: str) -> None:
+    pytest.importorskip(backend)
+    serializer = Serializer(backend)
+
+    decoded = json.loads(serializer.dumps(VALUE))
+
+    assert decoded == {
+        "when": "2024-01-02T03:04:05",
+        "raw": "café",
+        "model": {"name": "n", "raw": "x"},
+        "tags": ["a", "b"],
+        "other": str(object),
+    }
+    assert serializer.dumps_text({"k": "é"}) == '{"k":"é"}'
+
+
+def test_serializer_backends_agree_on_item_lists() -> None:
+    pytest.importorskip("orjson")
+    items = [{"url": f"https://example.com/{index}", "price": index / 3} for index in range(50)]
+
+    assert Serializer("orjson").dumps(items) == Serializer("json").dumps(items)
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_serializer_splices_encoded_arrays(backend: str) -> None:
+    pytest.importorskip(backend)
+    serializer = Serializer(backend)
+    elements = [serializer.dumps({"name": "café"}), serializer.dumps([1, 2])]
+
+    data = serializer.dumps({"items": EncodedArray(elements), "note": "\x00"})
+
+    assert json.loads(data) == {"items": [{"name": "café"}, [1, 2]], "note": "\x00"}
+
+
+def test_serializer_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unknown serializer backend"):
+        Serializer("pickle")
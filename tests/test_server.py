@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 import typing
+from functools import partial
 from importlib import resources
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Callable
 
+import pydantic_core
+import pytest
+import structlog.testing
+from fastmcp import Client, FastMCP
 from requests import HTTPError, Response
 
 import scrapinghub_mcp.server as server
+from scrapinghub_mcp import _allowlist_compiled, compile_allowlist, http_pool
+from scrapinghub_mcp.cache import ProjectHandleCache, ResponseCache, SingleFlight
+from scrapinghub_mcp.execution import ToolExecutor
+from scrapinghub_mcp.spill import SpillStore
 
 
 class DummyMCP:
@@ -23,6 +36,9 @@ class DummyMCP:
 
         return decorator
 
+    def remove_tool(self, name: str) -> None:
+        del self.tool_registry[name]
+
 
 class DummyProjects:
     def list(self) -> "typing.List[str]":
@@ -54,28 +70,105 @@ class DummyJobMeta:
         return list(self._data.items())
 
 
+class DummyJobItems:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.calls: list[dict[str, Any]] = []
+        self.pulled = 0
+
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        for index in range(self.total):
+            self.pulled += 1
+            yield {"name": f"item-{index}", "size": index, "url": f"https://example.com/{index}"}
+
+
+class DummyJobLogs:
+    levels = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+    def __init__(self, job_key: str) -> None:
+        self.job_key = job_key
+        self.entries: list[dict[str, Any]] = []
+        self.calls: list[dict[str, Any]] = []
+
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        minimum = self.levels.get(kwargs.get("level") or "DEBUG", 0)
+        offset = kwargs.get("offset", 0)
+        matching = [
+            (index, entry)
+            for index, entry in enumerate(self.entries)
+            if index >= offset and entry["level"] >= minimum
+        ]
+        for index, entry in matching[: kwargs.get("count")]:
+            yield {**entry, "_key": f"{self.job_key}/{index}"}
+
+
+class DummyJobRequests:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        for index in range(kwargs.get("count", 100)):
+            yield {
+                "url": f"https://site{index % 2}.example/{index}",
+                "status": 500 if index % 10 == 0 else 200,
+                "duration": index + 1,
+            }
+
+
 class DummyJob:
     def __init__(self, job_key: str) -> None:
         self.key = job_key
         self.project_id = int(job_key.split("/")[0])
         self.metadata = DummyJobMeta({"state": "finished"})
+        self.items = DummyJobItems(10)
+        self.logs = DummyJobLogs(job_key)
+        self.requests = DummyJobRequests()
+
+
+class DummyProjectJobs:
+    def __init__(self, project_id: int) -> None:
+        self.project_id = project_id
+        self.calls: list[dict[str, Any]] = []
+
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        return iter({"key": f"{self.project_id}/1/{index}"} for index in range(5))
+
+    def count(self, **kwargs: Any) -> int:
+        self.calls.append(kwargs)
+        return 5
+
+    def summary(self, **kwargs: Any) -> typing.List[dict[str, Any]]:
+        self.calls.append(kwargs)
+        return [{"name": "finished", "count": self.project_id}]
+
+    def run(self, **kwargs: Any) -> DummyJob:
+        self.calls.append(kwargs)
+        return DummyJob(f"{self.project_id}/1/9")
 
 
 class DummyProject:
     def __init__(self, project_id: int) -> None:
         self.key = str(project_id)
+        self.jobs = DummyProjectJobs(project_id)
 
 
 class DummyClient:
     def __init__(self) -> None:
         self.projects = DummyProjects()
         self.jobs = DummyJobs()
+        self.project_handles: dict[int, DummyProject] = {}
+        self.project_requests: list[int] = []
 
     def get_job(self, job_key: str) -> DummyJob:
         return DummyJob(job_key)
 
     def get_project(self, project_id: int) -> DummyProject:
-        return DummyProject(project_id)
+        self.project_requests.append(project_id)
+        return self.project_handles.setdefault(project_id, DummyProject(project_id))
 
     def close(self) -> None:
         return None
@@ -126,7 +219,7 @@ def make_repo(
 
 
 def test_build_server_registers_tool(monkeypatch: Any) -> None:
-    monkeypatch.setattr(server, "resolve_api_key", lambda: "test-key")
+    monkeypatch.setattr(server, "resolve_api_key", lambda config=None: "test-key")
     built_server = server.build_server(mcp_cls=DummyMCP)
 
     assert isinstance(built_server, DummyMCP)
@@ -165,7 +258,10 @@ def test_register_scrapinghub_tools_allows_mutating_with_flag() -> None:
         non_mutating_operations={"projects.list"},
     )
 
-    assert set(mcp.tool_registry.keys()) == set(server.TOOL_SPECS.keys())
+    assert set(mcp.tool_registry.keys()) == set(server.TOOL_SPECS.keys()) | {
+        server.BATCH_TOOL_NAME,
+        server.SERVER_STATS_TOOL_NAME,
+    }
 
 
 def test_tool_wrapper_returns_auth_error_message() -> None:
@@ -240,231 +336,1060 @@ def test_get_job_returns_metadata() -> None:
     }
 
 
-def test_parse_mutations_accepts_non_mutating_list() -> None:
-    content = "non_mutating:\n  - projects.list\n  - projects.summary\n"
-    operations = server._parse_allowlist(content)
+def test_tool_wrapper_runs_on_executor() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    executor = ToolExecutor(max_workers=2)
 
-    assert operations == {"projects.list", "projects.summary"}
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+        executor=executor,
+    )
 
+    tool = mcp.tool_registry["get_job"]
+    try:
+        result = asyncio.run(tool({"job_key": "1/2/3"}))
+    finally:
+        executor.shutdown()
 
-def test_parse_mutations_allows_empty_non_mutating_list() -> None:
-    content = "non_mutating: []\n"
-    operations = server._parse_allowlist(content)
+    assert result.model_dump()["job_key"] == "1/2/3"
+    assert executor.stats().in_flight == 0
 
-    assert operations == set()
 
+def test_paged_tool_returns_cursor_until_exhausted() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
 
-def test_parse_mutations_rejects_missing_non_mutating_list() -> None:
-    content = "other: []\n"
-    try:
-        server._parse_allowlist(content)
-    except RuntimeError as exc:
-        assert "is invalid" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for missing non_mutating list.")
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+    )
 
+    tool = mcp.tool_registry["project_jobs_iter"]
+    first = tool({"project_id": 1, "page_size": 3, "state": "finished"})
+    assert [item["key"] for item in first.items] == ["1/1/0", "1/1/1", "1/1/2"]
+    assert first.next_cursor is not None
 
-def test_parse_mutations_rejects_extra_keys() -> None:
-    content = "non_mutating: []\nextra: []\n"
-    try:
-        server._parse_allowlist(content)
-    except RuntimeError as exc:
-        assert "is invalid" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for extra allowlist keys.")
+    second = tool({"project_id": 1, "cursor": first.next_cursor})
+    assert [item["key"] for item in second.items] == ["1/1/3", "1/1/4"]
+    assert second.next_cursor is None
+    assert client.project_handles[1].jobs.calls == [{"state": "finished"}]
 
 
-def test_parse_mutations_rejects_missing_list() -> None:
-    content = "not_mutations: []\n"
-    try:
-        server._parse_allowlist(content)
-    except RuntimeError as exc:
-        assert "is invalid" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for missing non_mutating list.")
+def test_paged_tool_without_page_size_returns_everything() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
 
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+    )
 
-def test_parse_mutations_rejects_non_string_items() -> None:
-    content = "non_mutating:\n  - projects.list\n  - 123\n"
-    try:
-        server._parse_allowlist(content)
-    except RuntimeError as exc:
-        assert "is invalid" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for non-string allowlist entries.")
+    result = mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
 
+    assert len(result.items) == 5
+    assert result.next_cursor is None
 
-def test_parse_mutations_rejects_invalid_yaml() -> None:
-    content = "non_mutating: [\n"
-    try:
-        server._parse_allowlist(content)
-    except RuntimeError as exc:
-        assert "Failed to parse" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for invalid YAML.")
 
+def test_paged_tool_rejects_unknown_cursor() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
 
-def test_load_non_mutating_operations_uses_repo_override(tmp_path: Path, monkeypatch: Any) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
     )
-    monkeypatch.chdir(repo_root)
 
-    operations = server.load_non_mutating_operations()
+    try:
+        mcp.tool_registry["project_jobs_iter"]({"project_id": 1, "cursor": "missing"})
+    except RuntimeError as exc:
+        assert "cursor" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for unknown cursor.")
 
-    assert operations == {"projects.list"}
 
+class ItemsJobClient(DummyClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.job = DummyJob("1/2/3")
 
-def test_load_non_mutating_operations_merges_config_allowlist(
-    tmp_path: Path, monkeypatch: Any
-) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
-    )
-    monkeypatch.chdir(repo_root)
+    def get_job(self, job_key: str) -> DummyJob:
+        return self.job
 
-    operations = server.load_non_mutating_operations()
 
-    assert operations == {"projects.list", "projects.summary"}
+def test_job_items_iter_streams_projected_pages() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
 
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
+    )
 
-def test_load_non_mutating_operations_rejects_invalid_config(
-    tmp_path: Path, monkeypatch: Any
-) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nextra_non_mutating = "projects.summary"\n',
+    tool = mcp.tool_registry["job_items_iter"]
+    first = tool(
+        {
+            "job_key": "1/2/3",
+            "page_size": 3,
+            "start": 5,
+            "fields": ["name"],
+            "filter": [["size", ">", [1]]],
+        }
     )
-    monkeypatch.chdir(repo_root)
 
-    try:
-        server.load_non_mutating_operations()
-    except RuntimeError as exc:
-        assert "extra_non_mutating" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for invalid safety config.")
+    assert first.items == [{"name": f"item-{index}"} for index in range(3)]
+    assert first.next_cursor is not None
+    assert client.job.items.pulled == 4
+    assert client.job.items.calls == [{"start": "1/2/3/5", "filter": [("size", ">", [1])]}]
 
+    second = tool({"job_key": "1/2/3", "cursor": first.next_cursor})
+    assert second.items == [{"name": f"item-{index}"} for index in range(3, 6)]
+    assert len(client.job.items.calls) == 1
 
-def test_load_non_mutating_operations_rejects_invalid_blocklist(
-    tmp_path: Path, monkeypatch: Any
-) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nblock_non_mutating = "projects.summary"\n',
-    )
-    monkeypatch.chdir(repo_root)
 
-    try:
-        server.load_non_mutating_operations()
-    except RuntimeError as exc:
-        assert "block_non_mutating" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for invalid blocklist config.")
+class SlowJobItems(DummyJobItems):
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        for item in super().iter(**kwargs):
+            time.sleep(0.01)
+            yield item
 
 
-def test_load_non_mutating_operations_rejects_invalid_safety_table(
-    tmp_path: Path, monkeypatch: Any
-) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='safety = "oops"\n',
-    )
-    monkeypatch.chdir(repo_root)
+def test_resumed_cursor_counts_upstream_time_for_the_resuming_call() -> None:
+    from scrapinghub_mcp.metrics import MetricsRegistry
 
-    try:
-        server.load_non_mutating_operations()
-    except RuntimeError as exc:
-        assert "safety section" in str(exc)
-    else:
-        raise AssertionError("Expected RuntimeError for invalid safety table.")
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    client.job.items = SlowJobItems(10)
+    metrics = MetricsRegistry()
+    observed: list[tuple[str, float]] = []
+    observe = metrics.observe
 
+    def recording_observe(tool: str, stage: str, seconds: float) -> None:
+        observed.append((stage, seconds))
+        observe(tool, stage, seconds)
 
-def test_load_non_mutating_operations_blocks_entries(tmp_path: Path, monkeypatch: Any) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n  - projects.summary\n",
-        config='[safety]\nblock_non_mutating = ["projects.summary"]\n',
+    metrics.observe = recording_observe  # type: ignore[method-assign]
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
+        metrics=metrics,
     )
-    monkeypatch.chdir(repo_root)
 
-    operations = server.load_non_mutating_operations()
+    tool = mcp.tool_registry["job_items_iter"]
+    first = tool({"job_key": "1/2/3", "page_size": 3})
+    observed.clear()
+    tool({"job_key": "1/2/3", "cursor": first.next_cursor})
 
-    assert operations == {"projects.list"}
+    upstream = [seconds for stage, seconds in observed if stage == "upstream"]
+    build = [seconds for stage, seconds in observed if stage == "build"]
+    assert len(upstream) == 1 and upstream[0] >= 0.03
+    assert build[0] < upstream[0]
 
 
-def test_load_non_mutating_operations_blocks_overrides(tmp_path: Path, monkeypatch: Any) -> None:
-    repo_root = make_repo(
-        tmp_path,
-        "repo",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nextra_non_mutating = ["projects.summary"]\n'
-        'block_non_mutating = ["projects.summary"]\n',
+def test_job_items_iter_pages_by_default() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    client.job.items.total = server.DEFAULT_ITEMS_PAGE_SIZE + 5
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
     )
-    monkeypatch.chdir(repo_root)
 
-    operations = server.load_non_mutating_operations()
+    result = mcp.tool_registry["job_items_iter"]({"job_key": "1/2/3", "count": 2000})
 
-    assert operations == {"projects.list"}
+    assert len(result.items) == server.DEFAULT_ITEMS_PAGE_SIZE
+    assert result.items[0] == {"name": "item-0", "size": 0, "url": "https://example.com/0"}
+    assert result.next_cursor is not None
+    assert client.job.items.calls == [{"count": 2000}]
 
 
-def test_load_non_mutating_operations_from_cwd_config(tmp_path: Path, monkeypatch: Any) -> None:
-    cwd_root = make_repo(
-        tmp_path,
-        "cwd",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
+def test_job_logs_tail_returns_only_new_lines() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    logs = client.job.logs
+    logs.entries = [
+        {"level": 20, "message": "started"},
+        {"level": 30, "message": "slow response"},
+        {"level": 20, "message": "progress"},
+    ]
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.logs.iter"},
     )
-    monkeypatch.chdir(cwd_root)
 
-    operations = server.load_non_mutating_operations()
+    tool = mcp.tool_registry["job_logs_tail"]
+    first = tool({"job_key": "1/2/3", "level": "WARNING"})
+    assert first.lines == [{"level": 30, "message": "slow response"}]
+    assert first.next_offset == 2
+    assert logs.calls[0] == {"meta": ["_key"], "level": "WARNING", "offset": 0, "count": 500}
 
-    assert operations == {"projects.list", "projects.summary"}
+    logs.entries.append({"level": 40, "message": "failed"})
+    second = tool({"job_key": "1/2/3", "level": "WARNING", "offset": first.next_offset})
+    assert second.lines == [{"level": 40, "message": "failed"}]
+    assert second.next_offset == 4
 
+    idle = tool({"job_key": "1/2/3", "offset": second.next_offset})
+    assert (idle.lines, idle.next_offset) == ([], 4)
 
-def test_load_non_mutating_operations_from_cwd_blocklist(tmp_path: Path, monkeypatch: Any) -> None:
-    cwd_root = make_repo(
-        tmp_path,
-        "cwd",
-        allowlist="non_mutating:\n  - projects.list\n  - projects.summary\n",
-        config='[safety]\nblock_non_mutating = ["projects.summary"]\n',
+
+def test_job_logs_tail_is_not_cached_by_default_ttl() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    logs = client.job.logs
+    logs.entries = [{"level": 20, "message": "started"}]
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.logs.iter"},
+        response_cache=ResponseCache(default_ttl_seconds=60),
     )
-    monkeypatch.chdir(cwd_root)
 
-    operations = server.load_non_mutating_operations()
+    tool = mcp.tool_registry["job_logs_tail"]
+    assert len(tool({"job_key": "1/2/3"}).lines) == 1
+    logs.entries.append({"level": 20, "message": "progress"})
+    assert len(tool({"job_key": "1/2/3"}).lines) == 2
 
-    assert operations == {"projects.list"}
 
+def test_job_requests_stats_summarizes_streamed_requests() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
 
-def test_load_non_mutating_operations_from_package_root(tmp_path: Path, monkeypatch: Any) -> None:
-    pkg_root = make_repo(
-        tmp_path,
-        "pkg",
-        allowlist="non_mutating:\n  - projects.list\n",
-        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
-        add_pyproject=True,
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.requests.stats"},
     )
-    nested = pkg_root / "subdir"
-    nested.mkdir()
-    monkeypatch.chdir(nested)
 
-    operations = server.load_non_mutating_operations()
+    result = mcp.tool_registry["job_requests_stats"]({"job_key": "1/2/3", "top_domains": 1})
 
-    assert operations == {"projects.list", "projects.summary"}
+    assert client.job.requests.calls == [{}]
+    assert result.total == 100
+    assert result.status_counts == {"200": 90, "500": 10}
+    assert [entry.model_dump() for entry in result.top_domains] == [
+        {"domain": "site0.example", "count": 50}
+    ]
+    assert result.tracked_domains == 2
+    assert not result.domains_truncated
+    assert result.duration_ms.count == 100
+    assert result.duration_ms.max == 100
+    assert result.duration_ms.percentiles["p50"] == pytest.approx(50, rel=0.03)
 
 
-def test_load_non_mutating_operations_without_repo_root(tmp_path: Path, monkeypatch: Any) -> None:
+def test_max_bytes_truncates_items_with_resume_cursor() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    item_size = len('{"key":"1/1/0"}') + 1
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+        max_bytes=item_size * 4,
+    )
+
+    tool = mcp.tool_registry["project_jobs_iter"]
+    first = tool({"project_id": 1, "max_bytes": item_size * 2})
+    assert first.items == [{"key": "1/1/0"}, {"key": "1/1/1"}]
+    assert first.truncated
+    assert first.next_cursor is not None
+
+    rest = tool({"project_id": 1, "cursor": first.next_cursor, "max_bytes": item_size * 10})
+    assert rest.items == [{"key": "1/1/2"}, {"key": "1/1/3"}, {"key": "1/1/4"}]
+    assert not rest.truncated
+    assert rest.next_cursor is None
+
+
+def test_budgeted_response_reuses_item_encodings() -> None:
+    from scrapinghub_mcp.serialization import EncodedArray, default_serializer
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+        max_bytes=1024,
+    )
+
+    result = mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
+
+    items = result.json_fields()["items"]
+    assert isinstance(items, EncodedArray)
+    assert items.elements == [default_serializer.dumps(item) for item in result.items]
+    assert default_serializer.dumps(result) == default_serializer.dumps(result.model_dump())
+
+
+def test_large_item_results_spill_to_resource(tmp_path: Path) -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    spill_store = SpillStore(threshold_bytes=32, directory=tmp_path)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+        response_cache=ResponseCache(default_ttl_seconds=60),
+        spill_store=spill_store,
+    )
+
+    result = mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
+
+    assert result.items == []
+    assert result.spill is not None
+    assert result.spill.rows == 5
+    spill_id = result.spill.uri.rsplit("/", 1)[-1]
+    assert spill_store.read_lines(spill_id, 4, 1) == '{"key":"1/1/4"}\n'
+
+    mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
+    assert len(client.project_handles[1].jobs.calls) == 2
+
+
+def test_spill_resources_serve_line_ranges(tmp_path: Path) -> None:
+    mcp = FastMCP("scrapinghub-mcp")
+    spill_store = SpillStore(threshold_bytes=1, directory=tmp_path)
+    spill = spill_store.collect(iter([{"row": index} for index in range(3)]))
+    assert not isinstance(spill, list)
+    server.register_spill_resources(mcp, spill_store)
+
+    async def read() -> list[Any]:
+        async with Client(mcp) as mcp_client:
+            return await mcp_client.read_resource(f"{spill.uri}/lines/1/2")
+
+    contents = asyncio.run(read())
+
+    assert getattr(contents[0], "text", None) == '{"row":1}\n{"row":2}\n'
+
+
+def test_tool_wrapper_validates_params_once() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+    )
+    tool = mcp.tool_registry["get_job"]
+
+    trusted = server.GetJobParams.model_construct(job_key="1/2/3", max_age=None)
+    assert tool(trusted).job_key == "1/2/3"
+    with pytest.raises(RuntimeError, match="get_job"):
+        tool({"job_key": "1/2/3", "unexpected": True})
+
+
+def test_build_items_result_skips_item_revalidation() -> None:
+    result = server._build_items_result(iter([{"a": 1}, b"raw", "text"]))
+
+    assert result.model_dump(mode="json") == {
+        "items": [{"a": 1}, "raw", "text"],
+        "next_cursor": None,
+        "truncated": False,
+        "spill": None,
+    }
+
+
+def test_project_tools_share_project_handle_cache() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    project_cache = ProjectHandleCache(client.get_project)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter", "get_project"},
+        project_cache=project_cache,
+    )
+
+    mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
+    mcp.tool_registry["project_jobs_iter"]({"project_id": 1})
+    mcp.tool_registry["get_project"]({"project_id": 1})
+
+    assert client.project_requests == [1]
+    stats = project_cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_response_cache_serves_repeat_calls_and_honors_max_age() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.count"},
+        response_cache=ResponseCache(ttl_seconds={"project.jobs.count": 60}),
+    )
+
+    tool = mcp.tool_registry["project_jobs_count"]
+    assert tool({"project_id": 1, "state": "running"}).count == 5
+    assert tool({"state": "running", "project_id": 1}).count == 5
+    assert len(client.project_handles[1].jobs.calls) == 1
+
+    tool({"project_id": 1, "state": "running", "max_age": 0})
+    assert len(client.project_handles[1].jobs.calls) == 2
+
+
+def test_mutating_tool_invalidates_project_cache_entries() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    response_cache = ResponseCache(default_ttl_seconds=60)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=True,
+        non_mutating_operations={"project.jobs.count"},
+        response_cache=response_cache,
+    )
+
+    count_tool = mcp.tool_registry["project_jobs_count"]
+    count_tool({"project_id": 1})
+    count_tool({"project_id": 2})
+    assert response_cache.stats().size == 2
+
+    mcp.tool_registry["project_jobs_run"]({"project_id": 1, "spider": "spider"})
+    assert response_cache.stats().size == 1
+
+    count_tool({"project_id": 1})
+    count_tool({"project_id": 2})
+    assert len(client.project_handles[1].jobs.calls) == 3
+    assert len(client.project_handles[2].jobs.calls) == 1
+
+
+class SlowJobClient(DummyClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.job_requests: list[str] = []
+        self.release = threading.Event()
+
+    def get_job(self, job_key: str) -> DummyJob:
+        self.job_requests.append(job_key)
+        self.release.wait(timeout=5)
+        return DummyJob(job_key)
+
+
+def test_concurrent_identical_calls_share_one_upstream_request() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = SlowJobClient()
+    executor = ToolExecutor(max_workers=4)
+    single_flight = SingleFlight()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+        executor=executor,
+        single_flight=single_flight,
+    )
+
+    tool = mcp.tool_registry["get_job"]
+
+    async def fan_out() -> list[Any]:
+        calls = [asyncio.ensure_future(tool({"job_key": "1/2/3"})) for _ in range(3)]
+        while single_flight.coalesced < 2:
+            await asyncio.sleep(0.001)
+        client.release.set()
+        return list(await asyncio.gather(*calls))
+
+    try:
+        results = asyncio.run(asyncio.wait_for(fan_out(), timeout=5))
+    finally:
+        executor.shutdown()
+
+    assert client.job_requests == ["1/2/3"]
+    assert [result.job_key for result in results] == ["1/2/3"] * 3
+
+
+def test_batch_call_returns_ordered_results_with_gating() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"get_job", "project.jobs.count"},
+    )
+
+    result = mcp.tool_registry["batch_call"](
+        {
+            "calls": [
+                {"tool": "get_job", "params": {"job_key": "1/2/3"}},
+                {"tool": "project_jobs_run", "params": {"project_id": 1}},
+                {"tool": "project_jobs_count", "params": {"project_id": 1, "bogus": True}},
+                {"tool": "project_jobs_count", "params": {"project_id": 2}},
+            ]
+        }
+    )
+
+    outcomes = result.results
+    assert [outcome.tool for outcome in outcomes] == [
+        "get_job",
+        "project_jobs_run",
+        "project_jobs_count",
+        "project_jobs_count",
+    ]
+    assert [outcome.ok for outcome in outcomes] == [True, False, False, True]
+    assert outcomes[0].result == {
+        "job_key": "1/2/3",
+        "project_id": 1,
+        "metadata": {"state": "finished"},
+    }
+    assert "not available" in (outcomes[1].error or "")
+    assert outcomes[3].result == {"count": 5}
+    assert 1 not in client.project_handles
+
+
+def test_reload_allowlist_swaps_gating_and_keeps_caches() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    response_cache = ResponseCache(default_ttl_seconds=60)
+
+    reload_allowlist = server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.count"},
+        response_cache=response_cache,
+    )
+    mcp.tool_registry["project_jobs_count"]({"project_id": 1})
+    assert "get_job" not in mcp.tool_registry
+
+    assert reload_allowlist({"project.jobs.count", "get_job"}) is True
+    assert "get_job" in mcp.tool_registry
+    assert reload_allowlist({"project.jobs.count", "get_job"}) is False
+    mcp.tool_registry["project_jobs_count"]({"project_id": 1})
+    assert len(client.project_handles[1].jobs.calls) == 1
+
+    assert reload_allowlist({"get_job"}) is True
+    assert "project_jobs_count" not in mcp.tool_registry
+    result = mcp.tool_registry["batch_call"](
+        {"calls": [{"tool": "project_jobs_count", "params": {"project_id": 1}}]}
+    )
+    assert "not available" in (result.results[0].error or "")
+    assert response_cache.stats().size == 1
+
+
+def test_reload_allowlist_with_allow_mutate_only_changes_caching() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+
+    reload_allowlist = server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=True,
+        non_mutating_operations={"project.jobs.count"},
+        response_cache=ResponseCache(default_ttl_seconds=60),
+    )
+    tool = mcp.tool_registry["project_jobs_count"]
+    tool({"project_id": 1})
+    tool({"project_id": 1})
+    assert len(client.project_handles[1].jobs.calls) == 1
+
+    assert reload_allowlist(set()) is False
+    tool({"project_id": 1})
+    assert len(client.project_handles[1].jobs.calls) == 2
+
+
+def test_load_reload_config_reads_poll_seconds(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    config_path.write_text("[reload]\npoll_seconds = 2.5\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_reload_config().poll_seconds == 2.5
+
+    config_path.write_text("[reload]\npoll_seconds = 0\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="reload.poll_seconds"):
+        server._load_reload_config()
+
+
+def test_allowlist_watch_paths_include_override_and_config(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "scrapinghub-mcp.toml").write_text("", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    paths = server._allowlist_watch_paths()
+
+    assert tmp_path / server.ALLOWLIST_FILENAME in paths
+    assert tmp_path / "scrapinghub-mcp.toml" in paths
+
+
+def test_batch_call_runs_entries_on_executor() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    executor = ToolExecutor(max_workers=2)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+        executor=executor,
+    )
+
+    calls = [{"tool": "get_job", "params": {"job_key": f"1/2/{index}"}} for index in range(5)]
+    try:
+        result = asyncio.run(
+            mcp.tool_registry["batch_call"]({"calls": calls, "max_concurrency": 2})
+        )
+    finally:
+        executor.shutdown()
+
+    assert [outcome.result["job_key"] for outcome in result.results if outcome.result] == [
+        f"1/2/{index}" for index in range(5)
+    ]
+
+
+class FailingProjectClient(DummyClient):
+    def get_project(self, project_id: int) -> DummyProject:
+        if project_id == 2:
+            raise RuntimeError("project 2 unavailable")
+        return super().get_project(project_id)
+
+
+def test_fan_out_count_reports_per_project_failures() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = FailingProjectClient()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"fanout.project.jobs.count"},
+    )
+
+    result = mcp.tool_registry["projects_jobs_count"](
+        {"project_ids": [1, 2, 3], "state": "finished", "max_concurrency": 2}
+    )
+
+    assert [entry.project_id for entry in result.items] == [1, 2, 3]
+    assert [entry.ok for entry in result.items] == [True, False, True]
+    assert result.items[1].error == "project 2 unavailable"
+    assert (result.total, result.failed) == (10, 1)
+    assert client.project_handles[1].jobs.calls == [{"state": "finished"}]
+
+
+def test_fan_out_defaults_to_every_listed_project() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    client.projects = DummySummaryProjects()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"fanout.project.jobs.summary"},
+    )
+
+    result = mcp.tool_registry["projects_jobs_summary"]({})
+
+    assert result.failed == 0
+    assert [(entry.project_id, entry.result) for entry in result.items] == [
+        (1, [{"name": "finished", "count": 1}]),
+        (2, [{"name": "finished", "count": 2}]),
+    ]
+
+
+class DownProjects(DummySummaryProjects):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def list(self) -> typing.List[int]:
+        from requests import ConnectionError
+
+        self.calls += 1
+        raise ConnectionError("app host unreachable")
+
+
+def test_fan_out_project_listing_goes_through_circuit_breaker() -> None:
+    from scrapinghub_mcp.circuit import CircuitBreakers
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    client.projects = DownProjects()
+    breakers = CircuitBreakers(failure_threshold=1, reset_seconds=60)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"fanout.project.jobs.summary"},
+        circuit_breakers=breakers,
+    )
+
+    tool = mcp.tool_registry["projects_jobs_summary"]
+    with pytest.raises(RuntimeError, match="projects_jobs_summary"):
+        tool({})
+    with pytest.raises(RuntimeError, match="Upstream 'projects' is failing"):
+        tool({})
+    assert client.projects.calls == 1
+
+
+def test_load_cache_config_reads_per_method_ttls(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        config='[cache]\ndefault_ttl_seconds = 5\n[cache.ttl_seconds]\n"projects.summary" = 30\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    config = server._load_cache_config()
+
+    assert config.default_ttl_seconds == 5.0
+    assert config.ttl_seconds == {"projects.summary": 30.0}
+
+
+def test_load_cache_config_rejects_negative_ttl(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo", config='[cache.ttl_seconds]\n"projects.summary" = -1\n')
+    monkeypatch.chdir(repo_root)
+
+    try:
+        server._load_cache_config()
+    except RuntimeError as exc:
+        assert "cache.ttl_seconds.projects.summary" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for negative cache TTL.")
+
+
+def test_load_server_config_reuses_snapshot_until_file_changes(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(tmp_path, "repo", config="[execution]\nmax_workers = 2\n")
+    monkeypatch.chdir(repo_root)
+    resolve_calls: list[Path] = []
+    resolve = server._resolve_config_path
+
+    def counting_resolve() -> Path:
+        resolve_calls.append(Path.cwd())
+        return resolve()
+
+    monkeypatch.setattr(server, "_resolve_config_path", counting_resolve)
+
+    first = server.load_server_config()
+    assert server.load_server_config() is first
+    assert server._load_execution_config().max_workers == 2
+    assert len(resolve_calls) == 1
+
+    (repo_root / "scrapinghub-mcp.toml").write_text(
+        "[execution]\nmax_workers = 12\n", encoding="utf-8"
+    )
+    second = server.load_server_config()
+    assert second is not first
+    assert server._load_execution_config(second).max_workers == 12
+    assert len(resolve_calls) == 1
+
+
+def test_load_server_config_without_file(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo")
+    monkeypatch.chdir(repo_root)
+
+    config = server.load_server_config()
+
+    assert config == server.ServerConfig()
+    assert server._load_cache_config(config) == server.CacheConfig()
+
+
+def test_load_pagination_config_reads_limits(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(
+        tmp_path, "repo", config="[pagination]\ncursor_ttl_seconds = 30\nmax_cursors = 4\n"
+    )
+    monkeypatch.chdir(repo_root)
+
+    config = server._load_pagination_config()
+
+    assert config == server.PaginationConfig(cursor_ttl_seconds=30.0, max_cursors=4)
+
+
+def test_load_pagination_config_reads_max_bytes(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo", config="[pagination]\nmax_bytes = 65536\n")
+    monkeypatch.chdir(repo_root)
+
+    assert server._load_pagination_config().max_bytes == 65536
+
+
+def test_load_execution_config_defaults_without_table(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo", config="[auth]\napi_key = 'key'\n")
+    monkeypatch.chdir(repo_root)
+
+    config = server._load_execution_config()
+
+    assert config == server.ExecutionConfig(mode="async", max_workers=8)
+
+
+def test_load_execution_config_reads_pool_size(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo", config='[execution]\nmode = "sync"\nmax_workers = 3\n')
+    monkeypatch.chdir(repo_root)
+
+    config = server._load_execution_config()
+
+    assert config == server.ExecutionConfig(mode="sync", max_workers=3)
+
+
+def test_load_execution_config_rejects_invalid_pool_size(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(tmp_path, "repo", config="[execution]\nmax_workers = 0\n")
+    monkeypatch.chdir(repo_root)
+
+    try:
+        server._load_execution_config()
+    except RuntimeError as exc:
+        assert "max_workers" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for invalid max_workers.")
+
+
+def test_parse_mutations_accepts_non_mutating_list() -> None:
+    content = "non_mutating:\n  - projects.list\n  - projects.summary\n"
+    operations = server._parse_allowlist(content)
+
+    assert operations == {"projects.list", "projects.summary"}
+
+
+def test_parse_mutations_allows_empty_non_mutating_list() -> None:
+    content = "non_mutating: []\n"
+    operations = server._parse_allowlist(content)
+
+    assert operations == set()
+
+
+def test_parse_mutations_rejects_missing_non_mutating_list() -> None:
+    content = "other: []\n"
+    try:
+        server._parse_allowlist(content)
+    except RuntimeError as exc:
+        assert "is invalid" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for missing non_mutating list.")
+
+
+def test_parse_mutations_rejects_extra_keys() -> None:
+    content = "non_mutating: []\nextra: []\n"
+    try:
+        server._parse_allowlist(content)
+    except RuntimeError as exc:
+        assert "is invalid" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for extra allowlist keys.")
+
+
+def test_parse_mutations_rejects_missing_list() -> None:
+    content = "not_mutations: []\n"
+    try:
+        server._parse_allowlist(content)
+    except RuntimeError as exc:
+        assert "is invalid" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for missing non_mutating list.")
+
+
+def test_parse_mutations_rejects_non_string_items() -> None:
+    content = "non_mutating:\n  - projects.list\n  - 123\n"
+    try:
+        server._parse_allowlist(content)
+    except RuntimeError as exc:
+        assert "is invalid" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for non-string allowlist entries.")
+
+
+def test_parse_mutations_rejects_invalid_yaml() -> None:
+    content = "non_mutating: [\n"
+    try:
+        server._parse_allowlist(content)
+    except RuntimeError as exc:
+        assert "Failed to parse" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for invalid YAML.")
+
+
+def test_load_non_mutating_operations_uses_repo_override(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+    )
+    monkeypatch.chdir(repo_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list"}
+
+
+def test_load_non_mutating_operations_merges_config_allowlist(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list", "projects.summary"}
+
+
+def test_load_non_mutating_operations_rejects_invalid_config(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nextra_non_mutating = "projects.summary"\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    try:
+        server.load_non_mutating_operations()
+    except RuntimeError as exc:
+        assert "extra_non_mutating" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for invalid safety config.")
+
+
+def test_load_non_mutating_operations_rejects_invalid_blocklist(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nblock_non_mutating = "projects.summary"\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    try:
+        server.load_non_mutating_operations()
+    except RuntimeError as exc:
+        assert "block_non_mutating" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for invalid blocklist config.")
+
+
+def test_load_non_mutating_operations_rejects_invalid_safety_table(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='safety = "oops"\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    try:
+        server.load_non_mutating_operations()
+    except RuntimeError as exc:
+        assert "safety section" in str(exc)
+    else:
+        raise AssertionError("Expected RuntimeError for invalid safety table.")
+
+
+def test_load_non_mutating_operations_blocks_entries(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n  - projects.summary\n",
+        config='[safety]\nblock_non_mutating = ["projects.summary"]\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list"}
+
+
+def test_load_non_mutating_operations_blocks_overrides(tmp_path: Path, monkeypatch: Any) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nextra_non_mutating = ["projects.summary"]\n'
+        'block_non_mutating = ["projects.summary"]\n',
+    )
+    monkeypatch.chdir(repo_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list"}
+
+
+def test_load_non_mutating_operations_from_cwd_config(tmp_path: Path, monkeypatch: Any) -> None:
+    cwd_root = make_repo(
+        tmp_path,
+        "cwd",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
+    )
+    monkeypatch.chdir(cwd_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list", "projects.summary"}
+
+
+def test_load_non_mutating_operations_from_cwd_blocklist(tmp_path: Path, monkeypatch: Any) -> None:
+    cwd_root = make_repo(
+        tmp_path,
+        "cwd",
+        allowlist="non_mutating:\n  - projects.list\n  - projects.summary\n",
+        config='[safety]\nblock_non_mutating = ["projects.summary"]\n',
+    )
+    monkeypatch.chdir(cwd_root)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list"}
+
+
+def test_load_non_mutating_operations_from_package_root(tmp_path: Path, monkeypatch: Any) -> None:
+    pkg_root = make_repo(
+        tmp_path,
+        "pkg",
+        allowlist="non_mutating:\n  - projects.list\n",
+        config='[safety]\nextra_non_mutating = ["projects.summary"]\n',
+        add_pyproject=True,
+    )
+    nested = pkg_root / "subdir"
+    nested.mkdir()
+    monkeypatch.chdir(nested)
+
+    operations = server.load_non_mutating_operations()
+
+    assert operations == {"projects.list", "projects.summary"}
+
+
+def test_load_non_mutating_operations_without_repo_root(tmp_path: Path, monkeypatch: Any) -> None:
     no_git_root = tmp_path / "nogit"
     no_git_root.mkdir()
     monkeypatch.chdir(no_git_root)
@@ -481,6 +1406,31 @@ def test_load_non_mutating_operations_uses_package_resource(monkeypatch: Any) ->
     assert operations == load_packaged_allowlist()
 
 
+def test_packaged_allowlist_skips_parse_when_compiled_matches(monkeypatch: Any) -> None:
+    def fail_parse(content: str) -> set[str]:
+        raise AssertionError("Packaged allowlist should come from the compiled module.")
+
+    monkeypatch.setattr(server, "_parse_allowlist", fail_parse)
+    monkeypatch.setattr(server, "_load_safety_config", lambda config=None: (set(), set(), None))
+
+    assert server.load_non_mutating_operations() == set(_allowlist_compiled.NON_MUTATING)
+
+
+def test_stale_compiled_allowlist_falls_back_to_parse(monkeypatch: Any) -> None:
+    monkeypatch.setattr(_allowlist_compiled, "SOURCE_SHA256", "stale")
+    monkeypatch.setattr(server, "_load_safety_config", lambda config=None: (set(), set(), None))
+
+    assert server.load_non_mutating_operations() == load_packaged_allowlist()
+
+
+def test_compiled_allowlist_is_up_to_date() -> None:
+    content = resources.files("scrapinghub_mcp").joinpath(server.ALLOWLIST_FILENAME)
+    rendered = compile_allowlist.render_compiled_allowlist(content.read_text(encoding="utf-8"))
+
+    assert rendered == compile_allowlist.COMPILED_MODULE.read_text(encoding="utf-8")
+    assert compile_allowlist.main(["--check"]) == 0
+
+
 def test_load_non_mutating_operations_missing_file(monkeypatch: Any) -> None:
     monkeypatch.setattr(server, "ALLOWLIST_FILENAME", "missing-allowlist.yaml")
     try:
@@ -499,3 +1449,662 @@ def test_packaged_allowlist_exists() -> None:
 def test_packaged_schema_exists() -> None:
     resource = resources.files("scrapinghub_mcp").joinpath(server.ALLOWLIST_SCHEMA_FILENAME)
     assert resource.is_file()
+
+
+def test_load_warmup_config_requires_boolean(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_warmup_config().enabled is False
+    config_path.write_text("[warmup]\nenabled = true\n", encoding="utf-8")
+    assert server._load_warmup_config().enabled is True
+    config_path.write_text('[warmup]\nenabled = "yes"\n', encoding="utf-8")
+    with pytest.raises(RuntimeError, match="warmup.enabled"):
+        server._load_warmup_config()
+
+
+def test_load_http_config_reads_pool_and_timeouts(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_http_config() == server.HttpConfig()
+    assert server.HttpConfig().timeout is None
+    assert (server.HttpConfig().pool_size, server.HttpConfig().stats_every) == (
+        http_pool.DEFAULT_POOL_SIZE,
+        http_pool.DEFAULT_STATS_EVERY,
+    )
+    assert (
+        server.HttpConfig().max_connections_per_host == http_pool.DEFAULT_MAX_CONNECTIONS_PER_HOST
+    )
+    config_path.write_text(
+        "[http]\npool_size = 4\nmax_connections_per_host = 16\nkeep_alive = false\n"
+        "read_timeout = 30\n",
+        encoding="utf-8",
+    )
+    http = server._load_http_config()
+    assert (http.pool_size, http.max_connections_per_host, http.keep_alive) == (4, 16, False)
+    assert http.timeout == (server.DEFAULT_HTTP_TIMEOUT_SECONDS, 30.0)
+
+    config_path.write_text("[http]\nconnect_timeout = -1\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="http.connect_timeout"):
+        server._load_http_config()
+
+
+def test_configure_client_http_covers_app_and_storage_sessions() -> None:
+    from scrapinghub import ScrapinghubClient
+
+    from scrapinghub_mcp.http_pool import PooledAdapter
+
+    client: Any = ScrapinghubClient("test-key")
+    server.configure_client_http(client, server.HttpConfig(max_connections_per_host=12))
+
+    for session in (client._connection._session, client._hsclient.session):
+        adapter = session.get_adapter("https://example.com/")
+        assert isinstance(adapter, PooledAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 12
+
+
+def test_create_client_disables_storage_retries() -> None:
+    client = server.create_client("test-key", server.HttpConfig())
+
+    assert client._hsclient.retrier._stop_max_attempt_number == 1
+
+
+def test_server_stats_reports_http_pools() -> None:
+    from scrapinghub import ScrapinghubClient
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    adapters = server.configure_client_http(ScrapinghubClient("test-key"), server.HttpConfig())
+
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations=set(),
+        http_pools=adapters,
+    )
+    for adapter in adapters:
+        adapter.poolmanager.connection_from_url(f"https://{adapter.name}.example.com/")
+    pools = mcp.tool_registry["server_stats"]().http_pools
+
+    assert [(pool.session, pool.host) for pool in pools] == [
+        ("app", "https://app.example.com:443"),
+        ("storage", "https://storage.example.com:443"),
+    ]
+    assert all((pool.requests, pool.new_connections, pool.hits) == (0, 0, 0) for pool in pools)
+
+
+class FlakyProjectJobs(DummyProjectJobs):
+    def __init__(self, project_id: int, failures: int) -> None:
+        super().__init__(project_id)
+        self.failures = failures
+
+    def fail_once(self) -> None:
+        if self.failures:
+            self.failures -= 1
+            response = Response()
+            response.status_code = 503
+            raise HTTPError(response=response)
+
+    def count(self, **kwargs: Any) -> int:
+        self.fail_once()
+        return super().count(**kwargs)
+
+    def run(self, **kwargs: Any) -> DummyJob:
+        self.fail_once()
+        return super().run(**kwargs)
+
+
+class FlakyClient(DummyClient):
+    def get_project(self, project_id: int) -> DummyProject:
+        project = super().get_project(project_id)
+        if not isinstance(project.jobs, FlakyProjectJobs):
+            project.jobs = FlakyProjectJobs(project_id, failures=1)
+        return project
+
+
+def test_retrier_retries_non_mutating_tools_only() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = FlakyClient()
+    retrier = server.Retrier(server.RetryPolicy(base_delay_seconds=0.001))
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=True,
+        non_mutating_operations={"project.jobs.count"},
+        retrier=retrier,
+    )
+
+    assert mcp.tool_registry["project_jobs_count"]({"project_id": 1}).count == 5
+    with pytest.raises(RuntimeError, match="project_jobs_run"):
+        mcp.tool_registry["project_jobs_run"]({"project_id": 2, "spider": "s"})
+    assert client.project_handles[2].jobs.calls == []
+
+
+def test_retrier_retries_mutating_tools_when_configured() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = FlakyClient()
+    policy = server.RetryPolicy(
+        base_delay_seconds=0.001, mutating_methods=frozenset({"project.jobs.run"})
+    )
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=True,
+        non_mutating_operations=set(),
+        retrier=server.Retrier(policy),
+    )
+
+    result = mcp.tool_registry["project_jobs_run"]({"project_id": 2, "spider": "s"})
+    assert result.job_key == "2/1/9"
+
+
+def test_load_retry_config_reads_policy(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_retry_config() == server.RetryPolicy()
+    config_path.write_text(
+        "[retry]\nmax_attempts = 5\nmax_elapsed_seconds = 12\n"
+        'mutating_methods = ["project.jobs.run"]\n',
+        encoding="utf-8",
+    )
+    policy = server._load_retry_config()
+    assert (policy.max_attempts, policy.max_elapsed_seconds) == (5, 12.0)
+    assert policy.mutating_methods == frozenset({"project.jobs.run"})
+
+    config_path.write_text("[retry]\nmutating_methods = [1]\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="retry.mutating_methods"):
+        server._load_retry_config()
+
+
+def test_endpoint_family_groups_method_prefixes() -> None:
+    assert server._endpoint_family("project.jobs.iter") == "project.jobs"
+    assert server._endpoint_family("fanout.project.jobs.count") == "project.jobs"
+    assert server._endpoint_family("project.collections.get_store") == "project.collections"
+    assert server._endpoint_family("job.items.iter") == "job.items"
+    assert server._endpoint_family("projects.list") == "projects"
+    assert server._endpoint_family("get_job") == "project.jobs"
+
+
+def test_rate_limiter_gates_tools_and_fan_out_per_project() -> None:
+    from scrapinghub_mcp.ratelimit import BucketLimit, RateLimiter
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DummyClient()
+    limiter = RateLimiter(
+        family_limits={"project.jobs": BucketLimit(rate=0.001, burst=3)}, max_wait_seconds=0
+    )
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.count", "fanout.project.jobs.count", "get_project"},
+        rate_limiter=limiter,
+    )
+
+    assert mcp.tool_registry["project_jobs_count"]({"project_id": 1}).count == 5
+    result = mcp.tool_registry["projects_jobs_count"]({"project_ids": [1, 2, 3]})
+    assert [entry.ok for entry in result.items] == [True, True, False]
+    assert "Rate limit" in (result.items[2].error or "")
+    with pytest.raises(RuntimeError, match="Rate limit for 'project.jobs'"):
+        mcp.tool_registry["project_jobs_count"]({"project_id": 1})
+    mcp.tool_registry["get_project"]({"project_id": 1})
+
+
+def test_server_stats_reports_rate_limit_buckets() -> None:
+    from scrapinghub_mcp.ratelimit import BucketLimit, RateLimiter
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    limiter = RateLimiter(
+        global_limit=BucketLimit(rate=0.001, burst=5),
+        family_limits={"project.jobs": BucketLimit(rate=0.001, burst=3)},
+    )
+
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.count"},
+        rate_limiter=limiter,
+    )
+
+    mcp.tool_registry["project_jobs_count"]({"project_id": 1})
+    buckets = {bucket.name: bucket for bucket in mcp.tool_registry["server_stats"]().rate_limits}
+
+    assert buckets["project.jobs"].burst == 3
+    assert round(buckets["project.jobs"].tokens) == 2
+    assert round(buckets["global"].tokens) == 4
+    assert all(bucket.waits == 0 and bucket.queued == 0 for bucket in buckets.values())
+
+
+def test_load_rate_limiter_validates_families(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_rate_limiter() is None
+    config_path.write_text(
+        '[rate_limit]\nrate = 5\nburst = 10\n[rate_limit.families."project.jobs"]\nrate = 2\n',
+        encoding="utf-8",
+    )
+    limiter = server._load_rate_limiter()
+    assert limiter is not None
+    assert [(bucket.name, bucket.burst) for bucket in limiter.stats()] == [
+        ("global", 10),
+        ("project.jobs", 2),
+    ]
+
+    config_path.write_text('[rate_limit.families."project.jbos"]\nrate = 2\n', encoding="utf-8")
+    with pytest.raises(RuntimeError, match="not a known endpoint family"):
+        server._load_rate_limiter()
+    config_path.write_text('[rate_limit.families."project.jobs"]\nburst = 2\n', encoding="utf-8")
+    with pytest.raises(RuntimeError, match="rate is required"):
+        server._load_rate_limiter()
+
+
+class DegradedCollections:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def list(self) -> list[dict[str, Any]]:
+        self.calls += 1
+        response = Response()
+        response.status_code = 503
+        raise HTTPError(response=response)
+
+
+class DegradedStorageClient(DummyClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.collections = DegradedCollections()
+
+    def get_project(self, project_id: int) -> DummyProject:
+        project = super().get_project(project_id)
+        project.collections = self.collections  # type: ignore[attr-defined]
+        return project
+
+
+def test_circuit_breaker_fails_fast_for_degraded_family_only() -> None:
+    from scrapinghub_mcp.circuit import CircuitBreakers
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = DegradedStorageClient()
+    breakers = CircuitBreakers(failure_threshold=2, reset_seconds=60)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"project.collections.list", "project.jobs.count"},
+        circuit_breakers=breakers,
+    )
+
+    collections_tool = mcp.tool_registry["project_collections_list"]
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="project_collections_list"):
+            collections_tool({"project_id": 1})
+    with pytest.raises(RuntimeError, match="Upstream 'project.collections' is failing"):
+        collections_tool({"project_id": 1})
+    assert client.collections.calls == 2
+
+    assert mcp.tool_registry["project_jobs_count"]({"project_id": 1}).count == 5
+    states = {stats.name: stats.state for stats in breakers.stats()}
+    assert states == {"project.collections": "open", "project.jobs": "closed"}
+    circuits = {stats.name: stats for stats in mcp.tool_registry["server_stats"]().circuits}
+    assert circuits["project.collections"].state == "open"
+    assert (circuits["project.collections"].opened, circuits["project.collections"].rejected) == (
+        1,
+        1,
+    )
+
+
+def test_load_circuit_breakers_defaults_on_and_can_be_disabled(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_circuit_breakers() is not None
+    config_path.write_text("[circuit_breaker]\nenabled = false\n", encoding="utf-8")
+    assert server._load_circuit_breakers() is None
+    config_path.write_text("[circuit_breaker]\nfailure_threshold = 0\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="circuit_breaker.failure_threshold"):
+        server._load_circuit_breakers()
+
+
+class EndlessJobItems(DummyJobItems):
+    def __init__(self) -> None:
+        super().__init__(0)
+        self.started = threading.Event()
+        self.closed = threading.Event()
+
+    def iter(self, **kwargs: Any) -> typing.Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        try:
+            while True:
+                self.started.set()
+                self.pulled += 1
+                time.sleep(0.005)
+                yield {"name": f"item-{self.pulled}"}
+        finally:
+            self.closed.set()
+
+
+def test_deadline_ms_stops_upstream_iterator() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    client.job.items = EndlessJobItems()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
+    )
+
+    with pytest.raises(RuntimeError, match="deadline of 50 ms"):
+        mcp.tool_registry["job_items_iter"]({"job_key": "1/2/3", "deadline_ms": 50})
+
+    assert client.job.items.closed.is_set()
+    assert client.job.items.calls == [{}]
+
+
+def test_cancelled_call_frees_worker_and_closes_iterator() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    client.job.items = EndlessJobItems()
+    executor = ToolExecutor(max_workers=1)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
+        executor=executor,
+    )
+
+    async def cancel_midway() -> None:
+        call = asyncio.ensure_future(mcp.tool_registry["job_items_iter"]({"job_key": "1/2/3"}))
+        while not client.job.items.started.is_set():
+            await asyncio.sleep(0.001)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+    try:
+        asyncio.run(asyncio.wait_for(cancel_midway(), timeout=5))
+        assert client.job.items.closed.wait(timeout=5)
+        deadline = time.monotonic() + 5
+        while executor.stats().in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert executor.stats().in_flight == 0
+    finally:
+        executor.shutdown()
+
+
+def test_load_deadline_config_reads_defaults_and_overrides(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_deadline_config().for_tool("get_job") is None
+    config_path.write_text(
+        "[deadlines]\ndefault_ms = 30000\n\n[deadlines.tools]\njob_items_iter = 120000\n",
+        encoding="utf-8",
+    )
+    deadlines = server._load_deadline_config()
+    assert deadlines.for_tool("get_job") == 30000
+    assert deadlines.for_tool("job_items_iter") == 120000
+    config_path.write_text("[deadlines.tools]\nno_such_tool = 10\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="no_such_tool is not a known tool"):
+        server._load_deadline_config()
+
+
+def test_server_stats_reports_per_tool_metrics() -> None:
+    from scrapinghub_mcp.metrics import MetricsRegistry
+
+    mcp = DummyMCP("scrapinghub-mcp")
+    client = ItemsJobClient()
+    metrics = MetricsRegistry()
+
+    server.register_scrapinghub_tools(
+        mcp,
+        client,
+        allow_mutate=False,
+        non_mutating_operations={"job.items.iter"},
+        metrics=metrics,
+    )
+
+    tool = mcp.tool_registry["job_items_iter"]
+    assert len(tool({"job_key": "1/2/3"}).items) == 10
+    tool({"job_key": "1/2/3"})
+    with pytest.raises(RuntimeError):
+        tool({"job_key": "1/2/3", "unknown": True})
+
+    stats = mcp.tool_registry["server_stats"]()
+
+    [entry] = [entry for entry in stats.tools if entry.tool == "job_items_iter"]
+    assert (entry.calls, entry.errors, entry.items) == (3, 1, 20)
+    assert entry.latency["validation"].count == 2
+    assert entry.latency["upstream"].count == 2
+    assert entry.latency["build"].count == 2
+    assert "serialize" not in entry.latency
+    assert stats.uptime_seconds >= 0
+    assert stats.executor is None
+    assert stats.caches["responses"].misses == 0
+    assert stats.caches["project_handles"].size == 0
+
+
+def test_server_stats_reports_cache_hits_and_misses() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.count"},
+        response_cache=ResponseCache(ttl_seconds={"project.jobs.count": 60}),
+    )
+
+    for _ in range(2):
+        mcp.tool_registry["project_jobs_count"]({"project_id": 1})
+    caches = mcp.tool_registry["server_stats"]().caches
+
+    assert (caches["responses"].hits, caches["responses"].misses) == (1, 1)
+    assert (caches["project_handles"].misses, caches["project_handles"].size) == (1, 1)
+
+
+def test_server_stats_reports_executor_queue() -> None:
+    mcp = DummyMCP("scrapinghub-mcp")
+    executor = ToolExecutor(max_workers=2)
+
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+        executor=executor,
+    )
+
+    try:
+        asyncio.run(mcp.tool_registry["get_job"]({"job_key": "1/2/3"}))
+        stats = mcp.tool_registry["server_stats"]()
+    finally:
+        executor.shutdown()
+
+    assert stats.executor is not None
+    assert (stats.executor.max_workers, stats.executor.in_flight, stats.executor.queued) == (
+        2,
+        0,
+        0,
+    )
+    assert stats.model_dump()["executor"] == {"max_workers": 2, "in_flight": 0, "queued": 0}
+
+
+def test_metered_serializer_records_response_bytes_per_tool() -> None:
+    from fastmcp import Client
+
+    from scrapinghub_mcp.metrics import (
+        MetricsRegistry,
+        metered_serializer,
+        serializer_middleware,
+    )
+    from scrapinghub_mcp.serialization import default_serializer
+
+    metrics = MetricsRegistry()
+    mcp = FastMCP(
+        "scrapinghub-mcp", tool_serializer=metered_serializer(metrics, default_serializer.dumps)
+    )
+    mcp.add_middleware(serializer_middleware())
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"get_job"},
+        metrics=metrics,
+    )
+
+    async def call() -> str:
+        async with Client(mcp) as client:
+            result = await client.call_tool("get_job", {"params": {"job_key": "1/2/3"}})
+            return result.content[0].text
+
+    text = asyncio.run(call())
+
+    [stats] = [stats for stats in metrics.snapshot() if stats.tool == "get_job"]
+    assert stats.bytes == len(text.encode("utf-8"))
+    assert stats.latency["serialize"].count == 1
+
+
+def test_load_metrics_config_resolves_textfile(tmp_path: Path, monkeypatch: Any) -> None:
+    config_path = tmp_path / "scrapinghub-mcp.toml"
+    monkeypatch.chdir(tmp_path)
+
+    assert server._load_metrics_config().textfile is None
+    config_path.write_text(
+        '[metrics]\ntextfile = "metrics/scrapinghub_mcp.prom"\ntextfile_interval_seconds = 5\n',
+        encoding="utf-8",
+    )
+    metrics = server._load_metrics_config()
+    assert metrics.textfile == (tmp_path / "metrics" / "scrapinghub_mcp.prom").resolve()
+    assert metrics.textfile_interval_seconds == 5.0
+    config_path.write_text('[metrics]\ntextfile = ""\n', encoding="utf-8")
+    with pytest.raises(RuntimeError, match="metrics.textfile"):
+        server._load_metrics_config()
+
+
+def test_build_server_warns_when_max_bytes_disables_spilling(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    repo_root = make_repo(
+        tmp_path,
+        "repo",
+        config="[pagination]\nmax_bytes = 4096\n[spill]\nthreshold_bytes = 1024\n",
+    )
+    monkeypatch.chdir(repo_root)
+    monkeypatch.setattr(server, "resolve_api_key", lambda config=None: "test-key")
+
+    with structlog.testing.capture_logs() as logs:
+        server.build_server(mcp_cls=DummyMCP)
+
+    assert "spill.disabled_by_max_bytes" in [log["event"] for log in logs]
+
+
+def test_build_server_warns_when_deadlines_run_in_sync_mode(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(server, "resolve_api_key", lambda config=None: "test-key")
+    events = {}
+    for name, config in {
+        "sync": '[execution]\nmode = "sync"\n[deadlines]\ndefault_ms = 1000\n',
+        "sync_per_tool": '[execution]\nmode = "sync"\n[deadlines.tools]\nget_job = 500\n',
+        "async": "[deadlines]\ndefault_ms = 1000\n",
+        "sync_without_deadlines": '[execution]\nmode = "sync"\n',
+    }.items():
+        monkeypatch.chdir(make_repo(tmp_path, name, config=config))
+        with structlog.testing.capture_logs() as logs:
+            server.build_server(mcp_cls=DummyMCP)
+        events[name] = "deadlines.sync_mode" in [log["event"] for log in logs]
+
+    assert events == {
+        "sync": True,
+        "sync_per_tool": True,
+        "async": False,
+        "sync_without_deadlines": False,
+    }
+
+
+def test_fastmcp_responses_are_encoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    import fastmcp.tools.tool
+
+    from scrapinghub_mcp.serialization import default_serializer
+
+    mcp = FastMCP("scrapinghub-mcp")
+    server.register_scrapinghub_tools(
+        mcp,
+        DummyClient(),
+        allow_mutate=False,
+        non_mutating_operations={"project.jobs.iter"},
+        response_serializer=default_serializer.dumps_text,
+    )
+    converted: list[Any] = []
+
+    def to_jsonable_python(value: Any, **kwargs: Any) -> Any:
+        converted.append(value)
+        return pydantic_core.to_jsonable_python(value, **kwargs)
+
+    monkeypatch.setattr(
+        fastmcp.tools.tool,
+        "pydantic_core",
+        SimpleNamespace(
+            to_jsonable_python=to_jsonable_python,
+            PydanticSerializationError=pydantic_core.PydanticSerializationError,
+        ),
+    )
+
+    async def call() -> Any:
+        async with Client(mcp) as client:
+            return await client.call_tool("project_jobs_iter", {"params": {"project_id": 1}})
+
+    result = asyncio.run(call())
+
+    assert converted == []
+    assert result.structured_content["items"][0] == {"key": "1/1/0"}
+    assert result.content[0].text == default_serializer.dumps_text(result.structured_content)
+
+
+def test_fan_out_calls_share_one_bounded_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server, "MAX_FANOUT_CONCURRENCY", 3)
+    monkeypatch.setattr(server, "_FANOUT_POOL", None)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def query(index: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return index
+
+    results: list[list[int]] = []
+
+    def fan_out() -> None:
+        results.append(server._run_fan_out([partial(query, index) for index in range(6)], 2))
+
+    threads = [threading.Thread(target=fan_out) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [list(range(6))] * 4
+    assert 2 <= peak <= 3
+    server._fan_out_pool().shutdown()
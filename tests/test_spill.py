@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scrapinghub_mcp.spill import INDEX_STRIDE, SpillError, SpillFile, SpillStore
+
+
+def test_spill_store_keeps_small_results_in_memory(tmp_path: Path) -> None:
+    store = SpillStore(threshold_bytes=1024, directory=tmp_path)
+
+    result = store.collect(iter([{"a": 1}, {"a": 2}]))
+
+    assert result == [{"a": 1}, {"a": 2}]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_store_reads_line_ranges_through_index(tmp_path: Path) -> None:
+    store = SpillStore(threshold_bytes=64, directory=tmp_path)
+    rows = INDEX_STRIDE * 2 + 10
+
+    spill = store.collect({"row": index} for index in range(rows))
+
+    assert isinstance(spill, SpillFile)
+    assert spill.rows == rows
+    assert spill.size == spill.path.stat().st_size
+    assert len(spill.offsets) == 3
+    lines = store.read_lines(spill.spill_id, INDEX_STRIDE + 5, 3).splitlines()
+    assert [json.loads(line)["row"] for line in lines] == [
+        INDEX_STRIDE + 5,
+        INDEX_STRIDE + 6,
+        INDEX_STRIDE + 7,
+    ]
+    assert store.read_lines(spill.spill_id, rows - 1, 5) == '{"row":%d}\n' % (rows - 1)
+    assert store.read_lines(spill.spill_id, rows, 5) == ""
+
+
+def test_spill_store_reads_byte_ranges(tmp_path: Path) -> None:
+    store = SpillStore(threshold_bytes=8, directory=tmp_path)
+    spill = store.collect(iter(["alpha", "beta", "gamma"]))
+    assert isinstance(spill, SpillFile)
+
+    assert store.read_bytes(spill.spill_id, 0, 8) == b'"alpha"\n'
+    assert store.read_bytes(spill.spill_id, 8, 100) == b'"beta"\n"gamma"\n'
+    with pytest.raises(SpillError):
+        store.read_bytes(spill.spill_id, 0, 0)
+
+
+def test_spill_store_evicts_oldest_files(tmp_path: Path) -> None:
+    store = SpillStore(threshold_bytes=1, directory=tmp_path, max_files=1)
+
+    first = store.collect(iter(["a", "b"]))
+    second = store.collect(iter(["c", "d"]))
+
+    assert isinstance(first, SpillFile) and isinstance(second, SpillFile)
+    assert not first.path.exists()
+    assert second.path.exists()
+    with pytest.raises(SpillError):
+        store.read_lines(first.spill_id, 0, 1)
+
+
+def test_spill_store_close_removes_files_and_owned_directory(tmp_path: Path) -> None:
+    configured = SpillStore(threshold_bytes=1, directory=tmp_path)
+    kept = configured.collect(iter(["a", "b"]))
+    temporary = SpillStore(threshold_bytes=1)
+    spill = temporary.collect(iter(["a", "b"]))
+    assert isinstance(kept, SpillFile) and isinstance(spill, SpillFile)
+
+    configured.close()
+    temporary.close()
+
+    assert not kept.path.exists()
+    assert tmp_path.is_dir()
+    assert not spill.path.parent.exists()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Any
+
+from requests import HTTPError, Response
+from scrapinghub.client.exceptions import Unauthorized
+from scrapinghub.legacy import APIError
+
+from scrapinghub_mcp import warmup
+
+
+def http_error(status_code: int) -> HTTPError:
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(response=response)
+
+
+class WarmupProjects:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+
+    def list(self) -> list[int]:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return [1]
+
+
+class WarmupStorage:
+    endpoint = "https://storage.example/"
+    connection_timeout = (3.0, 30.0)
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+        self.requests: list[dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> Response:
+        self.calls += 1
+        self.requests.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return Response()
+
+
+class WarmupClient:
+    def __init__(
+        self, app_error: Exception | None = None, storage_error: Exception | None = None
+    ) -> None:
+        self.projects = WarmupProjects(app_error)
+        self._hsclient = WarmupStorage(storage_error)
+
+
+def test_warm_up_touches_app_and_storage_hosts() -> None:
+    client = WarmupClient()
+
+    assert warmup.warm_up(client) == {"app": "ok", "storage": "ok"}
+    assert (client.projects.calls, client._hsclient.calls) == (1, 1)
+    assert client._hsclient.requests == [
+        {"method": "GET", "url": "https://storage.example/system/ts", "timeout": (3.0, 30.0)}
+    ]
+
+
+def test_warm_up_reports_auth_failures() -> None:
+    wrapped: Any = Unauthorized(http_error=http_error(401))
+    for error in (APIError("Authentication failed", _type=APIError.ERR_AUTH_ERROR), wrapped):
+        client = WarmupClient(app_error=error)
+        assert warmup.warm_up(client) == {"app": "auth_failed", "storage": "ok"}
+
+    client = WarmupClient(app_error=http_error(403), storage_error=ConnectionError("down"))
+    assert warmup.warm_up(client) == {"app": "auth_failed", "storage": "failed"}
+
+
+def test_start_warmup_runs_in_background() -> None:
+    client = WarmupClient()
+
+    thread = warmup.start_warmup(client)
+    thread.join(timeout=5)
+
+    assert thread.daemon
+    assert client.projects.calls == 1
+
+
+def test_warm_up_lists_projects_through_upstream_guard() -> None:
+    client = WarmupClient()
+    guarded: list[str] = []
+
+    def call_upstream(method_name: str, func: Any) -> Any:
+        guarded.append(method_name)
+        return func()
+
+    assert warmup.warm_up(client, call_upstream) == {"app": "ok", "storage": "ok"}
+    assert guarded == ["projects.list"]
+    assert client.projects.calls == 1